@@ -3,17 +3,14 @@ import logging
 import os
 from typing import Dict, List, Optional, Set, Tuple
 
-from dotenv import load_dotenv
-from google import genai
 from google.genai import types
 
 from ai_content_engine.models import ArticleSummaryResponse
 from ai_content_engine.prompts import ai101_explainer_prompt
+from ai_content_engine.utils.llm_client import generate_content
 
 
 logger = logging.getLogger(__name__)
-load_dotenv()
-client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
 
 
 def _get_terms_file_path() -> str:
@@ -96,7 +93,7 @@ def generate_ai101_explainer(term: str) -> ArticleSummaryResponse:
     """
     prompt_text = f"Term: {term}\n\nWrite an AI 101 explainer."
     logger.info(f"AI101 generation: generating explainer for '{term}'")
-    response = client.models.generate_content(
+    response = generate_content(
         model="gemini-2.0-flash",
         contents=[prompt_text],
         config=types.GenerateContentConfig(
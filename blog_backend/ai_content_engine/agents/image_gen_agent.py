@@ -1,20 +1,27 @@
 import base64
 import logging
-import os
 import asyncio
 from typing import Optional, List
-from google import genai
 from google.genai import types
 from ai_content_engine.models import ProcessedArticle
 from ai_content_engine.prompts import image_gen_prompt
+from ai_content_engine.utils.llm_client import (
+    generate_content,
+    generate_content_async,
+)
+from ai_content_engine.utils.rate_limiter import llm_rate_limiter
 
 
 logger = logging.getLogger(__name__)
-client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
 
 # Fallback prompt constant
 FALLBACK_IMAGE_PROMPT = "A generic AI related image with a cartoon style"
 
+IMAGE_MODEL = "gemini-2.0-flash-preview-image-generation"
+IMAGE_BATCH_SIZE = 6
+# Pause between batches when IMAGE_MODEL has no LLM_RATE_LIMITS entry to pace it
+IMAGE_BATCH_PAUSE_SECONDS = 60
+
 
 async def _generate_single_image_async(prompt: str) -> Optional[str]:
     """Helper function to generate a single image asynchronously."""
@@ -22,10 +29,12 @@ async def _generate_single_image_async(prompt: str) -> Optional[str]:
         # Automatically append aspect ratio specification
         enhanced_prompt = f"{prompt}, aspect ratio: 16:9 landscape"
 
-        response = await client.aio.models.generate_content(
-            model="gemini-2.0-flash-preview-image-generation",
+        response = await generate_content_async(
+            model=IMAGE_MODEL,
             contents=enhanced_prompt,
             config=types.GenerateContentConfig(response_modalities=["TEXT", "IMAGE"]),
+            # Images are large and a rerun should get a fresh one
+            cache=False,
         )
 
         if not response.candidates:
@@ -99,10 +108,12 @@ def generate_image_from_prompt(image_prompt: str) -> Optional[str]:
         # Automatically append aspect ratio specification
         enhanced_prompt = f"{image_prompt}, aspect ratio: 16:9 landscape"
 
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-preview-image-generation",
+        response = generate_content(
+            model=IMAGE_MODEL,
             contents=enhanced_prompt,
             config=types.GenerateContentConfig(response_modalities=["TEXT", "IMAGE"]),
+            # Images are large and a rerun should get a fresh one
+            cache=False,
         )
 
         # Check if response has candidates
@@ -152,7 +163,7 @@ def generate_image_prompt(headline_article: ProcessedArticle) -> Optional[str]:
         article_text += f"RexTake: {headline_article.rex_take}\n"
 
     try:
-        response = client.models.generate_content(
+        response = generate_content(
             model="gemini-2.5-flash",
             contents=[article_text],
             config=types.GenerateContentConfig(
@@ -200,7 +211,7 @@ async def generate_image_prompts_batch(
     )
 
     try:
-        response = await client.aio.models.generate_content(
+        response = await generate_content_async(
             model="gemini-2.5-flash",
             contents=[batch_content],
             config=types.GenerateContentConfig(
@@ -256,12 +267,37 @@ async def generate_images_from_prompts_batch(
     return results
 
 
+async def _generate_featured_images_batch(
+    batch: List[ProcessedArticle], batch_num: int, total_batches: int
+) -> List[Optional[str]]:
+    """Generates prompts (where missing) and then images for one batch of up to 6 articles."""
+    logger.info(
+        f"Processing batch {batch_num}/{total_batches} ({len(batch)} articles)"
+    )
+
+    # Generate prompts for this batch, except where headline generation
+    # already wrote one (NEWS_COMBINED_IMAGE_PROMPT)
+    missing = [article for article in batch if not article.image_prompt]
+    if len(missing) < len(batch):
+        logger.info(
+            f"Using {len(batch) - len(missing)} image prompts from headline generation"
+        )
+    generated = iter(await generate_image_prompts_batch(missing) if missing else [])
+    prompts = [article.image_prompt or next(generated) for article in batch]
+
+    # Generate images from prompts
+    return await generate_images_from_prompts_batch(prompts)
+
+
 async def generate_featured_images_with_rate_limiting(
     headline_articles: List[ProcessedArticle],
 ) -> List[Optional[str]]:
     """
     Generate featured images for multiple articles with rate limiting.
-    Processes 6 articles at a time with 1-minute delays between batches.
+    With an LLM_RATE_LIMITS budget for the image model, batches of 6 articles
+    run concurrently and the shared limiter admits each call as soon as the
+    quota allows. Without one, batches run one after another with a
+    1-minute pause between them.
 
     Args:
         headline_articles: List of articles to generate images for
@@ -273,30 +309,29 @@ async def generate_featured_images_with_rate_limiting(
         f"Starting batch image generation for {len(headline_articles)} articles"
     )
 
-    all_results = []
-    batch_size = 6
-
-    for i in range(0, len(headline_articles), batch_size):
-        batch = headline_articles[i : i + batch_size]
-        batch_num = (i // batch_size) + 1
-        total_batches = (len(headline_articles) + batch_size - 1) // batch_size
-
-        logger.info(
-            f"Processing batch {batch_num}/{total_batches} ({len(batch)} articles)"
+    batches = [
+        headline_articles[i : i + IMAGE_BATCH_SIZE]
+        for i in range(0, len(headline_articles), IMAGE_BATCH_SIZE)
+    ]
+    if llm_rate_limiter.is_limited(IMAGE_MODEL):
+        batch_results = await asyncio.gather(
+            *(
+                _generate_featured_images_batch(batch, batch_num, len(batches))
+                for batch_num, batch in enumerate(batches, 1)
+            )
         )
-
-        # Generate prompts for this batch
-        prompts = await generate_image_prompts_batch(batch)
-
-        # Generate images from prompts
-        images = await generate_images_from_prompts_batch(prompts)
-
-        all_results.extend(images)
-
-        # Rate limiting: wait 1 minute between batches (except for the last batch)
-        if i + batch_size < len(headline_articles):
-            logger.info("Waiting 60 seconds before next batch (rate limiting)...")
-            await asyncio.sleep(60)
+    else:
+        batch_results = []
+        for batch_num, batch in enumerate(batches, 1):
+            if batch_num > 1:
+                logger.info(
+                    f"Waiting {IMAGE_BATCH_PAUSE_SECONDS} seconds before next batch (no rate limit configured for {IMAGE_MODEL})..."
+                )
+                await asyncio.sleep(IMAGE_BATCH_PAUSE_SECONDS)
+            batch_results.append(
+                await _generate_featured_images_batch(batch, batch_num, len(batches))
+            )
+    all_results = [image for images in batch_results for image in images]
 
     logger.info(
         f"Completed batch image generation: {sum(1 for r in all_results if r is not None)}/{len(all_results)} successful"
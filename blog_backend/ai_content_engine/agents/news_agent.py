@@ -1,22 +1,43 @@
 import os
 import logging
-from google import genai
 from google.genai import types
 from dotenv import load_dotenv
 import asyncio
 
-from ai_content_engine.models import ArticleSummaryResponse, ProcessedArticle
-from ai_content_engine.prompts import newspaper_headline_prompt
+from ai_content_engine.models import (
+    ArticleSummaryResponse,
+    ArticleSummaryWithImagePromptResponse,
+    ProcessedArticle,
+)
+from ai_content_engine.prompts import (
+    newspaper_headline_prompt,
+    newspaper_headline_with_image_prompt,
+)
+from ai_content_engine.utils.content_condenser import condense_content
+from ai_content_engine.utils.llm_client import generate_content_async
+from ai_content_engine.utils.llm_usage import track_llm_usage
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
-client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
 
+# Generate the featured-image prompt in the same call as the headline, so
+# image generation doesn't need its own prompt-writing round
+NEWS_COMBINED_IMAGE_PROMPT = (
+    os.getenv("NEWS_COMBINED_IMAGE_PROMPT", "False").lower() == "true"
+)
 
-async def _process_single_article(article: dict) -> ProcessedArticle:
+
+async def _process_single_article(
+    article: dict, condensed_content: str
+) -> ProcessedArticle:
     """Helper function to process a single article into a newspaper-style summary with headline, subheading, and content."""
-    system_prompt = newspaper_headline_prompt
+    if NEWS_COMBINED_IMAGE_PROMPT:
+        system_prompt = newspaper_headline_with_image_prompt
+        response_schema = ArticleSummaryWithImagePromptResponse
+    else:
+        system_prompt = newspaper_headline_prompt
+        response_schema = ArticleSummaryResponse
     logger.info(
         f"Generating summary, headline, and subheading for: {article['title'][:50]}..."
     )
@@ -24,32 +45,38 @@ async def _process_single_article(article: dict) -> ProcessedArticle:
     article_text = f"Article:\n"
     article_text += f"Title: {article['title']}\n"
     article_text += f"Description: {article['description']}\n"
-    article_text += f"Content: {article['content'][:10000]}\n"
+    article_text += f"Content: {condensed_content}\n"
     article_text += f"Source: {article['source']}\n"
 
     try:
-        response = await client.aio.models.generate_content(
-            model="gemini-2.0-flash",
-            contents=[article_text],
-            config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                response_mime_type="application/json",
-                response_schema=ArticleSummaryResponse,
-                max_output_tokens=2048,
-            ),
-        )
+        with track_llm_usage() as usage:
+            response = await generate_content_async(
+                model="gemini-2.0-flash",
+                contents=[article_text],
+                config=types.GenerateContentConfig(
+                    system_instruction=system_prompt,
+                    response_mime_type="application/json",
+                    response_schema=response_schema,
+                    max_output_tokens=2048,
+                ),
+            )
         result: ArticleSummaryResponse = response.parsed
+        image_prompt = getattr(result, "image_prompt", None)
         logger.info(
             f"Headline for {article['title'][:50]}...: {result.headline} - {result.subheading}"
         )
         if result.rex_take:
             logger.info(f"Rex take for {article['title'][:50]}...: {result.rex_take}")
+        if image_prompt:
+            logger.info(f"Image prompt for {article['title'][:50]}...: {image_prompt}")
         return ProcessedArticle(
             original_article=article,
             headline=result.headline,
             subheading=result.subheading,
             content=result.content,
             rex_take=result.rex_take,
+            image_prompt=image_prompt,
+            llm_usage=usage.summary(),
         )
 
     except Exception as e:
@@ -72,6 +99,23 @@ async def process_articles_for_news(
     Processes each article individually and in parallel.
     Returns a list of ProcessedArticle objects.
     """
-    tasks = [_process_single_article(article) for article in scraped_articles]
+    # Condense each article to the token budget first (cheap, local)
+    condensed = [
+        condense_content(
+            article["content"], article["title"], article.get("description", "")
+        )
+        for article in scraped_articles
+    ]
+    original_tokens = sum(c.original_tokens for c in condensed)
+    tokens_saved = sum(c.tokens_saved for c in condensed)
+    logger.info(
+        f"CONDENSER: Saved {tokens_saved} of {original_tokens} content tokens across {len(condensed)} articles"
+        + (f" ({tokens_saved / original_tokens:.0%})" if original_tokens else "")
+    )
+
+    tasks = [
+        _process_single_article(article, c.text)
+        for article, c in zip(scraped_articles, condensed)
+    ]
     headlines_with_articles = await asyncio.gather(*tasks)
     return headlines_with_articles
@@ -1,21 +1,95 @@
 import asyncio
-from google import genai
+import time
+from collections.abc import AsyncIterator
 from google.genai import types
 import os
 from dotenv import load_dotenv
 from tavily import AsyncTavilyClient
 from ai_content_engine.models import Section, Outline
 from ai_content_engine.prompts import writer_diagram_prompt, writer_text_prompt
+from ai_content_engine.utils.disk_cache import DiskCache
+from ai_content_engine.utils.llm_client import generate_content_async
+from ai_content_engine.utils.providers import record_fixture, use_fake
 import logging
-from google.api_core.exceptions import TooManyRequests, ResourceExhausted
 
 logger = logging.getLogger(__name__)
 
 load_dotenv()
-client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 
-tavily_async_client = AsyncTavilyClient(api_key=TAVILY_API_KEY)
+# Search responses are cached across posts and reruns
+RESEARCH_CACHE_TTL_SECONDS = float(os.getenv("RESEARCH_CACHE_TTL_HOURS", "168")) * 3600
+RESEARCH_MAX_CONCURRENCY = int(os.getenv("RESEARCH_MAX_CONCURRENCY", "5"))
+
+WRITER_MODEL = "gemini-2.0-flash"
+# A section not written within its deadline is rewritten without research on
+# the fallback model, which gets its own deadline. Sections run concurrently,
+# so a post takes at most the sum of the two deadlines.
+SECTION_TIMEOUT_SECONDS = float(os.getenv("WRITER_SECTION_TIMEOUT_SECONDS", "120"))
+SECTION_FALLBACK_MODEL = os.getenv("WRITER_FALLBACK_MODEL", "gemini-2.0-flash-lite")
+SECTION_FALLBACK_TIMEOUT_SECONDS = float(
+    os.getenv("WRITER_FALLBACK_TIMEOUT_SECONDS", "60")
+)
+
+_research_cache = DiskCache(
+    "research_queries", ttl_seconds=RESEARCH_CACHE_TTL_SECONDS, compress=True
+)
+_tavily_async_client = None
+
+
+def _get_tavily_client() -> AsyncTavilyClient:
+    """Creates the Tavily client on first use, so the module imports without a key."""
+    global _tavily_async_client
+    if _tavily_async_client is None:
+        if use_fake("search"):
+            from ai_content_engine.utils.fake_providers import FakeTavilyClient
+
+            _tavily_async_client = FakeTavilyClient()
+        else:
+            _tavily_async_client = AsyncTavilyClient(api_key=TAVILY_API_KEY)
+    return _tavily_async_client
+
+
+def normalize_query(query: str) -> str:
+    """Case, whitespace and trailing punctuation don't make two queries different."""
+    return " ".join(query.lower().split()).strip(" ?.!")
+
+
+async def _research_query(query: str, semaphore: asyncio.Semaphore) -> dict:
+    """One Tavily search, served from the research cache when possible."""
+    key = normalize_query(query)
+    cached = _research_cache.get(key)
+    if cached is not None:
+        logger.info(f"Search cache hit: {query}")
+        return cached
+
+    async with semaphore:
+        logger.info(f"Searching: {query}")
+        response = await _get_tavily_client().search(
+            query, include_answer="advanced", topic="general"
+        )
+    _research_cache.set(key, response)
+    record_fixture("search", query, response)
+    return response
+
+
+def start_research(queries: list[str]) -> dict[str, asyncio.Task]:
+    """
+    Starts one search per distinct query (see normalize_query) under a shared
+    concurrency cap, without waiting for them.
+    Returns:
+            dict[str, asyncio.Task]: Normalized query -> task resolving to the Tavily response
+    """
+    semaphore = asyncio.Semaphore(RESEARCH_MAX_CONCURRENCY)
+    tasks = {}
+    for query in queries:
+        key = normalize_query(query)
+        if key and key not in tasks:
+            tasks[key] = asyncio.create_task(_research_query(query, semaphore))
+    skipped = len(queries) - len(tasks)
+    if skipped:
+        logger.info(f"Skipped {skipped} duplicate research queries")
+    return tasks
 
 
 async def async_research_queries(queries):
@@ -31,30 +105,42 @@ async def async_research_queries(queries):
                     'results': list[]
                 }
     """
+    tasks = start_research(queries)
+    return [await tasks[normalize_query(query)] for query in queries]
 
-    search_tasks = []
-    for query in queries:
-        logger.info(f"Searching: {query}")
-        search_tasks.append(
-            tavily_async_client.search(
-                query, include_answer="advanced", topic="general"
-            )
-        )
 
-    # Execute all searches concurrently
-    search_docs = await asyncio.gather(*search_tasks)
-    # logger.info(
-    #     "Searches completed: ", " ".join([doc["answer"] for doc in search_docs])
-    # )
-    return search_docs
+async def _gather_research(
+    section: Section, research: dict[str, asyncio.Task]
+) -> str | None:
+    """Waits for this section's searches only; a failed search is logged and left out."""
+    answers = []
+    for query in section.queries or []:
+        task = research.get(normalize_query(query))
+        if task is None:
+            continue
+        try:
+            # Shielded: a section hitting its deadline must not cancel a search other sections share
+            doc = await asyncio.shield(task)
+        except Exception as e:
+            logger.error(f"Search failed for '{query}': {e}")
+            continue
+        if doc.get("answer"):
+            answers.append(doc["answer"])
+    return "\n\n".join(answers) or None
 
 
-async def generate_section(section: Section):
+async def generate_section(
+    section: Section,
+    research: dict[str, asyncio.Task] | None = None,
+    model: str = WRITER_MODEL,
+):
+    """Writes one section; research holds searches already started for the whole outline."""
     logger.info(f"Generating section: {section.title}...")
 
     if section.queries:
-        search_docs = await async_research_queries(section.queries)
-        research_content = "\n\n".join([doc["answer"] for doc in search_docs])
+        if research is None:
+            research = start_research(section.queries)
+        research_content = await _gather_research(section, research)
         logger.info(f"Research content: {research_content}")
     else:
         research_content = None
@@ -70,33 +156,108 @@ async def generate_section(section: Section):
     content_prompt += (
         f"Researched context: {research_content}" if research_content else ""
     )
-    for attempt in range(2):  # Max 2 attempts
-        try:
-            response = await client.aio.models.generate_content(
-                model="gemini-2.0-flash",
-                contents=[content_prompt],
-                config=types.GenerateContentConfig(
-                    system_instruction=system_prompt,
-                    max_output_tokens=8192,
-                ),
-            )
-            return response.text
+    # Rate limits are waited out in llm_client
+    response = await generate_content_async(
+        model=model,
+        contents=[content_prompt],
+        config=types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            max_output_tokens=8192,
+        ),
+    )
+    return response.text
 
-        except (TooManyRequests, ResourceExhausted) as e:
-            logger.warning("Rate limit exceeded. Retrying in 60 seconds...")
-            if attempt == 0:  # Only sleep before the retry, not after the final attempt
-                await asyncio.sleep(60)
-            else:
-                logger.error("Rate limit exceeded after retrying. Exiting.")
-                raise e  # Raise error if second attempt also fails
+
+async def _write_section(
+    index: int, section: Section, research: dict[str, asyncio.Task]
+) -> tuple[int, str | None]:
+    """
+    Writes a section within SECTION_TIMEOUT_SECONDS, falling back to a quick
+    rewrite without research on SECTION_FALLBACK_MODEL.
+    Returns:
+            tuple[int, str | None]: The section's index and its text, None if the fallback failed too
+    """
+    try:
+        text = await asyncio.wait_for(
+            generate_section(section, research), SECTION_TIMEOUT_SECONDS
+        )
+        return index, text
+    except asyncio.TimeoutError:
+        logger.warning(
+            f"Section '{section.title}' missed its {SECTION_TIMEOUT_SECONDS:.0f}s deadline - falling back to {SECTION_FALLBACK_MODEL} without research"
+        )
+    except Exception as e:
+        logger.error(
+            f"Section '{section.title}' failed - falling back to {SECTION_FALLBACK_MODEL} without research | Error: {e}"
+        )
+
+    try:
+        # An empty research dict makes generate_section skip searching
+        text = await asyncio.wait_for(
+            generate_section(section, {}, model=SECTION_FALLBACK_MODEL),
+            SECTION_FALLBACK_TIMEOUT_SECONDS,
+        )
+        return index, text
+    except asyncio.TimeoutError:
+        logger.error(
+            f"Fallback for section '{section.title}' timed out - the post cannot be completed"
+        )
+    except Exception as e:
+        logger.error(
+            f"Fallback for section '{section.title}' failed - the post cannot be completed | Error: {e}"
+        )
+    return index, None
+
+
+async def stream_blog_post_sections(outline: Outline) -> AsyncIterator[str]:
+    """
+    Writes every section concurrently and yields their texts in outline order,
+    each as soon as it and all sections before it are written.
+    Raises RuntimeError as soon as a section can't be written even by the
+    fallback, rather than publishing the post with a hole in it. Searches and
+    sections still running when the stream ends or fails are cancelled.
+    """
+    start_time = time.time()
+    # Start every distinct search up front; each section then waits only for its own
+    research = start_research(
+        [query for section in outline.sections for query in section.queries or []]
+    )
+    section_tasks = [
+        asyncio.create_task(_write_section(index, section, research))
+        for index, section in enumerate(outline.sections)
+    ]
+
+    # Sections land in their outline slot as they finish, in whatever order
+    ready: dict[int, str] = {}
+    next_index = 0
+    try:
+        for finished, next_done in enumerate(asyncio.as_completed(section_tasks), 1):
+            index, text = await next_done
+            if text is None:
+                raise RuntimeError(
+                    f"Section '{outline.sections[index].title}' of '{outline.title}' could not be written"
+                )
+            ready[index] = text
+            logger.info(
+                f"Section {index + 1}/{len(section_tasks)} ready | {finished}/{len(section_tasks)} done | {time.time() - start_time:.1f}s"
+            )
+            while next_index in ready:
+                yield ready.pop(next_index)
+                next_index += 1
+    finally:
+        # Searches only a skipped or failed section was waiting for would
+        # otherwise keep running (and spending quota) after the post is done
+        for task in [*section_tasks, *research.values()]:
+            task.cancel()
 
 
 async def generate_blog_post_from_outline(outline: Outline):
     logger.info("Generating blog post from outline...")
+    start_time = time.time()
     title = outline.title
-    section_tasks = [generate_section(section) for section in outline.sections]
-    section_outputs = await asyncio.gather(*section_tasks)
-
-    blog = "\n\n".join(section_outputs)
-    logger.info(f"Blog post generated: {title}")
+    sections = [text async for text in stream_blog_post_sections(outline)]
+    blog = "\n\n".join(sections)
+    logger.info(
+        f"Blog post generated: {title} | {len(sections)} sections | {time.time() - start_time:.1f}s"
+    )
     return blog, title
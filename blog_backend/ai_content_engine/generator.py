@@ -1,5 +1,6 @@
 from ai_content_engine.agents.planner_agent import generate_outline
 from ai_content_engine.utils.process_paper import process_arxiv_paper
+from ai_content_engine.utils.paper_condenser import condense_paper
 from ai_content_engine.agents.writer_agent import generate_blog_post_from_outline
 from ai_content_engine.agents.summary_agent import (
     generate_weekly_summary_from_summaries,
@@ -23,11 +24,17 @@ def generate_weekly_summary(paper_summaries_dict: list[dict]):
 
 
 async def generate_news_headlines(
-    days_ago: int = 7, top_n: int = 12, force_regenerate: bool = False
+    days_ago: int = 7,
+    top_n: int = 12,
+    force_regenerate: bool = False,
+    candidate_articles: list[dict] | None = None,
 ):
     logger.info("Generating news headlines...")
     top_articles = await get_top_articles(
-        days_ago=days_ago, top_n=top_n, force_regenerate=force_regenerate
+        days_ago=days_ago,
+        top_n=top_n,
+        force_regenerate=force_regenerate,
+        candidate_articles=candidate_articles,
     )
     if not top_articles:
         logger.info("No top articles found, returning empty list.")
@@ -52,6 +59,9 @@ def generate_blog_post_content(paper_id: str, curated=False):
     logger.info(f"Generating blog post for paper: {paper_id}...")
     text = process_arxiv_paper(f"https://arxiv.org/pdf/{paper_id}.pdf")
 
+    # Long papers are condensed section by section to a bounded digest first
+    text = condense_paper(text)
+
     logger.info("Generating outline...")
     outline = generate_outline(text, curated)
     blog_summary = outline.summary
@@ -42,9 +42,18 @@ class ArticleSummaryResponse(BaseModel):
     )
 
 
+class ArticleSummaryWithImagePromptResponse(ArticleSummaryResponse):
+    image_prompt: str = Field(
+        description="A prompt for the article's featured illustration"
+    )
+
+
 class ProcessedArticle(BaseModel):
     original_article: dict
     headline: str
     subheading: str
     content: str
     rex_take: str | None = None
+    image_prompt: str | None = None
+    # LLM tokens/cost spent writing this article (see utils/llm_usage.py)
+    llm_usage: dict | None = None
@@ -106,6 +106,19 @@ You will be given the section title, content from the paper, and specific instru
 Give a complete section, including the title, introduction, diagram, and conclusion."""
 
 
+paper_section_digest_prompt = """
+You are condensing one part of a long research paper so that a blog outline can be planned from the condensed version instead of the full text.
+You will be given one or more consecutive sections of the paper. Write a faithful digest of them that:
+1. Keeps the section headings, in order, as markdown headings
+2. Preserves the key ideas, methods, design choices and findings
+3. Keeps concrete numbers, dataset and model names, and comparisons to baselines exactly as written
+4. Keeps definitions of terms and equations that later sections depend on, in words if needed
+5. Drops repetition, boilerplate, long proofs and exhaustive per-setting tables (summarize their trend instead)
+
+Do not add information that is not in the text and do not comment on the paper. Stay within roughly {word_budget} words.
+"""
+
+
 weekly_summary_prompt = """
 You are an expert technical writer tasked with creating a weekly summary of the latest AI research papers.
 You will be given a list of paper summaries, which you must compile into an engaging and simple recap for a general audience.
@@ -142,7 +155,7 @@ news_filter_prompt = """
     For each news item, mention its original ID, your reasoning (briefly), and your decision (True or False). Select and rank the top {top_n} items.
     """
 
-newspaper_headline_prompt = """
+_newspaper_headline_guidelines = """
     You are a newspaper editor at a prestigious publication like The New York Times. Your task is to create compelling, 
     professional headlines, subheadings, a brief lede, and one playful Rex take (a single catchy sentence about why the news matters) for AI news articles. Follow these guidelines:
 
@@ -174,10 +187,25 @@ newspaper_headline_prompt = """
        - Focus on the significance and impact
        - Use proper newspaper terminology
        - Do not speculate or make up information
+"""
 
+newspaper_headline_prompt = _newspaper_headline_guidelines + """
     For each article, provide a headline, subheading, lede paragraph, and Rex take that capture its significance in the AI landscape.
     """
 
+# Used instead of newspaper_headline_prompt when the image prompt is generated
+# in the same call (NEWS_COMBINED_IMAGE_PROMPT)
+newspaper_headline_with_image_prompt = _newspaper_headline_guidelines + """
+    6. Image Prompt (2-4 sentences) for the article's featured illustration:
+       - Avoid text in the image
+       - Maximum 3-4 visual elements only; lead with the most important one
+       - Friendly, approachable cartoon style suitable for the topic
+       - Create atmosphere with lighting, textures, and spatial descriptions; describe a scene rather than listing objects
+       - If the story is too generic, use neural network/AI imagery with the same descriptive approach
+
+    For each article, provide a headline, subheading, lede paragraph, Rex take, and image prompt that capture its significance in the AI landscape.
+    """
+
 image_gen_prompt = """
     You are an AI image prompt generator for AI news articles. Given headlines and subheadings, create simple, focused image prompts for each article.
 
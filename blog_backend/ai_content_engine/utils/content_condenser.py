@@ -0,0 +1,153 @@
+"""Token-budgeted condensing of scraped article text before it goes to an LLM.
+
+Scraped pages carry newsletter sign-ups, share buttons and repeated blocks,
+and a plain character cut can drop the paragraphs that matter. The condenser
+strips boilerplate lines, removes repeated paragraphs and, if the article is
+still over budget, keeps the lead plus the paragraphs most related to the
+article's title and description.
+"""
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+
+import tiktoken
+
+from ai_content_engine.utils.near_duplicates import normalize_tokens
+
+logger = logging.getLogger(__name__)
+
+NEWS_CONTENT_TOKEN_BUDGET = int(os.getenv("NEWS_CONTENT_TOKEN_BUDGET", "2500"))
+# Paragraphs always kept from the top of the article, budget permitting
+LEAD_PARAGRAPHS = 3
+# tiktoken's encodings only approximate Gemini's tokenizer, which is close
+# enough for budgeting
+TOKEN_ENCODING = "cl100k_base"
+CHARS_PER_TOKEN = 4  # fallback estimate when the encoding can't be loaded
+
+_BOILERPLATE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"^(advertisement|sponsored( content)?|related( articles| stories)?:?|read more:?|see also:?)$",
+        # Calls to action lead the line ("Sign up for our newsletter", "Want
+        # more? Subscribe..."); sentences that only mention them are content
+        r"^([\w ]{0,20}[.?!:]\s+)?(subscribe|sign up|follow us|share (this|on)|click here)\b",
+        # Lines made up only of footer links
+        r"^((privacy policy|terms of (use|service)|cookies?( policy| settings)?|newsletters?|contact us)\s*[|·•,/-]?\s*)+$",
+        r"^(©|\(c\)|copyright)?[^.]{0,80}\.?\s*all rights reserved\.?$",
+        r"^(image|photo|credit|source)( credit)?:",
+    )
+]
+# Boilerplate patterns only apply to short lines so real paragraphs that
+# happen to start with "Subscribe" are kept
+_BOILERPLATE_MAX_CHARS = 200
+
+_encoding = None
+_encoding_failed = False
+
+
+@dataclass
+class CondensedContent:
+    text: str
+    original_tokens: int
+    condensed_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.condensed_tokens
+
+
+def count_tokens(text: str) -> int:
+    """Token count of text, estimated from its length if tiktoken's encoding is unavailable."""
+    global _encoding, _encoding_failed
+    if _encoding is None and not _encoding_failed:
+        try:
+            _encoding = tiktoken.get_encoding(TOKEN_ENCODING)
+        except Exception as e:
+            # The encoding is downloaded on first use; offline hosts can't
+            _encoding_failed = True
+            logger.warning(
+                f"CONDENSER: Could not load tiktoken encoding '{TOKEN_ENCODING}' - estimating tokens from length | Error: {e}"
+            )
+    if _encoding is not None:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _split_paragraphs(text: str) -> list[str]:
+    return [p.strip() for p in re.split(r"\n\s*\n|\n", text) if p.strip()]
+
+
+def _is_boilerplate(paragraph: str) -> bool:
+    if len(paragraph) > _BOILERPLATE_MAX_CHARS:
+        return False
+    return any(pattern.search(paragraph) for pattern in _BOILERPLATE_PATTERNS)
+
+
+def _dedupe(paragraphs: list[str]) -> list[str]:
+    seen = set()
+    unique = []
+    for paragraph in paragraphs:
+        key = " ".join(paragraph.lower().split())
+        if key not in seen:
+            seen.add(key)
+            unique.append(paragraph)
+    return unique
+
+
+def _salience(paragraph: str, topic_terms: set[str]) -> float:
+    """Share of the paragraph's words that are topic terms, plus a bonus for figures and names."""
+    tokens = normalize_tokens(paragraph)
+    if not tokens:
+        return 0.0
+    overlap = sum(1 for token in tokens if token in topic_terms) / len(tokens)
+    figures = len(re.findall(r"\d[\d.,%]*", paragraph))
+    names = len(re.findall(r"(?<![.!?]\s)\b[A-Z][a-zA-Z0-9]+", paragraph))
+    return overlap + 0.02 * min(figures + names, 10)
+
+
+def condense_content(
+    content: str,
+    title: str = "",
+    description: str = "",
+    token_budget: int = NEWS_CONTENT_TOKEN_BUDGET,
+) -> CondensedContent:
+    """Condenses article content to at most token_budget tokens (see module docstring)."""
+    original_tokens = count_tokens(content or "")
+    paragraphs = _dedupe(
+        [p for p in _split_paragraphs(content or "") if not _is_boilerplate(p)]
+    )
+    token_counts = [count_tokens(p) for p in paragraphs]
+
+    if sum(token_counts) <= token_budget:
+        text = "\n\n".join(paragraphs)
+        return CondensedContent(text, original_tokens, count_tokens(text))
+
+    # Lead first, then the most salient of the rest, while the budget allows
+    keep = set()
+    used = 0
+    for i in range(min(LEAD_PARAGRAPHS, len(paragraphs))):
+        if used + token_counts[i] > token_budget:
+            break
+        keep.add(i)
+        used += token_counts[i]
+
+    topic_terms = set(normalize_tokens(f"{title} {description}"))
+    remaining = sorted(
+        (i for i in range(len(paragraphs)) if i not in keep),
+        key=lambda i: _salience(paragraphs[i], topic_terms),
+        reverse=True,
+    )
+    for i in remaining:
+        if used + token_counts[i] <= token_budget:
+            keep.add(i)
+            used += token_counts[i]
+
+    if not keep and paragraphs:
+        # Even the first paragraph is over budget: cut it down proportionally
+        ratio = token_budget / token_counts[0]
+        text = paragraphs[0][: int(len(paragraphs[0]) * ratio)]
+    else:
+        text = "\n\n".join(paragraphs[i] for i in sorted(keep))
+    return CondensedContent(text, original_tokens, count_tokens(text))
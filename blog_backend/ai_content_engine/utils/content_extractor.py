@@ -0,0 +1,209 @@
+"""HTML-to-text extraction for scraped articles, run in a worker process pool.
+
+trafilatura and BeautifulSoup are CPU-bound, so running them on the event loop
+(or in threads, which share the GIL) slows down everything else in the news
+run. This module keeps its imports light because it is re-imported by every
+worker process.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import trafilatura
+from bs4 import BeautifulSoup, FeatureNotFound
+
+logger = logging.getLogger(__name__)
+
+# Minimum extracted length (chars) for a result to count as the article body
+MIN_CONTENT_LENGTH = 200
+
+EXTRACTION_WORKERS = int(
+    os.getenv("EXTRACTION_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+EXTRACTION_TIMEOUT = float(os.getenv("EXTRACTION_TIMEOUT", "20"))
+# Pages larger than this are truncated before extraction
+MAX_HTML_BYTES = int(os.getenv("SCRAPE_MAX_HTML_BYTES", str(2 * 1024 * 1024)))
+# BeautifulSoup parser; lxml (pinned in requirements) is much faster than the
+# pure-Python html.parser
+HTML_PARSER = os.getenv("HTML_PARSER", "lxml")
+
+# Idle single-process workers, reused across extractions
+_idle_workers: list[ProcessPoolExecutor] = []
+_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def make_soup(html_content):
+    """Parses HTML with HTML_PARSER, falling back to html.parser if it isn't installed."""
+    try:
+        return BeautifulSoup(html_content, HTML_PARSER)
+    except FeatureNotFound:
+        return BeautifulSoup(html_content, "html.parser")
+
+
+def extract_with_bs(html_content, url):
+    """Extracts content from HTML using BeautifulSoup with custom logic."""
+    logger.debug(f"SCRAPE_EXTRACT: Attempting BeautifulSoup extraction | URL: {url}")
+
+    if not html_content:
+        logger.warning(f"SCRAPE_EXTRACT: No HTML content provided | URL: {url}")
+        return None
+
+    try:
+        soup = make_soup(html_content)
+        article_tag = soup.find("article")
+
+        if article_tag:
+            prose_divs = article_tag.find_all("div", class_="prose")
+            if prose_divs:
+                all_prose_text_parts = [
+                    div.get_text(separator="\n\n", strip=True)
+                    for div in prose_divs
+                    if div
+                ]
+                content = "\n\n".join(all_prose_text_parts)
+                if content:
+                    logger.debug(
+                        f"SCRAPE_EXTRACT: Extracted {len(content)} chars from prose divs | URL: {url}"
+                    )
+                    return content
+                else:
+                    logger.debug(
+                        f"SCRAPE_EXTRACT: Empty content from prose divs | URL: {url}"
+                    )
+
+            logger.debug(
+                f"SCRAPE_EXTRACT: No valid prose divs found, extracting from entire article tag | URL: {url}"
+            )
+            content = article_tag.get_text(separator="\n\n", strip=True)
+            if content:
+                logger.debug(
+                    f"SCRAPE_EXTRACT: Extracted {len(content)} chars from article tag | URL: {url}"
+                )
+                return content
+            else:
+                logger.debug(
+                    f"SCRAPE_EXTRACT: Empty content from article tag | URL: {url}"
+                )
+        else:
+            logger.warning(f"SCRAPE_EXTRACT: No article tag found | URL: {url}")
+
+        return None
+    except Exception as e:
+        logger.error(
+            f"SCRAPE_EXTRACT: Error during BeautifulSoup extraction | URL: {url} | Error: {e}"
+        )
+        return None
+
+
+def extract_article_text(html_content, url):
+    """Runs trafilatura, then the BeautifulSoup fallback, on one document.
+
+    Returns (content, extraction_method); content is None if neither extractor
+    produced at least MIN_CONTENT_LENGTH characters.
+    """
+    content = trafilatura.extract(
+        html_content,
+        include_comments=False,
+        include_tables=False,
+        no_fallback=True,
+    )
+    if content and len(content) >= MIN_CONTENT_LENGTH:
+        return content, "trafilatura"
+
+    content = extract_with_bs(html_content, url)
+    if content and len(content) >= MIN_CONTENT_LENGTH:
+        return content, "beautifulsoup"
+
+    return None, "description_fallback"
+
+
+def _worker_ready() -> bool:
+    """No-op task; unpickling it imports this module (and trafilatura) in a new worker."""
+    return True
+
+
+def _new_worker() -> ProcessPoolExecutor:
+    # spawn rather than fork: the parent runs an event loop and other
+    # threads, which fork does not copy safely
+    return ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _kill_worker(worker: ProcessPoolExecutor) -> None:
+    """Terminates one worker (e.g. stuck on a pathological page) without touching the others."""
+    # ProcessPoolExecutor has no public way to stop a running task
+    processes = list((worker._processes or {}).values())
+    worker.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+
+def _get_slots() -> asyncio.Semaphore:
+    """Returns the running loop's semaphore limiting extractions to EXTRACTION_WORKERS."""
+    loop = asyncio.get_running_loop()
+    slots = _slots.get(loop)
+    if slots is None:
+        slots = _slots[loop] = asyncio.Semaphore(EXTRACTION_WORKERS)
+    return slots
+
+
+async def extract_article_text_async(html_content, url):
+    """Extracts article text in a worker process with a size cap and per-document timeout.
+
+    Each extraction gets a single-process worker to itself, so the timeout
+    covers only the extraction (not time spent waiting for a free worker) and
+    a stuck or crashed worker is replaced without disturbing the others.
+    Returns (content, extraction_method) like extract_article_text; a timeout
+    or worker crash is logged and reported as a description fallback.
+    """
+    if len(html_content) > MAX_HTML_BYTES:
+        logger.warning(
+            f"SCRAPE_EXTRACT: Truncating {len(html_content)} byte page to {MAX_HTML_BYTES} bytes | URL: {url}"
+        )
+        html_content = html_content[:MAX_HTML_BYTES]
+
+    loop = asyncio.get_running_loop()
+    async with _get_slots():
+        if _idle_workers:
+            worker = _idle_workers.pop()
+        else:
+            worker = _new_worker()
+            # Process start-up and imports are not part of the extraction budget
+            try:
+                await loop.run_in_executor(worker, _worker_ready)
+            except BaseException:
+                _kill_worker(worker)
+                raise
+
+        try:
+            result = await asyncio.wait_for(
+                loop.run_in_executor(worker, extract_article_text, html_content, url),
+                timeout=EXTRACTION_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                f"SCRAPE_EXTRACT: Extraction timed out after {EXTRACTION_TIMEOUT:.0f}s | URL: {url}"
+            )
+        except BrokenProcessPool as e:
+            logger.error(
+                f"SCRAPE_EXTRACT: Extraction worker died | URL: {url} | Error: {e}"
+            )
+        except BaseException:
+            # Cancelled while the worker may still be busy; don't reuse it
+            _kill_worker(worker)
+            raise
+        else:
+            _idle_workers.append(worker)
+            return result
+
+    _kill_worker(worker)
+    return None, "description_fallback"
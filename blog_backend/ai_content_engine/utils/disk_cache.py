@@ -0,0 +1,183 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any
+
+from ai_content_engine.utils.providers import use_fake
+
+logger = logging.getLogger(__name__)
+
+PAPERS_DIR = os.getenv("PAPERS_DIR", "/tmp/papers")
+CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(PAPERS_DIR, "cache"))
+# With fake LLM, search or HTTP providers the caches fill with fake feeds,
+# pages and answers; keep them apart from the caches live runs read
+if any(use_fake(kind) for kind in ("llm", "search", "http")):
+    CACHE_DIR = os.path.join(CACHE_DIR, "fake")
+
+
+class DiskCache:
+    """
+    Small SQLite-backed key/value store used to persist state between pipeline runs.
+
+    Values are JSON-encoded, so anything json.dumps accepts can be stored. Each
+    named cache lives in its own file under CACHE_DIR and is safe to share
+    between threads.
+
+    Args:
+        name: Name of the cache; used as the SQLite file name
+        ttl_seconds: Default time-to-live for entries (None = never expire)
+        max_bytes: Evict least recently used entries once stored values exceed
+            this size (None = unbounded)
+        compress: zlib-compress stored values (worth it for large text)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+        compress: bool = False,
+    ):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        self.name = name
+        self.path = os.path.join(CACHE_DIR, f"{name}.sqlite3")
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL, "
+                "accessed_at REAL, size INTEGER NOT NULL DEFAULT 0)"
+            )
+            # Cache files created before eviction support lack these columns
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache)")}
+            if "accessed_at" not in columns:
+                self._conn.execute("ALTER TABLE cache ADD COLUMN accessed_at REAL")
+            if "size" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE cache ADD COLUMN size INTEGER NOT NULL DEFAULT 0"
+                )
+
+    def _encode(self, value: Any) -> bytes:
+        data = json.dumps(value).encode("utf-8")
+        return zlib.compress(data) if self.compress else data
+
+    def _decode(self, data: bytes | str) -> Any:
+        if self.compress and isinstance(data, bytes):
+            data = zlib.decompress(data)
+        return json.loads(data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.max_bytes is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key)
+                    )
+        if row is None:
+            return default
+
+        value, expires_at = row
+        if expires_at is not None and expires_at < now:
+            self.delete(key)
+            return default
+
+        try:
+            return self._decode(value)
+        except (ValueError, zlib.error):
+            logger.warning(f"DISK_CACHE: Corrupt entry in '{self.name}' | Key: {key}")
+            self.delete(key)
+            return default
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """Store value under key, overriding the cache's default TTL if given."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        data = self._encode(value)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache "
+                "(key, value, created_at, expires_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, data, now, expires_at, now, len(data)),
+            )
+        if self.max_bytes is not None:
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> int:
+        """Delete all entries and return how many were removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM cache")
+        return cursor.rowcount
+
+    def keys(self) -> list[str]:
+        """Keys of all entries that haven't expired."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM cache WHERE expires_at IS NULL OR expires_at >= ?",
+                (time.time(),),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def purge_expired(self) -> int:
+        """Delete all expired entries and return how many were removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (time.time(),),
+            )
+        return cursor.rowcount
+
+    def total_bytes(self) -> int:
+        """Total size of the stored (possibly compressed) values."""
+        with self._lock:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+        return total
+
+    def _evict(self) -> None:
+        """Drops expired entries, then least recently used ones until under max_bytes."""
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+
+        self.purge_expired()
+        evicted = 0
+        with self._lock, self._conn:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+            rows = self._conn.execute(
+                "SELECT key, size FROM cache ORDER BY COALESCE(accessed_at, created_at)"
+            ).fetchall()
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                total -= size
+                evicted += 1
+
+        if evicted:
+            logger.info(
+                f"DISK_CACHE: Evicted {evicted} entries from '{self.name}' | Size now: {total / 1024:.0f}KB"
+            )
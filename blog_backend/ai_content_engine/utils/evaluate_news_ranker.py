@@ -0,0 +1,78 @@
+"""Offline evaluation of the news pre-ranker against past LLM curation runs.
+
+For every run in the curation log, ranks the candidates the LLM saw and
+reports recall@K: the share of LLM-selected articles that the ranker would
+have kept with a cap of K. Selections from earlier runs stand in for the
+published archive, so nothing is fetched over the network.
+
+Runs recorded while a cap was active only contain the capped candidates; set
+NEWS_PRERANK_TOP_K=0 for a few runs to collect an unbiased log.
+
+Usage:
+    python -m ai_content_engine.utils.evaluate_news_ranker --k 10 20 40 60
+"""
+
+import argparse
+
+from ai_content_engine.utils.news_ranker import (
+    CURATION_LOG_PATH,
+    NEWS_RANKER_ARCHIVE_SIZE,
+    load_curation_runs,
+    score_articles,
+)
+
+
+def evaluate(runs: list[dict], ks: list[int], use_archive: bool = True) -> dict:
+    """Returns {k: (selected_kept, selected_total)} summed over all runs."""
+    totals = {k: [0, 0] for k in ks}
+    archive = []
+
+    for run in runs:
+        candidates = run.get("candidates") or []
+        selected = set(run.get("selected") or [])
+        if candidates and selected:
+            scores = score_articles(
+                candidates,
+                archive[-NEWS_RANKER_ARCHIVE_SIZE:] if use_archive else None,
+            )
+            ranked = sorted(
+                range(len(candidates)), key=lambda i: scores[i], reverse=True
+            )
+            for k in ks:
+                kept = {candidates[i].get("link") for i in ranked[:k]}
+                totals[k][0] += len(selected & kept)
+                totals[k][1] += len(selected)
+
+        archive.extend(c for c in candidates if c.get("link") in selected)
+
+    return {k: tuple(v) for k, v in totals.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--log", default=CURATION_LOG_PATH, help="Curation log path")
+    parser.add_argument(
+        "--k", type=int, nargs="+", default=[10, 20, 30, 40, 60, 80], help="Caps"
+    )
+    parser.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="Score with keyword and source weights only",
+    )
+    args = parser.parse_args()
+
+    runs = load_curation_runs(args.log)
+    sizes = [len(run.get("candidates") or []) for run in runs]
+    print(
+        f"Runs: {len(runs)} | Candidates per run: {min(sizes, default=0)}-{max(sizes, default=0)}"
+    )
+
+    results = evaluate(runs, sorted(args.k), use_archive=not args.no_archive)
+    print(f"{'K':>5} {'Recall':>8} {'Kept/Selected':>15}")
+    for k, (kept, total) in results.items():
+        recall = kept / total if total else 0.0
+        print(f"{k:>5} {recall:>8.1%} {f'{kept}/{total}':>15}")
+
+
+if __name__ == "__main__":
+    main()
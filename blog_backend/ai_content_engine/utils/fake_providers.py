@@ -0,0 +1,851 @@
+"""Deterministic offline stand-ins for the services the pipelines call.
+
+Selected per service with FAKE_PROVIDERS (see providers.py), these let the
+paper and news pipelines run end to end, and be timed, without network
+access or API keys:
+
+- FakeGenAIClient: the genai client's models.generate_content and
+  aio.models.generate_content. Plain text calls get markdown, calls with a
+  response_schema get JSON that fits the schema (parsed by the SDK itself, so
+  .parsed behaves as live), image calls get a small PNG.
+- FakeTavilyClient: AsyncTavilyClient.search.
+- FakeStorageClient: the Supabase storage calls image_uploader makes; files
+  are written under FAKE_STORAGE_DIR.
+- fake_http_get, FakeHTTPSession and FakeScrapeSession: requests.get, an
+  aiohttp session and a curl_cffi session. URLs are routed to generated RSS
+  feeds, article pages, NewsAPI and Hacker News JSON, arXiv metadata, Papers
+  with Code listings and paper PDFs.
+
+Responses recorded into FAKE_PROVIDER_FIXTURES (see providers.py) are
+replayed in place of generated ones, with the same simulated latency.
+
+Content is a pure function of the request and FAKE_PROVIDER_SEED, so reruns
+produce the same posts. Each call sleeps for the service's latency (with
+FAKE_PROVIDER_JITTER) and fails with the service's error rate; both are set
+per service, e.g. FAKE_PROVIDER_LATENCY_MS="llm=1500,http=40" and
+FAKE_PROVIDER_ERROR_RATE="search=0.1". Failures take the service's usual
+shape: a 429 from the LLM (FAKE_LLM_ERROR_CODE), an exception from search
+and storage, a 503 response over HTTP. Whether a call fails is drawn per
+attempt, so a retried call can succeed.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import struct
+import tempfile
+import threading
+import time
+import typing
+import zlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from enum import Enum
+from types import UnionType
+from urllib.parse import parse_qs, urlparse
+
+import aiohttp
+import httpx
+import pydantic
+import requests
+from curl_cffi.requests.exceptions import HTTPError as CurlHTTPError
+from google.genai import errors, types
+from multidict import CIMultiDict, CIMultiDictProxy
+from requests.structures import CaseInsensitiveDict
+from yarl import URL
+
+from ai_content_engine.utils.llm_cache import cache_key
+from ai_content_engine.utils.providers import replay_fixture, url_with_params
+
+logger = logging.getLogger(__name__)
+
+FAKE_PROVIDER_SEED = os.getenv("FAKE_PROVIDER_SEED", "0")
+# Mean latency per service, in milliseconds
+DEFAULT_LATENCY_MS = {
+    "llm": 1200,
+    "image": 4000,
+    "search": 600,
+    "storage": 150,
+    "http": 120,
+}
+# Latencies vary uniformly by this fraction either side of the mean
+FAKE_PROVIDER_JITTER = float(os.getenv("FAKE_PROVIDER_JITTER", "0.25"))
+FAKE_LLM_ERROR_CODE = int(os.getenv("FAKE_LLM_ERROR_CODE", "429"))
+# Length of plain text answers, capped by the call's max_output_tokens
+FAKE_LLM_OUTPUT_WORDS = int(os.getenv("FAKE_LLM_OUTPUT_WORDS", "400"))
+FAKE_PAPER_WORDS = int(os.getenv("FAKE_PAPER_WORDS", "6000"))
+FAKE_FEED_ITEMS = int(os.getenv("FAKE_FEED_ITEMS", "10"))
+FAKE_STORAGE_DIR = os.getenv(
+    "FAKE_STORAGE_DIR", os.path.join(tempfile.gettempdir(), "fake_storage")
+)
+WORDS_PER_TOKEN = 0.75
+CHARS_PER_TOKEN = 4
+
+
+def _parse_rates(spec: str, cast) -> dict:
+    values = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        try:
+            kind, value = item.split("=", 1)
+            values[kind.strip()] = cast(value)
+        except ValueError:
+            logger.warning(f"FAKE_PROVIDER: Ignoring malformed entry '{item}'")
+    return values
+
+
+LATENCY_MS = {
+    **DEFAULT_LATENCY_MS,
+    **_parse_rates(os.getenv("FAKE_PROVIDER_LATENCY_MS", ""), float),
+}
+ERROR_RATE = _parse_rates(os.getenv("FAKE_PROVIDER_ERROR_RATE", ""), float)
+
+_attempts: dict[str, int] = {}
+_call_counts: dict[str, int] = {}
+_attempts_lock = threading.Lock()
+
+
+def _digest(*parts) -> str:
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=repr).encode("utf-8")
+    ).hexdigest()
+
+
+def content_rng(*parts) -> random.Random:
+    """Random generator for a request's content: the same request always gets the same answer."""
+    return random.Random(f"{FAKE_PROVIDER_SEED}:{_digest(*parts)}")
+
+
+def _plan_call(kind: str, key: str) -> tuple[float, bool]:
+    """Latency in seconds and whether to fail, for the next attempt of a call."""
+    with _attempts_lock:
+        attempt = _attempts.get(f"{kind}:{key}", 0)
+        _attempts[f"{kind}:{key}"] = attempt + 1
+        _call_counts[kind] = _call_counts.get(kind, 0) + 1
+    rng = random.Random(f"{FAKE_PROVIDER_SEED}:{kind}:{key}:{attempt}")
+    jitter = 1 + FAKE_PROVIDER_JITTER * (2 * rng.random() - 1)
+    latency = max(0.0, LATENCY_MS.get(kind, 0) * jitter / 1000)
+    return latency, rng.random() < ERROR_RATE.get(kind, 0.0)
+
+
+def simulate_call(kind: str, key: str) -> bool:
+    """Sleeps for one call's latency; returns True if the call should fail."""
+    latency, fail = _plan_call(kind, key)
+    time.sleep(latency)
+    return fail
+
+
+async def simulate_call_async(
+    kind: str, key: str, timeout: float | None = None
+) -> bool:
+    """Async simulate_call; raises asyncio.TimeoutError if the latency exceeds timeout."""
+    latency, fail = _plan_call(kind, key)
+    if timeout is not None and latency > timeout:
+        await asyncio.sleep(timeout)
+        raise asyncio.TimeoutError()
+    await asyncio.sleep(latency)
+    return fail
+
+
+def get_call_counts() -> dict[str, int]:
+    """Calls made to each fake service (including failed attempts) since the last reset."""
+    with _attempts_lock:
+        return dict(_call_counts)
+
+
+def reset_fake_providers() -> None:
+    """Forgets attempt and call counts, so a rerun draws the same latencies and failures."""
+    with _attempts_lock:
+        _attempts.clear()
+        _call_counts.clear()
+
+
+# Text generation
+
+_VOCABULARY = (
+    "model models training inference agent agents benchmark dataset tokens "
+    "attention transformer layer layers parameters scaling reasoning context "
+    "retrieval evaluation latency throughput accuracy alignment fine-tuning "
+    "open-source release research lab compute GPU cluster efficient sparse "
+    "mixture experts multimodal vision language speech robotics safety policy "
+    "results baseline improvement approach method architecture pipeline data "
+    "the a of to and in for with on that this new shows uses by from across"
+).split()
+
+
+def fake_words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(_VOCABULARY) for _ in range(count))
+
+
+def fake_sentence(rng: random.Random, words: int = 14) -> str:
+    return fake_words(rng, words).capitalize() + "."
+
+
+def fake_title(rng: random.Random, words: int = 6) -> str:
+    return " ".join(word.capitalize() for word in fake_words(rng, words).split())
+
+
+def fake_paragraphs(rng: random.Random, words: int) -> list[str]:
+    """About `words` words of prose in paragraphs of 60-120 words."""
+    paragraphs = []
+    while words > 0:
+        length = min(words, rng.randint(60, 120))
+        sentences = []
+        while length > 0:
+            sentence_words = min(length, rng.randint(8, 20))
+            sentences.append(fake_sentence(rng, sentence_words))
+            length -= sentence_words
+        paragraphs.append(" ".join(sentences))
+        words -= sum(len(sentence.split()) for sentence in sentences)
+    return paragraphs
+
+
+def _fake_markdown(rng: random.Random, words: int) -> str:
+    paragraphs = fake_paragraphs(rng, words)
+    return f"## {fake_title(rng)}\n\n" + "\n\n".join(paragraphs)
+
+
+# LLM
+
+# Numbered items in prompts that ask for one answer per item (news curation,
+# batch image prompts); a list answer gets one element per item
+_NUMBERED_ITEM_PATTERN = re.compile(r"^(?:News item|Article) (\d+):", re.MULTILINE)
+_LONG_TEXT_FIELDS = {"content", "context", "body", "summary", "instructions"}
+_SHORT_TEXT_FIELDS = {"title", "headline", "name", "term", "subheading"}
+
+
+def _fake_value(annotation, rng: random.Random, name: str, items: int, index: int):
+    """A value of type annotation; ints inside a list are the element's 1-based position."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in (typing.Union, UnionType):
+        inner = [arg for arg in args if arg is not type(None)]
+        return _fake_value(inner[0], rng, name, items, index) if inner else None
+    if origin is typing.Literal:
+        return rng.choice(args)
+    if origin is list:
+        count = items or rng.randint(2, 4)
+        return [
+            _fake_value(args[0] if args else str, rng, name, 0, i + 1)
+            for i in range(count)
+        ]
+    if origin is dict:
+        return {}
+    if isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+        return {
+            field_name: _fake_value(field.annotation, rng, field_name, 0, index)
+            for field_name, field in annotation.model_fields.items()
+        }
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return rng.choice(list(annotation)).value
+    if annotation is bool:
+        return rng.random() < 0.5
+    if annotation is int:
+        return index or rng.randint(1, 10)
+    if annotation is float:
+        return round(rng.random(), 3)
+    if name in _LONG_TEXT_FIELDS:
+        return "\n\n".join(fake_paragraphs(rng, rng.randint(120, 220)))
+    if name in _SHORT_TEXT_FIELDS:
+        return fake_title(rng)
+    return fake_sentence(rng)
+
+
+def _prompt_text(contents, config: types.GenerateContentConfig | None) -> str:
+    if not isinstance(contents, list):
+        contents = [contents]
+    texts = [item for item in contents if isinstance(item, str)]
+    if config is not None and isinstance(config.system_instruction, str):
+        texts.append(config.system_instruction)
+    return "\n".join(texts)
+
+
+def fake_png(rng: random.Random, width: int = 64, height: int = 36) -> bytes:
+    """A solid-colour PNG."""
+    pixel = bytes(rng.randrange(256) for _ in range(3))
+    raw = b"".join(b"\x00" + pixel * width for _ in range(height))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + tag
+            + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _is_image_request(config: types.GenerateContentConfig | None) -> bool:
+    return bool(
+        config and config.response_modalities and "IMAGE" in config.response_modalities
+    )
+
+
+def _fake_llm_response(
+    model: str, contents, config: types.GenerateContentConfig | None, key: str
+) -> types.GenerateContentResponse:
+    schema = config.response_schema if config is not None else None
+    recorded = replay_fixture("llm", key)
+    if recorded is not None:
+        return types.GenerateContentResponse._from_response(
+            response=recorded, kwargs={"config": {"response_schema": schema}}
+        )
+    rng = content_rng("llm", key)
+    prompt = _prompt_text(contents, config)
+    if _is_image_request(config):
+        parts = [
+            {"text": "Here is the illustration."},
+            {
+                "inline_data": {
+                    "mime_type": "image/png",
+                    "data": base64.b64encode(fake_png(rng)).decode("ascii"),
+                }
+            },
+        ]
+        output_tokens = 1290  # what the API bills per generated image
+    else:
+        if schema is not None:
+            items = max(
+                (int(n) for n in _NUMBERED_ITEM_PATTERN.findall(prompt)), default=0
+            )
+            text = json.dumps(_fake_value(schema, rng, "", items, 0))
+        else:
+            max_output = config.max_output_tokens if config is not None else None
+            words = FAKE_LLM_OUTPUT_WORDS
+            if max_output:
+                words = min(words, int(max_output * WORDS_PER_TOKEN))
+            text = _fake_markdown(rng, words)
+        parts = [{"text": text}]
+        output_tokens = len(text) // CHARS_PER_TOKEN
+    input_tokens = len(prompt) // CHARS_PER_TOKEN
+    data = {
+        "candidates": [
+            {"content": {"role": "model", "parts": parts}, "finish_reason": "STOP"}
+        ],
+        "model_version": model,
+        "usage_metadata": {
+            "prompt_token_count": input_tokens,
+            "candidates_token_count": output_tokens,
+            "total_token_count": input_tokens + output_tokens,
+        },
+    }
+    # The SDK's own response parsing, so .parsed matches a live call
+    return types.GenerateContentResponse._from_response(
+        response=data, kwargs={"config": {"response_schema": schema}}
+    )
+
+
+def _llm_error(model: str) -> errors.APIError:
+    body = {
+        "error": {
+            "code": FAKE_LLM_ERROR_CODE,
+            "message": f"Injected error for {model}",
+            "status": (
+                "RESOURCE_EXHAUSTED" if FAKE_LLM_ERROR_CODE == 429 else "UNAVAILABLE"
+            ),
+            "details": [
+                {
+                    "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                    "retryDelay": "1s",
+                }
+            ],
+        }
+    }
+    response = httpx.Response(FAKE_LLM_ERROR_CODE, json=body)
+    if FAKE_LLM_ERROR_CODE >= 500:
+        return errors.ServerError(FAKE_LLM_ERROR_CODE, response)
+    return errors.ClientError(FAKE_LLM_ERROR_CODE, response)
+
+
+def _llm_call_key(model, contents, config) -> tuple[str, str]:
+    kind = "image" if _is_image_request(config) else "llm"
+    return kind, cache_key(model, contents, config)
+
+
+class _FakeModels:
+    def generate_content(self, model, contents, config=None):
+        kind, key = _llm_call_key(model, contents, config)
+        if simulate_call(kind, key):
+            raise _llm_error(model)
+        return _fake_llm_response(model, contents, config, key)
+
+
+class _FakeAsyncModels:
+    async def generate_content(self, model, contents, config=None):
+        kind, key = _llm_call_key(model, contents, config)
+        if await simulate_call_async(kind, key):
+            raise _llm_error(model)
+        return _fake_llm_response(model, contents, config, key)
+
+
+class _FakeAio:
+    def __init__(self):
+        self.models = _FakeAsyncModels()
+
+
+class FakeGenAIClient:
+    """Stands in for genai.Client in llm_client."""
+
+    def __init__(self):
+        self.models = _FakeModels()
+        self.aio = _FakeAio()
+
+
+# Search
+
+
+class FakeTavilyClient:
+    """Stands in for AsyncTavilyClient; only search() is used."""
+
+    async def search(self, query: str, **kwargs) -> dict:
+        if await simulate_call_async("search", query):
+            raise RuntimeError(f"Injected search failure for '{query}'")
+        recorded = replay_fixture("search", query)
+        if recorded is not None:
+            return recorded
+        rng = content_rng("search", query)
+        results = [
+            {
+                "title": fake_title(rng),
+                "url": f"https://search.example.com/{_slug(fake_words(rng, 4))}",
+                "content": " ".join(fake_paragraphs(rng, 80)),
+                "score": round(rng.uniform(0.5, 1.0), 3),
+            }
+            for _ in range(5)
+        ]
+        return {
+            "query": query,
+            "follow_up_questions": None,
+            "answer": " ".join(fake_paragraphs(rng, 150)),
+            "images": [],
+            "results": results,
+        }
+
+
+# Storage
+
+
+class _FakeBucket:
+    def __init__(self, name: str):
+        self.name = name
+
+    def upload(self, path: str, file: bytes, file_options: dict | None = None):
+        if simulate_call("storage", f"{self.name}/{path}"):
+            raise RuntimeError(f"Injected storage failure for {path}")
+        full_path = os.path.join(FAKE_STORAGE_DIR, self.name, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(file)
+        return {"path": path}
+
+    def get_public_url(self, path: str) -> str:
+        return f"file://{os.path.join(FAKE_STORAGE_DIR, self.name, path)}"
+
+
+class _FakeStorage:
+    def from_(self, bucket: str) -> _FakeBucket:
+        return _FakeBucket(bucket)
+
+
+class FakeStorageClient:
+    """Stands in for the Supabase client's storage API."""
+
+    def __init__(self):
+        self.storage = _FakeStorage()
+
+
+# HTTP
+
+_FAKE_PAPER_SECTIONS = [
+    "Introduction",
+    "Related Work",
+    "Method",
+    "Experiments",
+    "Results",
+    "Discussion",
+    "Conclusion",
+]
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def _day_start() -> datetime:
+    # Dates are relative to the start of today, so a feed's body (and its
+    # ETag) stays the same all day while its items stay recent
+    return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _fake_rss(url: str) -> bytes:
+    rng = content_rng("rss", url)
+    host = urlparse(url).netloc
+    items = []
+    for i in range(FAKE_FEED_ITEMS):
+        title = fake_title(rng, rng.randint(5, 10))
+        published = _day_start() - timedelta(hours=rng.randint(0, 96))
+        items.append(
+            f"<item><title>{title}</title>"
+            f"<link>https://{host}/news/{_slug(title)}-{i}</link>"
+            f"<description>{fake_sentence(rng, 25)}</description>"
+            f"<pubDate>{format_datetime(published)}</pubDate></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>{host}</title><link>https://{host}/</link>"
+        f"<description>Fake feed</description>{''.join(items)}</channel></rss>"
+    ).encode("utf-8")
+
+
+def _fake_article_html(url: str) -> bytes:
+    rng = content_rng("page", url)
+    title = fake_title(rng, 8)
+    paragraphs = "".join(
+        f"<p>{p}</p>" for p in fake_paragraphs(rng, rng.randint(400, 900))
+    )
+    return (
+        f"<!DOCTYPE html><html><head><title>{title}</title></head><body>"
+        f"<nav><a href='/'>Home</a></nav><article><h1>{title}</h1>{paragraphs}</article>"
+        "<footer>Fake site footer</footer></body></html>"
+    ).encode("utf-8")
+
+
+def _fake_newsapi(url: str) -> dict:
+    rng = content_rng("newsapi", url)
+    articles = []
+    for i in range(20):
+        title = fake_title(rng, rng.randint(5, 10))
+        published = _day_start() - timedelta(hours=rng.randint(0, 96))
+        articles.append(
+            {
+                "source": {"name": f"Fake Source {i % 5}"},
+                "title": title,
+                "description": fake_sentence(rng, 25),
+                "url": f"https://newsapi-source-{i % 5}.example.com/{_slug(title)}",
+                "publishedAt": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }
+        )
+    return {"status": "ok", "totalResults": len(articles), "articles": articles}
+
+
+# Story ids are below this; comment ids are story id * 10 + n
+_HN_STORY_ID_BASE = 40_000_000
+
+
+def _fake_hn(path: str):
+    name = path.strip("/").removeprefix("v0/").removesuffix(".json")
+    if not name.startswith("item/"):
+        rng = content_rng("hn", name)
+        return rng.sample(range(_HN_STORY_ID_BASE, _HN_STORY_ID_BASE + 500), 60)
+    item_id = int(name.removeprefix("item/"))
+    rng = content_rng("hn", item_id)
+    if item_id >= _HN_STORY_ID_BASE * 10:
+        return {"id": item_id, "type": "comment", "text": fake_sentence(rng, 30)}
+    title = (
+        f"{fake_title(rng, rng.randint(4, 8))} {rng.choice(['AI', 'LLM', 'Agents'])}"
+    )
+    posted = _day_start() - timedelta(hours=rng.randint(0, 96))
+    return {
+        "id": item_id,
+        "type": "story",
+        "title": title,
+        "url": f"https://hn-linked-{item_id % 7}.example.com/{_slug(title)}",
+        "score": rng.randint(20, 800),
+        "time": int(posted.timestamp()),
+        "descendants": rng.randint(0, 300),
+        "kids": [item_id * 10 + n for n in range(3)],
+    }
+
+
+def _fake_arxiv_atom(url: str) -> bytes:
+    rng = content_rng("arxiv", url)
+    published = _day_start() - timedelta(days=rng.randint(1, 7))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+        f"<published>{published.strftime('%Y-%m-%dT%H:%M:%SZ')}</published>"
+        f"<title>{fake_title(rng)}</title></entry></feed>"
+    ).encode("utf-8")
+
+
+def _fake_papers_with_code(url: str) -> dict:
+    parsed = urlparse(url)
+    if parsed.path.rstrip("/").endswith("repositories"):
+        rng = content_rng("pwc-repos", parsed.path)
+        return {
+            "results": [
+                {
+                    "url": f"https://github.com/fake/{_slug(fake_words(rng, 2))}",
+                    "stars": rng.randint(0, 400),
+                }
+                for _ in range(rng.randint(0, 3))
+            ]
+        }
+    page = int(parse_qs(parsed.query).get("page", ["1"])[0])
+    rng = content_rng("pwc-papers", page)
+    # Pages go back a day each, newest first, like ordering=-published
+    day = _day_start() - timedelta(days=max(page - 20, 0))
+    results = []
+    for i in range(10):
+        paper_id = f"25{rng.randint(1, 12):02d}.{rng.randint(10000, 99999)}"
+        results.append(
+            {
+                "id": f"fake-paper-{page}-{i}",
+                "title": fake_title(rng, 8),
+                "url_pdf": f"https://arxiv.org/pdf/{paper_id}.pdf",
+                "published": (day - timedelta(hours=i)).strftime("%Y-%m-%d"),
+                "authors": ["A. Author", "B. Author"],
+            }
+        )
+    return {"results": results}
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def fake_pdf(rng: random.Random, words: int = FAKE_PAPER_WORDS) -> bytes:
+    """A text PDF laid out like a paper: title, abstract, numbered sections, references."""
+    lines = [fake_title(rng, 9), "", "Abstract", *fake_paragraphs(rng, 150)]
+    per_section = max(words // len(_FAKE_PAPER_SECTIONS), 100)
+    for number, heading in enumerate(_FAKE_PAPER_SECTIONS, 1):
+        lines += ["", f"{number} {heading}"]
+        for paragraph in fake_paragraphs(rng, per_section):
+            lines += ["", *_wrap(paragraph, 95)]
+    lines += ["", "References", "[1] A. Author. A cited paper. 2024."]
+
+    lines_per_page = 60
+    pages = [
+        lines[i : i + lines_per_page] for i in range(0, len(lines), lines_per_page)
+    ]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # page tree, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for page in pages:
+        text = "".join(f"({_pdf_escape(line)}) Tj T* " for line in page)
+        stream = f"BT /F1 9 Tf 11 TL 40 760 Td {text}ET".encode("latin-1", "replace")
+        objects.append(
+            b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return pdf
+
+
+def _wrap(text: str, width: int) -> list[str]:
+    lines, current = [], ""
+    for word in text.split():
+        if current and len(current) + len(word) + 1 > width:
+            lines.append(current)
+            current = word
+        else:
+            current = f"{current} {word}".strip()
+    if current:
+        lines.append(current)
+    return lines
+
+
+def fake_http_response(method: str, url: str) -> tuple[int, dict, bytes]:
+    """(status, headers, body) for a request to url: the recorded response if there is one, else a generated one."""
+    recorded = replay_fixture("http", f"{method} {url}")
+    if recorded is not None:
+        return (
+            recorded["status"],
+            recorded["headers"],
+            base64.b64decode(recorded["body_b64"]),
+        )
+    parsed = urlparse(url)
+    host, path = parsed.netloc.lower(), parsed.path.lower()
+    if method == "HEAD":
+        return 200, {"Content-Type": "text/html"}, b""
+    if host == "hacker-news.firebaseio.com":
+        content_type, body = "application/json", json.dumps(_fake_hn(parsed.path))
+    elif host == "newsapi.org":
+        content_type, body = "application/json", json.dumps(_fake_newsapi(url))
+    elif host == "export.arxiv.org":
+        content_type, body = "application/atom+xml", _fake_arxiv_atom(url)
+    elif host == "paperswithcode.com":
+        content_type, body = "application/json", json.dumps(_fake_papers_with_code(url))
+    elif path.endswith(".pdf"):
+        content_type, body = "application/pdf", fake_pdf(content_rng("pdf", path))
+    elif re.search(r"rss|feed|atom|\.xml$", path):
+        content_type, body = "application/rss+xml", _fake_rss(url)
+    else:
+        content_type, body = "text/html; charset=utf-8", _fake_article_html(url)
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    headers = {
+        "Content-Type": content_type,
+        "ETag": f'"{hashlib.md5(body).hexdigest()}"',
+    }
+    return 200, headers, body
+
+
+def _fake_exchange(
+    method: str, url: str, fail: bool, request_headers=None
+) -> tuple[int, dict, bytes]:
+    if fail:
+        return 503, {"Retry-After": "1"}, b"Injected failure"
+    status, headers, body = fake_http_response(method, url)
+    if_none_match = (request_headers or {}).get("If-None-Match")
+    if if_none_match and if_none_match == CIMultiDict(headers).get("ETag"):
+        return 304, headers, b""
+    return status, headers, body
+
+
+def fake_http_get(url: str, params=None, headers=None, **kwargs) -> requests.Response:
+    """Stands in for requests.get."""
+    url = url_with_params(url, params)
+    fail = simulate_call("http", url)
+    status, response_headers, body = _fake_exchange("GET", url, fail, headers)
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(response_headers)
+    response._content = body
+    response.url = url
+    response.encoding = "utf-8"
+    response.reason = "OK" if status < 400 else "Service Unavailable"
+    return response
+
+
+class _FakeAiohttpResponse:
+    def __init__(self, method: str, url: str, status: int, headers: dict, body: bytes):
+        self.method = method
+        self.url = URL(url)
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        return self._body.decode(encoding, errors="replace")
+
+    async def json(self, **kwargs):
+        return json.loads(self._body)
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                aiohttp.RequestInfo(self.url, self.method, self.headers, self.url),
+                (),
+                status=self.status,
+                message="Injected failure",
+                headers=self.headers,
+            )
+
+    def release(self) -> None:
+        pass
+
+
+class _FakeRequestContext:
+    def __init__(self, method: str, url: str, headers, timeout):
+        self._method = method
+        self._url = url
+        self._headers = headers
+        self._timeout = getattr(timeout, "total", None)
+
+    async def __aenter__(self) -> _FakeAiohttpResponse:
+        fail = await simulate_call_async("http", self._url, self._timeout)
+        status, headers, body = _fake_exchange(
+            self._method, self._url, fail, self._headers
+        )
+        return _FakeAiohttpResponse(self._method, self._url, status, headers, body)
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+
+class FakeHTTPSession:
+    """Stands in for aiohttp.ClientSession (get/head as async context managers)."""
+
+    def __init__(self, headers=None, **kwargs):
+        self.headers = headers or {}
+
+    def get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        return _FakeRequestContext(
+            "GET", url_with_params(str(url), params), headers, timeout
+        )
+
+    def head(self, url, headers=None, timeout=None, **kwargs):
+        return _FakeRequestContext("HEAD", str(url), headers, timeout)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "FakeHTTPSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+
+class _FakeCurlResponse:
+    def __init__(self, url: str, status: int, headers: dict, body: bytes):
+        self.url = url
+        self.status_code = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.content = body
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise CurlHTTPError(f"HTTP Error {self.status_code}: {self.url}")
+
+
+class FakeScrapeSession:
+    """Stands in for the curl_cffi AsyncSession used to scrape article pages."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    async def get(self, url, **kwargs) -> _FakeCurlResponse:
+        fail = await simulate_call_async("http", url)
+        status, headers, body = _fake_exchange("GET", url, fail, kwargs.get("headers"))
+        return _FakeCurlResponse(url, status, headers, body)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "FakeScrapeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Relative cost tiers, cheapest first. Stages in a pipeline should normally be
+# ordered so cheaper tiers run before more expensive ones.
+STAGE_COSTS = ("memory", "db", "network")
+
+
+@dataclass
+class FilterStage:
+    """A named step that takes a list of articles and returns the ones to keep.
+
+    `run` may be a plain function or a coroutine function; plain functions are
+    run in a worker thread so blocking I/O doesn't stall the event loop.
+    """
+
+    name: str
+    cost: str
+    run: Callable
+
+
+async def run_filter_stages(
+    articles: list[dict], stages: list[FilterStage]
+) -> tuple[list[dict], list[dict]]:
+    """Runs articles through stages in order.
+
+    Returns the surviving articles and one report dict per stage with input and
+    output counts and elapsed time.
+    """
+    reports = []
+    current = articles
+
+    for stage in stages:
+        start_time = time.time()
+        input_count = len(current)
+        if asyncio.iscoroutinefunction(stage.run):
+            current = await stage.run(current)
+        else:
+            current = await asyncio.to_thread(stage.run, current)
+        reports.append(
+            {
+                "name": stage.name,
+                "cost": stage.cost,
+                "input": input_count,
+                "output": len(current),
+                "dropped": input_count - len(current),
+                "elapsed": time.time() - start_time,
+            }
+        )
+
+    return current, reports
+
+
+def log_stage_savings(reports: list[dict]) -> None:
+    """Logs per-stage counts and how much work each stage saved the costlier stages after it."""
+    if not reports:
+        return
+
+    logger.info("=" * 60)
+    logger.info("FILTER_STAGES: PER-STAGE RESULTS")
+    logger.info("=" * 60)
+    for i, report in enumerate(reports):
+        # Articles dropped here never reach any later, more expensive stage
+        later_costs = {r["cost"] for r in reports[i + 1 :]}
+        saved = [
+            cost
+            for cost in later_costs
+            if STAGE_COSTS.index(cost) > STAGE_COSTS.index(report["cost"])
+        ]
+        savings = (
+            f" | Saved {report['dropped']} {'/'.join(sorted(saved, key=STAGE_COSTS.index))} checks"
+            if saved and report["dropped"]
+            else ""
+        )
+        logger.info(
+            f"{report['name']:<22} [{report['cost']:<7}] {report['input']:4d} -> {report['output']:4d} | Dropped: {report['dropped']:3d} | Time: {report['elapsed']:.2f}s{savings}"
+        )
+    logger.info("=" * 60)
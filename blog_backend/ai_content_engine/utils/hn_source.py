@@ -0,0 +1,232 @@
+"""Hacker News as a news source, via the official Firebase API.
+
+Adapted from the HNCollector in OLD/topic_discovery_agent.py: story lists are
+read once, then items (and a few top comments for context) are fetched
+concurrently under a semaphore. Only link stories about AI that clear a score
+threshold and fall within the requested timeframe are returned, in the same
+dict shape as the RSS and NewsAPI sources.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+from datetime import datetime, timedelta, timezone
+
+import aiohttp
+
+from ai_content_engine.utils.content_extractor import make_soup
+from ai_content_engine.utils.source_health import (
+    fetch_timeout,
+    record_fetch,
+    should_fetch,
+)
+
+logger = logging.getLogger(__name__)
+
+HN_SOURCE_NAME = "Hacker News"
+HN_BASE_URL = "https://hacker-news.firebaseio.com/v0"
+HN_ENABLED = os.getenv("HN_ENABLED", "True").lower() == "true"
+# topstories covers roughly the last day; beststories reaches further back
+HN_STORY_LISTS = os.getenv("HN_STORY_LISTS", "topstories,beststories").split(",")
+HN_STORIES_PER_LIST = int(os.getenv("HN_STORIES_PER_LIST", "100"))
+HN_MIN_SCORE = int(os.getenv("HN_MIN_SCORE", "100"))
+HN_COMMENTS_PER_STORY = int(os.getenv("HN_COMMENTS_PER_STORY", "2"))
+HN_MAX_CONCURRENCY = int(os.getenv("HN_MAX_CONCURRENCY", "10"))
+# Deadline for the whole fetch; stories not fetched by then are skipped
+HN_FETCH_TIMEOUT = float(os.getenv("HN_FETCH_TIMEOUT", "30"))
+HN_REQUEST_TIMEOUT = float(os.getenv("HN_REQUEST_TIMEOUT", "10"))
+HN_AI_PATTERN = re.compile(
+    os.getenv(
+        "HN_AI_PATTERN",
+        r"\b(AI|A\.I\.|LLMs?|GPT[\w.-]*|ChatGPT|Claude|Gemini|Llama|Mistral|Qwen|"
+        r"DeepSeek|OpenAI|Anthropic|DeepMind|machine learning|neural|transformers?|"
+        r"language models?|diffusion|agents?|inference|fine-?tun\w*)\b",
+    ),
+    re.IGNORECASE,
+)
+
+
+def clean_comment(comment: str, max_length: int = 200) -> str:
+    """Strips HTML from an HN comment and shortens it."""
+    if not comment:
+        return ""
+    text = make_soup(comment).get_text(separator=" ")
+    text = re.sub(r"\s+", " ", text).strip()
+    if len(text) > max_length:
+        text = text[:max_length] + "..."
+    return text
+
+
+async def _get_json(session, semaphore, path):
+    async with semaphore:
+        async with session.get(
+            f"{HN_BASE_URL}/{path}.json",
+            timeout=aiohttp.ClientTimeout(total=HN_REQUEST_TIMEOUT),
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+
+async def _get_story_list(session, semaphore, name):
+    """Fetches one story list; a failed list is logged and skipped, not fatal."""
+    try:
+        return await _get_json(session, semaphore, name)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning(f"HN_FETCH: Failed to fetch story list {name} | Error: {e}")
+        return None
+
+
+async def _get_item(session, semaphore, item_id):
+    """Fetches one item; a failed item is logged and skipped, not fatal."""
+    try:
+        return await _get_json(session, semaphore, f"item/{item_id}")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.debug(f"HN_FETCH: Failed to fetch item {item_id} | Error: {e}")
+        return None
+
+
+def _is_candidate(story, since):
+    """Link stories about AI above the score threshold, published since `since`."""
+    if not story or story.get("type") != "story" or story.get("dead"):
+        return False
+    if not story.get("url") or story.get("score", 0) < HN_MIN_SCORE:
+        return False
+    if datetime.fromtimestamp(story.get("time", 0), timezone.utc) < since:
+        return False
+    return bool(HN_AI_PATTERN.search(story.get("title", "")))
+
+
+async def _gather_until(coros, deadline):
+    """Runs coros concurrently; those unfinished at deadline are cancelled and give None."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    if not tasks:
+        return []
+    _, pending = await asyncio.wait(
+        tasks, timeout=max(0.0, deadline - time.monotonic())
+    )
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        logger.debug(
+            f"HN_FETCH: Deadline reached, skipping {len(pending)} unfinished requests"
+        )
+    return [None if task in pending else task.result() for task in tasks]
+
+
+async def _story_to_article(session, semaphore, story, deadline):
+    comments = []
+    kids = story.get("kids") or []
+    if HN_COMMENTS_PER_STORY and kids:
+        comment_items = await _gather_until(
+            (
+                _get_item(session, semaphore, kid_id)
+                for kid_id in kids[:HN_COMMENTS_PER_STORY]
+            ),
+            deadline,
+        )
+        comments = [
+            clean_comment(item.get("text", ""))
+            for item in comment_items
+            if item and item.get("text") and not item.get("deleted")
+        ]
+
+    description = f"Hacker News discussion ({story.get('score', 0)} points, {story.get('descendants', 0)} comments)."
+    if comments:
+        description += " Top comments: " + " | ".join(comments)
+
+    published = datetime.fromtimestamp(story["time"], timezone.utc)
+    return {
+        "title": story.get("title", "N/A"),
+        "link": story["url"],
+        "description": description,
+        "published_date": published.isoformat(),
+        "summary": description,
+        "source": HN_SOURCE_NAME,
+        "hn_url": f"https://news.ycombinator.com/item?id={story['id']}",
+        "hn_score": story.get("score", 0),
+    }
+
+
+async def _collect(session, days_ago, deadline):
+    """Returns (articles, story lists fetched); whatever is done by deadline is kept."""
+    semaphore = asyncio.Semaphore(HN_MAX_CONCURRENCY)
+    since = datetime.now(timezone.utc) - timedelta(days=days_ago)
+
+    story_lists = await _gather_until(
+        (
+            _get_story_list(session, semaphore, name.strip())
+            for name in HN_STORY_LISTS
+            if name.strip()
+        ),
+        deadline,
+    )
+    lists_fetched = sum(1 for story_list in story_lists if story_list is not None)
+    story_ids = list(
+        dict.fromkeys(
+            story_id
+            for story_list in story_lists
+            for story_id in (story_list or [])[:HN_STORIES_PER_LIST]
+        )
+    )
+    logger.debug(f"HN_FETCH: Checking {len(story_ids)} stories")
+
+    stories = await _gather_until(
+        (_get_item(session, semaphore, story_id) for story_id in story_ids), deadline
+    )
+    candidates = sorted(
+        (story for story in stories if _is_candidate(story, since)),
+        key=lambda story: story.get("score", 0),
+        reverse=True,
+    )
+    articles = await asyncio.gather(
+        *(
+            _story_to_article(session, semaphore, story, deadline)
+            for story in candidates
+        )
+    )
+    if time.monotonic() >= deadline:
+        logger.warning(
+            f"HN_FETCH: Deadline reached, returning partial results | Stories fetched: {sum(1 for story in stories if story)}/{len(story_ids)}"
+        )
+    return list(articles), lists_fetched
+
+
+async def fetch_from_hackernews(session, days_ago):
+    """Fetches AI stories from Hacker News using the shared aiohttp session."""
+    if not HN_ENABLED:
+        return []
+
+    due, reason = should_fetch(HN_SOURCE_NAME)
+    if not due:
+        logger.info(f"HN_FETCH: Skipping Hacker News ({reason})")
+        return []
+
+    start_time = time.time()
+    timeout = fetch_timeout(HN_SOURCE_NAME, HN_FETCH_TIMEOUT)
+    logger.info(
+        f"HN_FETCH: Starting Hacker News fetch | Lists: {HN_STORY_LISTS} | Min score: {HN_MIN_SCORE} | Days back: {days_ago}"
+    )
+
+    articles = []
+    ok, error = False, None
+    try:
+        articles, lists_fetched = await _collect(
+            session, days_ago, time.monotonic() + timeout
+        )
+        # Partial results count as a working source; no story list at all doesn't
+        ok = lists_fetched > 0
+        if not ok:
+            error = "No story list could be fetched"
+    except Exception as e:
+        error = str(e)
+        logger.error(f"HN_FETCH: Failed to fetch Hacker News | Error: {e}")
+
+    elapsed_time = time.time() - start_time
+    record_fetch(HN_SOURCE_NAME, elapsed_time, ok, error=error)
+    logger.info(
+        f"HN_FETCH: Completed Hacker News fetch | Found {len(articles)} articles | Time: {elapsed_time:.2f}s"
+    )
+    return articles
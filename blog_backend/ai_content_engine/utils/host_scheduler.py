@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def get_host(url: str) -> str:
+    """Returns the lowercased host of a URL (empty string if it has none)."""
+    return urlparse(url).netloc.lower()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a Retry-After header (delta-seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostScheduler:
+    """
+    Caps how many requests run at once, both overall and against a single host,
+    and keeps a minimum spacing between request starts on the same host.
+
+    Usage:
+        scheduler = HostScheduler(max_concurrency=20, max_per_host=4)
+        async with scheduler.slot(url):
+            ...  # make the request
+
+    When a host answers with a rate-limit response, call defer(url, seconds)
+    and every later slot() for that host waits until the deferral has passed.
+
+    Args:
+        max_concurrency: Maximum number of requests in flight across all hosts
+        max_per_host: Maximum number of requests in flight against one host
+        min_interval: Minimum seconds between two request starts on one host
+    """
+
+    def __init__(
+        self, max_concurrency: int = 20, max_per_host: int = 4, min_interval: float = 0
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self.min_interval = min_interval
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+        self._next_start: dict[str, float] = {}
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.max_per_host)
+        return self._hosts[host]
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Holds back new requests to url's host for the given number of seconds."""
+        host = get_host(url)
+        loop = asyncio.get_running_loop()
+        resume_at = loop.time() + seconds
+        if resume_at > self._next_start.get(host, 0):
+            self._next_start[host] = resume_at
+            logger.info(f"HOST_SCHEDULER: Deferring {host} for {seconds:.1f}s")
+
+    async def _wait_for_turn(self, host: str) -> None:
+        loop = asyncio.get_running_loop()
+        # Re-check after every sleep: a defer() may have pushed the time back
+        while (wait := self._next_start.get(host, 0) - loop.time()) > 0:
+            await asyncio.sleep(wait)
+        self._next_start[host] = loop.time() + self.min_interval
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Waits for a free per-host slot and the host's next start time, then a free global slot."""
+        host = get_host(url)
+        # Take the host slot first so a busy host never holds global capacity
+        # while it queues.
+        async with self._host_semaphore(host):
+            await self._wait_for_turn(host)
+            async with self._global:
+                yield
@@ -0,0 +1,164 @@
+"""Opt-in disk cache of LLM responses, keyed on everything that shapes the output.
+
+Reruns (force_regenerate, curated reprocessing, development iterations) send
+byte-identical requests; with LLM_CACHE_ENABLED the response to a request is
+stored once and replayed for later identical requests, without a call or a
+rate-limit wait. The key covers the model, system instruction, contents, the
+rest of the generation config and the response schema, so changing any of
+them (e.g. editing a prompt) misses the cache.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+
+import pydantic
+from google.genai import types
+
+from ai_content_engine.utils.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "False").lower() == "true"
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_HOURS", "168")) * 3600
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_MB", "200")) * 1024 * 1024
+
+_response_cache = (
+    DiskCache(
+        "llm_responses",
+        ttl_seconds=LLM_CACHE_TTL_SECONDS,
+        max_bytes=LLM_CACHE_MAX_BYTES,
+        compress=True,
+    )
+    if LLM_CACHE_ENABLED
+    else None
+)
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stores": 0}
+
+
+def _jsonable(value):
+    if isinstance(value, pydantic.BaseModel):
+        return value.model_dump(mode="json", exclude_none=True)
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    return repr(value)
+
+
+def _hash(value) -> str:
+    data = json.dumps(value, sort_keys=True, default=_jsonable)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _schema_fingerprint(schema) -> str | None:
+    """JSON schema of a response schema, so changing the model's fields misses the cache."""
+    if schema is None:
+        return None
+    if inspect.isclass(schema) and issubclass(schema, pydantic.BaseModel):
+        return _hash(schema.model_json_schema())
+    try:
+        return _hash(pydantic.TypeAdapter(schema).json_schema())
+    except Exception:
+        return _hash(schema)
+
+
+def cache_key(model: str, contents, config: types.GenerateContentConfig | None) -> str:
+    """Cache key for a generate_content request."""
+    system_instruction = config.system_instruction if config is not None else None
+    response_schema = config.response_schema if config is not None else None
+    other_config = (
+        config.model_dump(
+            mode="json",
+            exclude_none=True,
+            exclude={"system_instruction", "response_schema", "http_options"},
+        )
+        if config is not None
+        else None
+    )
+    return _hash(
+        {
+            "model": model,
+            "system_instruction": _hash(system_instruction),
+            "contents": _hash(contents),
+            "config": other_config,
+            "response_schema": _schema_fingerprint(response_schema),
+        }
+    )
+
+
+def _count(stat: str) -> None:
+    with _stats_lock:
+        _stats[stat] += 1
+
+
+def get_cached_response(
+    key: str, config: types.GenerateContentConfig | None
+) -> types.GenerateContentResponse | None:
+    """The stored response for key, with .parsed rebuilt from the config's schema."""
+    if _response_cache is None:
+        return None
+    data = _response_cache.get(key)
+    if data is None:
+        _count("misses")
+        return None
+    _count("hits")
+    schema = config.response_schema if config is not None else None
+    # The SDK's own response parsing, so .parsed matches a live call
+    return types.GenerateContentResponse._from_response(
+        response=data, kwargs={"config": {"response_schema": schema}}
+    )
+
+
+def _is_complete(
+    response: types.GenerateContentResponse, config: types.GenerateContentConfig | None
+) -> bool:
+    """True if the response finished normally and, with a schema, parsed."""
+    if not response.candidates:
+        return False
+    if response.candidates[0].finish_reason != types.FinishReason.STOP:
+        return False
+    schema = config.response_schema if config is not None else None
+    return schema is None or response.parsed is not None
+
+
+def store_response(
+    key: str,
+    response: types.GenerateContentResponse,
+    config: types.GenerateContentConfig | None = None,
+) -> None:
+    """Stores a response, unless it is blocked, empty, truncated or unparseable.
+
+    A stored bad response would be replayed to every retry of the request.
+    """
+    if _response_cache is None or not _is_complete(response, config):
+        return
+    data = response.to_json_dict()
+    data.pop("parsed", None)
+    _response_cache.set(key, data)
+    _count("stores")
+
+
+def get_llm_cache_stats() -> dict:
+    """Hit/miss counts since the process started, plus the cache's current size."""
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else None
+    stats["enabled"] = LLM_CACHE_ENABLED
+    if _response_cache is not None:
+        stats["entries"] = len(_response_cache.keys())
+        stats["size_bytes"] = _response_cache.total_bytes()
+    return stats
+
+
+def clear_llm_cache() -> int:
+    """Deletes all cached responses and returns how many there were."""
+    if _response_cache is None:
+        return 0
+    removed = _response_cache.clear()
+    logger.info(f"LLM_CACHE: Cleared {removed} cached responses")
+    return removed
@@ -0,0 +1,251 @@
+"""Process-wide Gemini client shared by all agents.
+
+The client is created on first use instead of at import, so the agents import
+fine without GEMINI_API_KEY (the key is only required once a call is made),
+and every agent goes through the same client. generate_content and
+generate_content_async are the one path LLM calls take, which makes them the
+place to apply timeouts and any other per-call policy.
+
+Calls are admitted through the per-model rate limiter (see rate_limiter.py).
+A 429 from the API pauses that model in the limiter and the call is retried
+once the pause is over, up to LLM_RATE_LIMIT_RETRIES times.
+
+With LLM_CACHE_ENABLED, identical requests are answered from the response
+cache (see llm_cache.py) before reaching the limiter; pass cache=False to
+bypass it for a call.
+
+Every request attempt, including failed ones and 429 retries, is recorded in
+the active usage ledgers (see llm_usage.py).
+
+With "llm" in FAKE_PROVIDERS the shared client is an offline fake (see
+providers.py) and no key is needed. Live responses are recorded as
+fixtures when RECORD_FIXTURES_DIR is set.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+
+from dotenv import load_dotenv
+from google import genai
+from google.api_core.exceptions import ResourceExhausted, TooManyRequests
+from google.genai import errors, types
+
+from ai_content_engine.utils.llm_cache import (
+    LLM_CACHE_ENABLED,
+    cache_key,
+    get_cached_response,
+    store_response,
+)
+from ai_content_engine.utils.llm_usage import record_llm_call
+from ai_content_engine.utils.providers import (
+    record_fixture,
+    recording_fixtures,
+    use_fake,
+)
+from ai_content_engine.utils.rate_limiter import llm_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# Per-request timeout for Gemini calls (0 = the SDK's default, no timeout)
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "300"))
+LLM_RATE_LIMIT_RETRIES = int(os.getenv("LLM_RATE_LIMIT_RETRIES", "3"))
+# Output tokens reserved for calls that don't set max_output_tokens
+DEFAULT_OUTPUT_TOKENS = 1024
+CHARS_PER_TOKEN = 4
+
+_client: genai.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> genai.Client:
+    """Returns the shared Gemini client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None and use_fake("llm"):
+                from ai_content_engine.utils.fake_providers import FakeGenAIClient
+
+                _client = FakeGenAIClient()
+                logger.debug("LLM_CLIENT: Created fake Gemini client")
+            if _client is None:
+                api_key = os.getenv("GEMINI_API_KEY")
+                if not api_key:
+                    raise ValueError("GEMINI_API_KEY environment variable is not set")
+                http_options = None
+                if LLM_TIMEOUT_SECONDS > 0:
+                    # The SDK takes the timeout in milliseconds
+                    http_options = types.HttpOptions(
+                        timeout=int(LLM_TIMEOUT_SECONDS * 1000)
+                    )
+                _client = genai.Client(api_key=api_key, http_options=http_options)
+                logger.debug("LLM_CLIENT: Created shared Gemini client")
+    return _client
+
+
+def reset_client() -> None:
+    """Drops the shared client so the next call builds a new one (e.g. after a key change)."""
+    global _client
+    with _client_lock:
+        _client = None
+
+
+def _estimate_tokens(contents, config: types.GenerateContentConfig | None) -> int:
+    """Rough token count of a request: its text inputs plus the output it may produce."""
+    if not isinstance(contents, list):
+        contents = [contents]
+    texts = [item for item in contents if isinstance(item, str)]
+    if config is not None and isinstance(config.system_instruction, str):
+        texts.append(config.system_instruction)
+    input_tokens = sum(len(text) for text in texts) // CHARS_PER_TOKEN
+    max_output = config.max_output_tokens if config is not None else None
+    return input_tokens + (max_output or DEFAULT_OUTPUT_TOKENS)
+
+
+def _is_rate_limit_error(e: Exception) -> bool:
+    if isinstance(e, (TooManyRequests, ResourceExhausted)):
+        return True
+    return isinstance(e, errors.APIError) and e.code == 429
+
+
+def _retry_delay(e: Exception) -> float | None:
+    """The retry delay the API suggested in a 429 response, if any."""
+    details = getattr(e, "details", None)
+    if not isinstance(details, dict):
+        return None
+    for detail in details.get("error", details).get("details", []) or []:
+        delay = detail.get("retryDelay") if isinstance(detail, dict) else None
+        match = re.fullmatch(r"(\d+(?:\.\d+)?)s", delay or "")
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def _error_label(e: BaseException) -> str:
+    """How a failed attempt is labelled in the usage ledgers."""
+    if isinstance(e, asyncio.CancelledError):
+        return "cancelled"
+    return "rate_limited" if _is_rate_limit_error(e) else type(e).__name__
+
+
+def _settle_usage(model: str, reserved: int, response) -> None:
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None and usage.total_token_count is not None:
+        llm_rate_limiter.settle(model, reserved, usage.total_token_count)
+
+
+def _handle_rate_limit(model: str, reserved: int, attempt: int, e: Exception) -> None:
+    """Pauses the model in the limiter, or re-raises once retries are used up."""
+    # A rejected request used no tokens, so hand its reservation back
+    llm_rate_limiter.settle(model, reserved, 0)
+    if attempt == LLM_RATE_LIMIT_RETRIES:
+        logger.error(
+            f"LLM_CLIENT: {model} still rate limited after {attempt + 1} attempts"
+        )
+        raise e
+    llm_rate_limiter.backoff(model, _retry_delay(e))
+
+
+def _cache_lookup_key(model, contents, config, cache: bool) -> str | None:
+    if not (cache and LLM_CACHE_ENABLED):
+        return None
+    return cache_key(model, contents, config)
+
+
+def _record_fixture(model, contents, config, key: str | None, cache: bool, response):
+    """Saves a live response for replay by the fakes (see providers.py); not image calls."""
+    if not (cache and recording_fixtures("llm")):
+        return
+    data = response.to_json_dict()
+    data.pop("parsed", None)
+    record_fixture("llm", key or cache_key(model, contents, config), data)
+
+
+def generate_content(
+    model: str,
+    contents,
+    config: types.GenerateContentConfig | None = None,
+    cache: bool = True,
+) -> types.GenerateContentResponse:
+    """Blocking generate_content call through the shared client and rate limiter."""
+    start_time = time.time()
+    key = _cache_lookup_key(model, contents, config, cache)
+    if key is not None and (cached := get_cached_response(key, config)):
+        logger.debug(f"LLM_CACHE: Hit for {model}")
+        record_llm_call(model, cached, time.time() - start_time, cached=True)
+        return cached
+
+    reserved = _estimate_tokens(contents, config)
+    for attempt in range(LLM_RATE_LIMIT_RETRIES + 1):
+        attempt_start = time.time()
+        llm_rate_limiter.acquire(model, reserved)
+        try:
+            response = get_client().models.generate_content(
+                model=model, contents=contents, config=config
+            )
+        except Exception as e:
+            record_llm_call(
+                model,
+                None,
+                time.time() - attempt_start,
+                retry=attempt > 0,
+                error=_error_label(e),
+            )
+            if not _is_rate_limit_error(e):
+                raise
+            _handle_rate_limit(model, reserved, attempt, e)
+            continue
+        _settle_usage(model, reserved, response)
+        record_llm_call(model, response, time.time() - attempt_start, retry=attempt > 0)
+        if key is not None:
+            store_response(key, response, config)
+        _record_fixture(model, contents, config, key, cache, response)
+        return response
+
+
+async def generate_content_async(
+    model: str,
+    contents,
+    config: types.GenerateContentConfig | None = None,
+    cache: bool = True,
+) -> types.GenerateContentResponse:
+    """Async generate_content call through the shared client and rate limiter."""
+    start_time = time.time()
+    key = _cache_lookup_key(model, contents, config, cache)
+    if key is not None and (cached := get_cached_response(key, config)):
+        logger.debug(f"LLM_CACHE: Hit for {model}")
+        record_llm_call(model, cached, time.time() - start_time, cached=True)
+        return cached
+
+    reserved = _estimate_tokens(contents, config)
+    for attempt in range(LLM_RATE_LIMIT_RETRIES + 1):
+        attempt_start = time.time()
+        await llm_rate_limiter.acquire_async(model, reserved)
+        try:
+            response = await get_client().aio.models.generate_content(
+                model=model, contents=contents, config=config
+            )
+        except (Exception, asyncio.CancelledError) as e:
+            # A request cancelled by a caller's deadline may still be billed
+            record_llm_call(
+                model,
+                None,
+                time.time() - attempt_start,
+                retry=attempt > 0,
+                error=_error_label(e),
+            )
+            if not _is_rate_limit_error(e):
+                raise
+            _handle_rate_limit(model, reserved, attempt, e)
+            continue
+        _settle_usage(model, reserved, response)
+        record_llm_call(model, response, time.time() - attempt_start, retry=attempt > 0)
+        if key is not None:
+            store_response(key, response, config)
+        _record_fixture(model, contents, config, key, cache, response)
+        return response
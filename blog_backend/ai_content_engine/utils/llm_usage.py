@@ -0,0 +1,144 @@
+"""Token, cost and latency accounting for LLM calls.
+
+llm_client records every request attempt (model, input/output tokens,
+latency, whether it was a retry or a cache hit, and the error if it failed)
+into the usage ledgers active in the current context. A call that succeeds
+after two 429s is three records: two failed ones and a retried success. Ledgers are opened with track_llm_usage() and nest: a call made
+while generating one post inside a job run is counted in both the post's and
+the job's ledger. The context is a contextvar, so it follows asyncio tasks
+and asyncio.to_thread calls started inside the `with` block.
+"""
+
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# USD per million (input, output) tokens. The image model's output rate
+# approximates its per-image price.
+MODEL_PRICING = {
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.0-flash-lite": (0.075, 0.30),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gemini-2.0-flash-preview-image-generation": (0.10, 30.00),
+}
+
+
+@dataclass
+class LLMCallRecord:
+    model: str
+    input_tokens: int
+    output_tokens: int
+    latency: float  # seconds, including the rate-limit wait before the attempt
+    retry: bool = False
+    cached: bool = False
+    error: str | None = None  # "rate_limited", "cancelled" or the exception type
+
+    @property
+    def cost_usd(self) -> float:
+        """Billed cost of the call; cache hits cost nothing."""
+        if self.cached:
+            return 0.0
+        input_price, output_price = MODEL_PRICING.get(self.model, (0.0, 0.0))
+        return (
+            self.input_tokens * input_price + self.output_tokens * output_price
+        ) / 1_000_000
+
+
+@dataclass
+class UsageLedger:
+    """LLM calls recorded while the ledger was active."""
+
+    label: str | None = None
+    records: list[LLMCallRecord] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, record: LLMCallRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self) -> dict:
+        """Totals over all calls, plus the same totals per model."""
+        with self._lock:
+            records = list(self.records)
+        summary = _totals(records)
+        summary["by_model"] = {
+            model: _totals([r for r in records if r.model == model])
+            for model in sorted({r.model for r in records})
+        }
+        return summary
+
+
+def _totals(records: list[LLMCallRecord]) -> dict:
+    return {
+        "calls": len(records),
+        "cached_calls": sum(1 for r in records if r.cached),
+        "input_tokens": sum(r.input_tokens for r in records),
+        "output_tokens": sum(r.output_tokens for r in records),
+        "cost_usd": round(sum(r.cost_usd for r in records), 6),
+        "latency_seconds": round(sum(r.latency for r in records), 3),
+        "retries": sum(1 for r in records if r.retry),
+        "failed_calls": sum(1 for r in records if r.error),
+    }
+
+
+_active_ledgers: contextvars.ContextVar[tuple[UsageLedger, ...]] = (
+    contextvars.ContextVar("active_usage_ledgers", default=())
+)
+
+
+@contextmanager
+def track_llm_usage(label: str | None = None):
+    """Collects the LLM calls made inside the block into a new ledger, which is yielded."""
+    ledger = UsageLedger(label)
+    token = _active_ledgers.set(_active_ledgers.get() + (ledger,))
+    try:
+        yield ledger
+    finally:
+        _active_ledgers.reset(token)
+        if label:
+            summary = ledger.summary()
+            logger.info(
+                f"LLM_USAGE: [{label}] {summary['calls']} calls | {summary['input_tokens']} in / {summary['output_tokens']} out tokens | ${summary['cost_usd']:.4f} | {summary['latency_seconds']:.1f}s"
+            )
+
+
+def record_llm_call(
+    model: str,
+    response,
+    latency: float,
+    retry: bool = False,
+    cached: bool = False,
+    error: str | None = None,
+) -> None:
+    """Adds a request attempt to every active ledger (no-op outside track_llm_usage).
+
+    response is None for a failed attempt, which is counted with no tokens.
+    """
+    ledgers = _active_ledgers.get()
+    if not ledgers:
+        return
+    usage = getattr(response, "usage_metadata", None)
+    input_tokens = getattr(usage, "prompt_token_count", None) or 0
+    total_tokens = getattr(usage, "total_token_count", None)
+    # Billed output includes thinking tokens, which candidates_token_count leaves out
+    output_tokens = (
+        total_tokens - input_tokens
+        if total_tokens
+        else getattr(usage, "candidates_token_count", None) or 0
+    )
+    record = LLMCallRecord(
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        latency=latency,
+        retry=retry,
+        cached=cached,
+        error=error,
+    )
+    for ledger in ledgers:
+        ledger.add(record)
@@ -0,0 +1,213 @@
+"""Near-duplicate story detection for news candidates using MinHash + LSH.
+
+The same announcement usually arrives from the lab's own feed plus several
+outlets and NewsAPI, each with a different link and slightly different
+wording. Exact link dedup can't catch that, so candidates are compared on
+shingles of their normalized title and description instead.
+"""
+
+import logging
+import os
+import random
+import re
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+# Estimated Jaccard similarity at or above which two items count as one story
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.5"))
+
+NUM_PERM = 64
+LSH_BANDS = 16  # 16 bands x 4 rows catches pairs from roughly 0.4 similarity up
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1337)  # fixed seed keeps clustering deterministic
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has",
+    "have", "in", "is", "it", "its", "new", "of", "on", "or", "that", "the",
+    "this", "to", "was", "were", "will", "with", "via", "how", "what", "why",
+    "about", "into", "over", "up", "now", "just", "after", "says", "say",
+}  # fmt: skip
+
+
+def normalize_tokens(text: str) -> list[str]:
+    """Lowercased word tokens of text with common stopwords removed."""
+    text = (text or "").lower()
+    if text == "n/a":
+        return []
+    tokens = re.findall(r"[a-z0-9]+(?:[.-][a-z0-9]+)*", text)
+    return [token for token in tokens if token not in _STOPWORDS]
+
+
+def shingle(title: str, description: str = "") -> set[str]:
+    """Builds the shingle set for a news item.
+
+    Title words are used individually (titles are short and reworded between
+    outlets); descriptions contribute word bigrams.
+    """
+    title_tokens = normalize_tokens(title)
+    desc_tokens = normalize_tokens(description)
+    shingles = {f"t:{token}" for token in title_tokens}
+    shingles.update(f"d:{a} {b}" for a, b in zip(desc_tokens, desc_tokens[1:]))
+    return shingles
+
+
+def minhash(shingles: set[str]) -> tuple[int, ...] | None:
+    """Returns the MinHash signature of a shingle set, or None if it is empty.
+
+    Items without shingles (non-Latin or all-stopword titles) have nothing to
+    compare on, so they get no signature rather than a shared one that would
+    make them all look identical.
+    """
+    if not shingles:
+        return None
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS
+    )
+
+
+def estimate_similarity(sig_a: tuple[int, ...], sig_b: tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity between two MinHash signatures."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+def _candidate_pairs(
+    signatures: list[tuple[int, ...] | None],
+) -> set[tuple[int, int]]:
+    """Index pairs that share at least one LSH band; items without a signature are skipped."""
+    rows = NUM_PERM // LSH_BANDS
+    pairs = set()
+    for band in range(LSH_BANDS):
+        buckets: dict[tuple[int, ...], list[int]] = {}
+        for i, sig in enumerate(signatures):
+            if sig is None:
+                continue
+            buckets.setdefault(sig[band * rows : (band + 1) * rows], []).append(i)
+        for members in buckets.values():
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    pairs.add((members[x], members[y]))
+    return pairs
+
+
+def _previous_item_text(item: dict) -> tuple[str, str]:
+    """Title and description of a previously published news post (or article dict)."""
+    ai_metadata = item.get("ai_metadata") if isinstance(item, dict) else {}
+    if not isinstance(ai_metadata, dict):
+        ai_metadata = {}
+    title = (
+        ai_metadata.get("original_article_title")
+        or item.get("title")
+        or item.get("headline")
+        or ""
+    )
+    description = item.get("summary") or item.get("description") or ""
+    return title, description
+
+
+def _canonical_rank(article: dict) -> tuple:
+    """Sort key for choosing a cluster's representative (smallest wins).
+
+    Prefers primary sources (feeds over NewsAPI aggregations), then the richer
+    description, then the earliest publication.
+    """
+    is_aggregated = "via NewsAPI" in (article.get("source") or "")
+    description = article.get("description") or ""
+    published = article.get("published_date") or "N/A"
+    return (is_aggregated, -len(description), published == "N/A", published)
+
+
+def cluster_near_duplicates(
+    articles: list[dict],
+    previous_issue_articles: list[dict] | None = None,
+    threshold: float = NEAR_DUPLICATE_THRESHOLD,
+) -> list[dict]:
+    """Collapses near-duplicate stories to one representative each.
+
+    The other members of a cluster are attached to the representative as
+    "alternate_sources". Representatives that look like a story from the
+    previous issue get "near_duplicate_of_previous" set to that item's title.
+    Items with no shingles are kept as they are, never clustered or flagged.
+    """
+    start_time = time.time()
+    logger.info(
+        f"NEAR_DUP: Starting near-duplicate clustering | Input articles: {len(articles)} | Threshold: {threshold}"
+    )
+    if not articles:
+        return []
+
+    signatures = [
+        minhash(shingle(a.get("title", ""), a.get("description", ""))) for a in articles
+    ]
+
+    # Union-find over LSH candidate pairs that clear the threshold
+    parent = list(range(len(articles)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in _candidate_pairs(signatures):
+        if estimate_similarity(signatures[i], signatures[j]) >= threshold:
+            parent[find(i)] = find(j)
+
+    clusters: dict[int, list[int]] = {}
+    for i in range(len(articles)):
+        clusters.setdefault(find(i), []).append(i)
+
+    representatives = []
+    for members in sorted(clusters.values(), key=min):
+        ordered = sorted(members, key=lambda i: _canonical_rank(articles[i]))
+        canonical = articles[ordered[0]]
+        if len(ordered) > 1:
+            canonical["alternate_sources"] = [
+                {
+                    "title": articles[i].get("title"),
+                    "link": articles[i].get("link"),
+                    "source": articles[i].get("source"),
+                }
+                for i in ordered[1:]
+            ]
+            logger.info(
+                f"NEAR_DUP: Clustered {len(ordered)} items | Kept: {canonical.get('source')} '{canonical.get('title', '')[:60]}' | Alternates: {[articles[i].get('source') for i in ordered[1:]]}"
+            )
+        representatives.append((ordered[0], canonical))
+
+    flagged = 0
+    if previous_issue_articles:
+        previous = []
+        for item in previous_issue_articles:
+            title, description = _previous_item_text(item)
+            signature = minhash(shingle(title, description)) if title else None
+            if signature is not None:
+                previous.append((title, signature))
+
+        for index, article in representatives:
+            if signatures[index] is None:
+                continue
+            best_title, best_similarity = None, 0.0
+            for title, signature in previous:
+                similarity = estimate_similarity(signatures[index], signature)
+                if similarity > best_similarity:
+                    best_title, best_similarity = title, similarity
+            if best_similarity >= threshold:
+                article["near_duplicate_of_previous"] = best_title
+                flagged += 1
+                logger.info(
+                    f"NEAR_DUP: Possible repeat of previous issue | Candidate: '{article.get('title', '')[:60]}' | Previous: '{best_title[:60]}' | Similarity: {best_similarity:.2f}"
+                )
+
+    result = [article for _, article in representatives]
+    elapsed_time = time.time() - start_time
+    logger.info(
+        f"NEAR_DUP: Completed | Stories: {len(result)} | Collapsed: {len(articles) - len(result)} | Flagged as previous-issue repeats: {flagged} | Time: {elapsed_time:.2f}s"
+    )
+    return result
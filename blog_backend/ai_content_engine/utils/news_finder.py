@@ -1,21 +1,51 @@
 import os
 import requests
 import logging
+import aiohttp
 import feedparser
-import trafilatura
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
-from curl_cffi import requests as cffi_requests
-from google import genai
+from curl_cffi import CurlHttpVersion
 from google.genai import types
 from datetime import datetime, timedelta, timezone
 import asyncio
+import functools
+import math
 import time
 from urllib.parse import quote
 
 from ai_content_engine.prompts import news_filter_prompt
 from ai_content_engine.models import NewsItemSelected
 from ai_content_engine.utils.retry_decorator import exponential_backoff_retry
+from ai_content_engine.utils.llm_client import generate_content_async
+from ai_content_engine.utils.disk_cache import DiskCache
+from ai_content_engine.utils.host_scheduler import (
+    HostScheduler,
+    get_host,
+    parse_retry_after,
+)
+from ai_content_engine.utils.content_extractor import (
+    extract_article_text_async,
+    make_soup,
+)
+from ai_content_engine.utils.filter_stages import (
+    FilterStage,
+    run_filter_stages,
+    log_stage_savings,
+)
+from ai_content_engine.utils.near_duplicates import cluster_near_duplicates
+from ai_content_engine.utils.hn_source import HN_SOURCE_NAME, fetch_from_hackernews
+from ai_content_engine.utils.providers import http_session, scrape_session
+from ai_content_engine.utils.source_health import (
+    fetch_timeout,
+    record_fetch,
+    record_yield,
+    should_fetch,
+)
+from ai_content_engine.utils.news_ranker import (
+    NEWS_RANKER_ARCHIVE_SIZE,
+    prerank_articles,
+    record_curation_run,
+)
 
 load_dotenv()
 
@@ -38,6 +68,63 @@ RSS_FEEDS = {
 
 NUM_ARTICLES_TO_FETCH_NEWSAPI = 20
 
+# Per-source request timeouts (seconds) for the concurrent fetch stage
+RSS_FETCH_TIMEOUT = float(os.getenv("RSS_FETCH_TIMEOUT", "20"))
+NEWSAPI_FETCH_TIMEOUT = float(os.getenv("NEWSAPI_FETCH_TIMEOUT", "20"))
+
+# ETag/Last-Modified validators plus parsed entries per feed URL, used for
+# conditional GETs on the next run
+FEED_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_feed_cache = DiskCache("rss_feeds", ttl_seconds=FEED_CACHE_TTL_SECONDS)
+
+# URL validation: concurrency caps, request timeout and how long a HEAD
+# result (status + final redirect URL) is trusted before re-checking
+URL_VALIDATION_TIMEOUT = float(os.getenv("URL_VALIDATION_TIMEOUT", "5"))
+URL_VALIDATION_MAX_CONCURRENCY = int(os.getenv("URL_VALIDATION_MAX_CONCURRENCY", "20"))
+URL_VALIDATION_MAX_PER_HOST = int(os.getenv("URL_VALIDATION_MAX_PER_HOST", "4"))
+URL_VALIDATION_CACHE_TTL_SECONDS = (
+    float(os.getenv("URL_VALIDATION_CACHE_TTL_HOURS", "48")) * 3600
+)
+_validation_cache = DiskCache(
+    "url_validation", ttl_seconds=URL_VALIDATION_CACHE_TTL_SECONDS
+)
+
+# Scraped article HTML and extracted text, keyed by URL, so reruns (including
+# force_regenerate) and articles that reappear across days skip the network
+SCRAPE_CACHE_TTL_SECONDS = float(os.getenv("SCRAPE_CACHE_TTL_HOURS", "72")) * 3600
+SCRAPE_CACHE_MAX_BYTES = int(os.getenv("SCRAPE_CACHE_MAX_MB", "200")) * 1024 * 1024
+_scrape_cache = DiskCache(
+    "scraped_articles",
+    ttl_seconds=SCRAPE_CACHE_TTL_SECONDS,
+    max_bytes=SCRAPE_CACHE_MAX_BYTES,
+    compress=True,
+)
+
+# Scrape politeness: overall and per-publisher concurrency, minimum spacing
+# between requests to one host, and how long to back off a host that answers
+# with a rate-limit status (Retry-After is honoured up to the max)
+SCRAPE_MAX_CONCURRENCY = int(os.getenv("SCRAPE_MAX_CONCURRENCY", "8"))
+SCRAPE_MAX_PER_HOST = int(os.getenv("SCRAPE_MAX_PER_HOST", "2"))
+SCRAPE_MIN_HOST_INTERVAL = float(os.getenv("SCRAPE_MIN_HOST_INTERVAL", "1.0"))
+SCRAPE_RATE_LIMIT_STATUSES = {403, 429, 503}
+SCRAPE_IMPERSONATE = os.getenv("SCRAPE_IMPERSONATE", "chrome120")
+SCRAPE_HTTP2 = os.getenv("SCRAPE_HTTP2", "True").lower() == "true"
+SCRAPE_RATE_LIMIT_COOLDOWN = 10.0
+SCRAPE_MAX_RETRY_AFTER = 60.0
+
+# Candidate sets larger than this are curated in parallel chunks followed by a
+# merge round (0 = always a single request)
+LLM_CURATION_CHUNK_SIZE = int(os.getenv("LLM_CURATION_CHUNK_SIZE", "40"))
+
+# Order of the pre-LLM filter stages (see build_filter_stages). Cheap
+# in-memory and DB-backed filters run first so network validation only
+# sees their survivors. near_duplicates compares titles and descriptions
+# only, so it runs before validation too.
+NEWS_FILTER_STAGES = os.getenv(
+    "NEWS_FILTER_STAGES",
+    "format,deduplicate,near_duplicates,processed,validate,deduplicate_redirects,prerank",
+).split(",")
+
 # Log configuration at startup
 logger.info(
     f"NEWS_FINDER: Initialized with {len(RSS_FEEDS)} RSS feeds and NewsAPI {'enabled' if NEWSAPI_KEY and NEWSAPI_KEY != 'YOUR_NEWSAPI_KEY' else 'disabled'}"
@@ -86,77 +173,175 @@ def is_within_timeframe(article_date, days_ago):
 def clean_html(html_content):
     """Removes HTML tags from a string."""
     if html_content:
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = make_soup(html_content)
         return soup.get_text(separator=" ", strip=True)
     return "N/A"
 
 
-def fetch_from_rss(feed_name, feed_url, days_ago):
-    """Fetches and filters articles from a given RSS feed."""
+def _parse_feed_entries(feed_name, body, response_headers=None):
+    """Parses a raw RSS/Atom document into article dicts (no timeframe filtering)."""
+    feed = feedparser.parse(body, response_headers=response_headers)
+    logger.debug(f"RSS_FETCH: {feed_name} returned {len(feed.entries)} total entries")
+
+    if feed.bozo:
+        logger.warning(
+            f"RSS_FETCH: Feed parser warning for {feed_name} | Error: {feed.bozo_exception}"
+        )
+
+    entries = []
+    for entry in feed.entries:
+        pub_date = parse_rss_date(getattr(entry, "published_parsed", None))
+        entries.append(
+            {
+                "title": getattr(entry, "title", "N/A"),
+                "link": getattr(entry, "link", "N/A"),
+                "description": clean_html(getattr(entry, "description", "N/A")),
+                "published_date": pub_date.isoformat() if pub_date else "N/A",
+                "summary": getattr(
+                    entry, "summary", getattr(entry, "description", "N/A")
+                ),
+                "source": feed_name,
+            }
+        )
+    return entries
+
+
+def _entries_within_timeframe(feed_name, entries, days_ago):
+    """Returns copies of the parsed feed entries published within the last days_ago days."""
+    articles = []
+    for entry in entries:
+        title = entry["title"]
+        link = entry["link"]
+        pub_date = (
+            datetime.fromisoformat(entry["published_date"])
+            if entry["published_date"] != "N/A"
+            else None
+        )
+        if is_within_timeframe(pub_date, days_ago):
+            logger.debug(
+                f"RSS_FETCH: Including article from {feed_name} | Title: '{title[:60]}...' | URL: {link}"
+            )
+            articles.append(dict(entry))
+        else:
+            logger.debug(
+                f"RSS_FETCH: Excluding article from {feed_name} (outside timeframe) | Title: '{title[:60]}...' | Date: {pub_date}"
+            )
+    return articles
+
+
+async def fetch_from_rss(session, feed_name, feed_url, days_ago):
+    """Fetches and filters articles from a given RSS feed.
+
+    Sends the ETag/Last-Modified validators stored from the previous run, so an
+    unchanged feed answers 304 and its cached entries are reused instead of
+    being downloaded and parsed again. Feeds that source_health says are not
+    due (failing or rarely changing) are not requested at all; their cached
+    entries are used instead.
+    """
     start_time = time.time()
+    cached = _feed_cache.get(feed_url)
+
+    due, reason = should_fetch(feed_name)
+    if not due:
+        entries = cached.get("entries", []) if cached else []
+        articles = _entries_within_timeframe(feed_name, entries, days_ago)
+        logger.info(
+            f"RSS_FETCH: Skipping {feed_name} ({reason}) | Using {len(articles)}/{len(entries)} cached entries"
+        )
+        return articles
+
+    timeout = fetch_timeout(feed_name, RSS_FETCH_TIMEOUT)
     logger.info(
-        f"RSS_FETCH: Starting fetch from {feed_name} | URL: {feed_url} | Days back: {days_ago}"
+        f"RSS_FETCH: Starting fetch from {feed_name} | URL: {feed_url} | Days back: {days_ago} | Timeout: {timeout:.0f}s"
     )
     articles = []
-    total_entries = 0
-
-    try:
-        feed = feedparser.parse(feed_url)
-        total_entries = len(feed.entries)
-        logger.debug(f"RSS_FETCH: {feed_name} returned {total_entries} total entries")
+    entries = []
+    ok, changed, error = False, None, None
+    not_modified = False
 
-        if feed.bozo:
-            logger.warning(
-                f"RSS_FETCH: Feed parser warning for {feed_name} | Error: {feed.bozo_exception}"
-            )
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
 
-        for entry in feed.entries:
-            pub_date = parse_rss_date(getattr(entry, "published_parsed", None))
-            desc = getattr(entry, "description", "N/A")
-            desc_clean = clean_html(desc)
-            title = getattr(entry, "title", "N/A")
-            link = getattr(entry, "link", "N/A")
-
-            if is_within_timeframe(pub_date, days_ago):
-                logger.debug(
-                    f"RSS_FETCH: Including article from {feed_name} | Title: '{title[:60]}...' | URL: {link}"
-                )
-                articles.append(
-                    {
-                        "title": title,
-                        "link": link,
-                        "description": desc_clean,
-                        "published_date": pub_date.isoformat() if pub_date else "N/A",
-                        "summary": getattr(
-                            entry, "summary", getattr(entry, "description", "N/A")
-                        ),
-                        "source": feed_name,
-                    }
+    try:
+        async with session.get(
+            feed_url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            if response.status == 304 and cached:
+                entries = cached.get("entries", [])
+                changed, not_modified = False, True
+                logger.info(
+                    f"RSS_FETCH: {feed_name} not modified (304) | Reusing {len(entries)} cached entries"
                 )
             else:
-                logger.debug(
-                    f"RSS_FETCH: Excluding article from {feed_name} (outside timeframe) | Title: '{title[:60]}...' | Date: {pub_date}"
+                response.raise_for_status()
+                body = await response.read()
+                response_headers = {k.lower(): v for k, v in response.headers.items()}
+                entries = await asyncio.to_thread(
+                    _parse_feed_entries, feed_name, body, response_headers
                 )
+                # Servers without validators answer 200 every time, so compare
+                # the entries to tell whether the feed actually changed
+                changed = not cached or {e["link"] for e in entries} != {
+                    e["link"] for e in cached.get("entries", [])
+                }
+                _feed_cache.set(
+                    feed_url,
+                    {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "entries": entries,
+                    },
+                )
+
+        articles = _entries_within_timeframe(feed_name, entries, days_ago)
+        ok = True
 
+    except asyncio.TimeoutError:
+        error = f"Timed out after {timeout:.0f}s"
+        logger.error(
+            f"RSS_FETCH: Timed out after {timeout:.0f}s fetching feed {feed_name} | URL: {feed_url}"
+        )
     except Exception as e:
+        error = str(e)
         logger.error(
             f"RSS_FETCH: Failed to fetch/parse feed {feed_name} | URL: {feed_url} | Error: {e}"
         )
 
     elapsed_time = time.time() - start_time
+    record_fetch(
+        feed_name,
+        elapsed_time,
+        ok,
+        changed=changed,
+        error=error,
+        not_modified=not_modified,
+    )
     logger.info(
-        f"RSS_FETCH: Completed {feed_name} | Found {len(articles)}/{total_entries} relevant articles | Time: {elapsed_time:.2f}s"
+        f"RSS_FETCH: Completed {feed_name} | Found {len(articles)}/{len(entries)} relevant articles | Time: {elapsed_time:.2f}s"
     )
     return articles
 
 
-def fetch_from_newsapi(api_key, days_ago):
+async def fetch_from_newsapi(session, api_key, days_ago):
     """Fetches AI-related articles from NewsAPI."""
     if not api_key or api_key == "YOUR_NEWSAPI_KEY":
         logger.warning("NEWSAPI_FETCH: API key not configured - skipping NewsAPI fetch")
         return []
 
+    due, reason = should_fetch("NewsAPI")
+    if not due:
+        logger.info(f"NEWSAPI_FETCH: Skipping NewsAPI ({reason})")
+        return []
+
     start_time = time.time()
+    timeout = fetch_timeout("NewsAPI", NEWSAPI_FETCH_TIMEOUT)
+    ok, error = False, None
     from_date = (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime(
         "%Y-%m-%dT%H:%M:%S"
     )
@@ -184,9 +369,13 @@ def fetch_from_newsapi(api_key, days_ago):
     }
 
     try:
-        response = requests.get(base_url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        async with session.get(
+            base_url,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
         total_results = data.get("totalResults", 0)
 
         logger.debug(f"NEWSAPI_FETCH: API returned {total_results} total results")
@@ -211,20 +400,56 @@ def fetch_from_newsapi(api_key, days_ago):
                     "source": source_name,
                 }
             )
-    except requests.exceptions.RequestException as e:
+        ok = True
+    except asyncio.TimeoutError:
+        error = f"Timed out after {timeout:.0f}s"
+        logger.error(
+            f"NEWSAPI_FETCH: Timed out after {timeout:.0f}s waiting for NewsAPI"
+        )
+    except aiohttp.ClientError as e:
+        error = str(e)
         logger.error(f"NEWSAPI_FETCH: HTTP request failed | Error: {e}")
     except Exception as e:
+        error = str(e)
         logger.error(f"NEWSAPI_FETCH: Unexpected error occurred | Error: {e}")
 
     elapsed_time = time.time() - start_time
+    record_fetch("NewsAPI", elapsed_time, ok, error=error)
     logger.info(
         f"NEWSAPI_FETCH: Completed NewsAPI fetch | Found {len(articles)} articles | Time: {elapsed_time:.2f}s"
     )
     return articles
 
 
-def is_valid_article(article):
-    """Enhanced article filter with URL validation and logging"""
+async def _check_url_accessibility(session, scheduler, link):
+    """HEAD-requests link and returns {"status", "final_url"}, served from cache when possible.
+
+    Raises aiohttp.ClientError/asyncio.TimeoutError when the URL could not be
+    reached; network errors are not cached because the issue might be temporary.
+    """
+    cached = await asyncio.to_thread(_validation_cache.get, link)
+    if cached is not None:
+        logger.debug(
+            f"ARTICLE_VALIDATION: Cache hit | Status: {cached['status']} | Link: '{link}'"
+        )
+        return cached
+
+    async with scheduler.slot(link):
+        async with session.head(
+            link,
+            allow_redirects=True,
+            timeout=aiohttp.ClientTimeout(total=URL_VALIDATION_TIMEOUT),
+        ) as response:
+            result = {"status": response.status, "final_url": str(response.url)}
+
+    # Server errors are usually transient, so only remember definitive answers
+    if result["status"] < 500:
+        await asyncio.to_thread(_validation_cache.set, link, result)
+    return result
+
+
+def is_well_formed_article(article):
+    """Cheap in-memory checks on an article's title and link (no network access)."""
     title = article.get("title", "")
     link = article.get("link", "")
 
@@ -265,15 +490,32 @@ def is_valid_article(article):
             )
             return False
 
+    return True
+
+
+async def is_valid_article(article, session, scheduler):
+    """Enhanced article filter with URL validation and logging.
+
+    On success the redirect target of the link (if any) is stored on the
+    article as "resolved_link" so deduplication can match it.
+    """
+    title = article.get("title", "")
+    link = article.get("link", "")
+
+    if not is_well_formed_article(article):
+        return False
+
     # Quick accessibility check with HEAD request (with timeout and error handling)
     try:
-        response = requests.head(link, timeout=5, allow_redirects=True)
-        if response.status_code in [401, 403, 404, 410, 451, 500, 502, 503, 504]:
+        result = await _check_url_accessibility(session, scheduler, link)
+        if result["status"] in [401, 403, 404, 410, 451, 500, 502, 503, 504]:
             logger.debug(
-                f"ARTICLE_VALIDATION: Rejected article (HTTP {response.status_code}) | Title: '{title}' | Link: '{link}'"
+                f"ARTICLE_VALIDATION: Rejected article (HTTP {result['status']}) | Title: '{title}' | Link: '{link}'"
             )
             return False
-    except requests.exceptions.RequestException as e:
+        if result["final_url"] and result["final_url"] != link:
+            article["resolved_link"] = result["final_url"]
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         # Don't reject on network errors, as the issue might be temporary
         logger.debug(
             f"ARTICLE_VALIDATION: Warning - could not verify URL accessibility | Title: '{title}' | Link: '{link}' | Error: {e}"
@@ -287,10 +529,10 @@ def is_valid_article(article):
 
 
 @exponential_backoff_retry()
-async def _call_gemini_api(client, all_articles_text, system_prompt):
+async def _call_gemini_api(all_articles_text, system_prompt):
     """Make the actual API call to Gemini with retry logic for transient failures."""
     logger.debug("LLM_FILTER: Calling Gemini API")
-    response = await client.aio.models.generate_content(
+    response = await generate_content_async(
         model="gemini-2.5-pro",
         contents=[all_articles_text],
         config=types.GenerateContentConfig(
@@ -320,7 +562,163 @@ async def _call_gemini_api(client, all_articles_text, system_prompt):
     return response
 
 
+def _build_curation_text(articles, previous_issue_articles):
+    """Formats the previous-issue context and the numbered candidates for the curation prompt."""
+    all_articles_text = ""
+    if previous_issue_articles:
+        all_articles_text += "Previously selected newsletter items (already covered):\n"
+        for i, item in enumerate(previous_issue_articles):
+            title = item.get("title") or item.get("headline") or "Unknown title"
+            ai_metadata = item.get("ai_metadata") if isinstance(item, dict) else {}
+            if not isinstance(ai_metadata, dict):
+                ai_metadata = {}
+            source = (
+                ai_metadata.get("original_article_source")
+                or item.get("source")
+                or "Unknown source"
+            )
+            all_articles_text += (
+                f"  Previous item {i+1}:\n"
+                f"    Title: {title}\n"
+                f"    Source: {source}\n"
+            )
+        all_articles_text += "\n"
+
+    for i, item in enumerate(articles):
+        all_articles_text += f"News item {i+1}:\n"
+        all_articles_text += f"   Title: {item['title']}\n"
+        all_articles_text += f"   Description: {item['description']}\n"
+        all_articles_text += f"   Source: {item['source']}\n"
+        if item.get("alternate_sources"):
+            also_reported_by = ", ".join(
+                alt.get("source") or "Unknown source"
+                for alt in item["alternate_sources"]
+            )
+            all_articles_text += f"   Also reported by: {also_reported_by}\n"
+        if item.get("near_duplicate_of_previous"):
+            all_articles_text += f"   Likely repeats previous item: {item['near_duplicate_of_previous']}\n"
+        all_articles_text += "\n"
+    return all_articles_text
+
+
+async def _curate_batch(articles, previous_issue_articles, top_n, label="LLM CURATION"):
+    """Runs one curation request over articles and returns the selected ones in LLM order.
+
+    Raises if the request fails after retries.
+    """
+    system_prompt = news_filter_prompt.format(
+        top_n=top_n, previous_issue_count=len(previous_issue_articles)
+    )
+    all_articles_text = _build_curation_text(articles, previous_issue_articles)
+    logger.debug(
+        f"LLM_FILTER: [{label}] Sending {len(all_articles_text)} characters to LLM for analysis"
+    )
+
+    # Validation of the response is handled in _call_gemini_api
+    response = await _call_gemini_api(all_articles_text, system_prompt)
+    results: list[NewsItemSelected] = response.parsed
+
+    filtered_articles = []
+    logger.info(f"LLM_FILTER: [{label}] LLM returned {len(results)} decisions")
+    logger.info("=" * 60)
+    logger.info(f"{label} DECISIONS:")
+    logger.info("=" * 60)
+
+    for r in results:
+        if r.is_relevant_news:
+            decision = "✓ INCLUDED"
+            if 0 < r.id <= len(articles):
+                article = articles[r.id - 1]
+                filtered_articles.append(article)
+
+                logger.info(f"ITEM {r.id:2d}: {decision}")
+                logger.info(f"         Title: {r.title}")
+                logger.info(f"         Source: {article.get('source', 'Unknown')}")
+                logger.info(f"         URL: {article.get('link', 'N/A')}")
+                logger.info(f"         Reason: {r.reasoning}")
+            else:
+                logger.warning(
+                    f"LLM_FILTER: [{label}] Invalid article ID {r.id} returned by LLM - skipping"
+                )
+                continue
+        else:
+            decision = "✗ EXCLUDED"
+            logger.debug(
+                f"ITEM {r.id:2d}: {decision} | Title: {r.title[:60]}... | Reason: {r.reasoning}"
+            )
+
+    logger.info("=" * 60)
+    return filtered_articles
+
+
+async def _curate_tournament(all_articles, previous_issue_articles, top_n):
+    """Curates chunks of the candidates in parallel, then merges the shortlists.
+
+    A chunk whose request fails is dropped on its own; the merge round ranks
+    whatever the other chunks shortlisted. If the merge round fails, the
+    shortlists are returned in chunk order.
+    Returns (selected articles, why the selection is degraded or None).
+    """
+    num_chunks = math.ceil(len(all_articles) / LLM_CURATION_CHUNK_SIZE)
+    # Interleave rather than slice so each chunk gets a mix of sources
+    chunks = [all_articles[i::num_chunks] for i in range(num_chunks)]
+    logger.info(
+        f"LLM_FILTER: Tournament mode | {len(all_articles)} candidates in {num_chunks} chunks of ~{LLM_CURATION_CHUNK_SIZE}"
+    )
+
+    chunk_results = await asyncio.gather(
+        *(
+            _curate_batch(
+                chunk,
+                previous_issue_articles,
+                top_n,
+                label=f"CHUNK {i+1}/{num_chunks}",
+            )
+            for i, chunk in enumerate(chunks)
+        ),
+        return_exceptions=True,
+    )
+
+    shortlist = []
+    failed_chunks = 0
+    for i, (chunk, result) in enumerate(zip(chunks, chunk_results)):
+        if isinstance(result, BaseException):
+            failed_chunks += 1
+            logger.error(
+                f"LLM_FILTER: Chunk {i+1}/{num_chunks} failed - dropping its {len(chunk)} candidates | Error: {result} | Error type: {type(result).__name__}"
+            )
+            continue
+        shortlist.extend(result)
+
+    if failed_chunks == num_chunks:
+        raise ValueError(f"All {num_chunks} curation chunks failed")
+
+    logger.info(
+        f"LLM_FILTER: Shortlisted {len(shortlist)} articles from {num_chunks - failed_chunks}/{num_chunks} chunks"
+    )
+    # The LLM never judged the candidates of failed chunks
+    degraded = f"{failed_chunks}/{num_chunks} chunks failed" if failed_chunks else None
+    if len(shortlist) <= 1:
+        return shortlist, degraded
+
+    try:
+        selected = await _curate_batch(
+            shortlist, previous_issue_articles, top_n, label="MERGE ROUND"
+        )
+        return selected, degraded
+    except Exception as e:
+        logger.error(
+            f"LLM_FILTER: Merge round failed - using chunk shortlists | Error: {e} | Error type: {type(e).__name__}"
+        )
+        return shortlist[:top_n], "merge round failed"
+
+
 async def filter_top_articles_llm(all_articles, previous_issue_articles=None, top_n=12):
+    """Has the LLM pick and rank the top_n articles.
+
+    Candidate sets larger than LLM_CURATION_CHUNK_SIZE are curated in
+    tournament mode (see _curate_tournament).
+    """
     start_time = time.time()
     logger.info(
         f"LLM_FILTER: Starting LLM curation | Input articles: {len(all_articles)} | Target: {top_n}"
@@ -339,99 +737,22 @@ async def filter_top_articles_llm(all_articles, previous_issue_articles=None, to
     logger.info(f"LLM_FILTER: Input source distribution: {dict(source_counts)}")
 
     try:
-        # Step 1: Initialize client
-        logger.debug("LLM_FILTER: Initializing Gemini client")
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY environment variable is not set")
-
-        client = genai.Client(api_key=api_key)
-        logger.debug("LLM_FILTER: Client initialized successfully")
-
-        # Step 2: Prepare prompt
-        logger.debug("LLM_FILTER: Preparing system prompt")
-        system_prompt = news_filter_prompt.format(
-            top_n=top_n, previous_issue_count=len(previous_issue_articles)
-        )
-
-        # Step 3: Build article text
-        logger.debug("LLM_FILTER: Building article text for LLM")
-        all_articles_text = ""
-        if previous_issue_articles:
-            all_articles_text += (
-                "Previously selected newsletter items (already covered):\n"
+        # Curate, in one request or chunked for large candidate sets
+        if 0 < LLM_CURATION_CHUNK_SIZE < len(all_articles):
+            filtered_articles, degraded = await _curate_tournament(
+                all_articles, previous_issue_articles, top_n
             )
-            for i, item in enumerate(previous_issue_articles):
-                title = item.get("title") or item.get("headline") or "Unknown title"
-                ai_metadata = item.get("ai_metadata") if isinstance(item, dict) else {}
-                if not isinstance(ai_metadata, dict):
-                    ai_metadata = {}
-                source = (
-                    ai_metadata.get("original_article_source")
-                    or item.get("source")
-                    or "Unknown source"
-                )
-                all_articles_text += (
-                    f"  Previous item {i+1}:\n"
-                    f"    Title: {title}\n"
-                    f"    Source: {source}\n"
-                )
-            all_articles_text += "\n"
-
-        for i, item in enumerate(all_articles):
-            all_articles_text += f"News item {i+1}:\n"
-            all_articles_text += f"   Title: {item['title']}\n"
-            all_articles_text += f"   Description: {item['description']}\n"
-            all_articles_text += f"   Source: {item['source']}\n\n"
-
-        logger.debug(
-            f"LLM_FILTER: Sending {len(all_articles_text)} characters to LLM for analysis"
-        )
-
-        # Step 4: Call LLM with retry logic
-        response = await _call_gemini_api(client, all_articles_text, system_prompt)
-
-        # Step 5: Process results (validation is now handled in _call_gemini_api)
-        logger.debug("LLM_FILTER: Processing API response")
-        results: list[NewsItemSelected] = response.parsed
-        logger.debug(f"LLM_FILTER: Successfully parsed {len(results)} results")
-
-        # Step 6: Process results
-        logger.debug("LLM_FILTER: Processing LLM results")
-        filtered_articles = []
-
-        logger.info(f"LLM_FILTER: LLM returned {len(results)} decisions")
-        logger.info("=" * 60)
-        logger.info("LLM CURATION DECISIONS:")
-        logger.info("=" * 60)
+        else:
+            filtered_articles = await _curate_batch(
+                all_articles, previous_issue_articles, top_n
+            )
+            degraded = None
 
         selected_sources = {}
-        for r in results:
-            if r.is_relevant_news:
-                decision = "✓ INCLUDED"
-                if 0 < r.id <= len(all_articles):
-                    article = all_articles[r.id - 1]
-                    filtered_articles.append(article)
-                    source = article.get("source", "Unknown")
-                    selected_sources[source] = selected_sources.get(source, 0) + 1
-
-                    logger.info(f"ITEM {r.id:2d}: {decision}")
-                    logger.info(f"         Title: {r.title}")
-                    logger.info(f"         Source: {source}")
-                    logger.info(f"         URL: {article.get('link', 'N/A')}")
-                    logger.info(f"         Reason: {r.reasoning}")
-                else:
-                    logger.warning(
-                        f"LLM_FILTER: Invalid article ID {r.id} returned by LLM - skipping"
-                    )
-                    continue
-            else:
-                decision = "✗ EXCLUDED"
-                logger.debug(
-                    f"ITEM {r.id:2d}: {decision} | Title: {r.title[:60]}... | Reason: {r.reasoning}"
-                )
+        for article in filtered_articles:
+            source = article.get("source", "Unknown")
+            selected_sources[source] = selected_sources.get(source, 0) + 1
 
-        logger.info("=" * 60)
         logger.info(
             f"LLM_FILTER: Selected {len(filtered_articles)} articles from {len(all_articles)} candidates"
         )
@@ -439,6 +760,10 @@ async def filter_top_articles_llm(all_articles, previous_issue_articles=None, to
             f"LLM_FILTER: Selected source distribution: {dict(selected_sources)}"
         )
 
+        # Keep a record for offline evaluation of the pre-ranker; runs the LLM
+        # only partly ranked are tagged so the evaluation can leave them out
+        record_curation_run(all_articles, filtered_articles, top_n, fallback=degraded)
+
         elapsed_time = time.time() - start_time
         logger.info(f"LLM_FILTER: LLM filtering completed | Time: {elapsed_time:.2f}s")
         return filtered_articles
@@ -457,76 +782,87 @@ async def filter_top_articles_llm(all_articles, previous_issue_articles=None, to
         return all_articles[:top_n]
 
 
-@exponential_backoff_retry()
-def _fetch_with_curl_cffi(url):
-    """Scrapes the URL using curl_cffi to impersonate a browser's TLS fingerprint."""
-    logger.debug(f"SCRAPE_FETCH: Fetching with curl_cffi | URL: {url}")
+def _create_scrape_session():
+    """Creates the async curl_cffi session shared by all scrapes in a run.
 
-    response = cffi_requests.get(url, impersonate="chrome120", timeout=15)
-    response.raise_for_status()
-    content_length = len(response.content)
-    logger.debug(
-        f"SCRAPE_FETCH: Successfully fetched {content_length} bytes | URL: {url}"
+    curl's multi interface drives every transfer on the event loop (no worker
+    threads) and keeps connections alive per host, so several articles from
+    one publisher reuse a connection. Browser impersonation is kept for sites
+    that fingerprint TLS.
+    """
+    if SCRAPE_HTTP2:
+        http_version = CurlHttpVersion.V2TLS  # HTTP/2 over TLS, falls back to 1.1
+    else:
+        http_version = CurlHttpVersion.V1_1
+    return scrape_session(
+        impersonate=SCRAPE_IMPERSONATE or None,
+        http_version=http_version,
+        max_clients=SCRAPE_MAX_CONCURRENCY,
+        timeout=15,
     )
-    return response.content
 
 
-def _extract_with_bs(html_content, url):
-    """Extracts content from HTML using BeautifulSoup with custom logic."""
-    logger.debug(f"SCRAPE_EXTRACT: Attempting BeautifulSoup extraction | URL: {url}")
+async def _fetch_with_curl_cffi(session, url):
+    """Scrapes the URL using curl_cffi to impersonate a browser's TLS fingerprint.
 
-    if not html_content:
-        logger.warning(f"SCRAPE_EXTRACT: No HTML content provided | URL: {url}")
-        return None
+    Returns the response without checking its status.
+    """
+    logger.debug(f"SCRAPE_FETCH: Fetching with curl_cffi | URL: {url}")
 
-    try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        article_tag = soup.find("article")
-
-        if article_tag:
-            prose_divs = article_tag.find_all("div", class_="prose")
-            if prose_divs:
-                all_prose_text_parts = [
-                    div.get_text(separator="\n\n", strip=True)
-                    for div in prose_divs
-                    if div
-                ]
-                content = "\n\n".join(all_prose_text_parts)
-                if content:
-                    logger.debug(
-                        f"SCRAPE_EXTRACT: Extracted {len(content)} chars from prose divs | URL: {url}"
-                    )
-                    return content
-                else:
-                    logger.debug(
-                        f"SCRAPE_EXTRACT: Empty content from prose divs | URL: {url}"
-                    )
+    response = await session.get(url)
+    logger.debug(
+        f"SCRAPE_FETCH: Received HTTP {response.status_code} ({len(response.content)} bytes) | URL: {url}"
+    )
+    return response
 
-            logger.debug(
-                f"SCRAPE_EXTRACT: No valid prose divs found, extracting from entire article tag | URL: {url}"
-            )
-            content = article_tag.get_text(separator="\n\n", strip=True)
-            if content:
-                logger.debug(
-                    f"SCRAPE_EXTRACT: Extracted {len(content)} chars from article tag | URL: {url}"
-                )
-                return content
-            else:
-                logger.debug(
-                    f"SCRAPE_EXTRACT: Empty content from article tag | URL: {url}"
-                )
-        else:
-            logger.warning(f"SCRAPE_EXTRACT: No article tag found | URL: {url}")
 
-        return None
-    except Exception as e:
-        logger.error(
-            f"SCRAPE_EXTRACT: Error during BeautifulSoup extraction | URL: {url} | Error: {e}"
+@exponential_backoff_retry()
+async def _fetch_html_politely(session, url, scheduler):
+    """Fetches url's HTML through the host scheduler, honouring rate-limit responses.
+
+    A 403/429/503 defers the whole host (by its Retry-After, or a default
+    cooldown) before raising, so the retry waits out the limit instead of
+    hitting the host again straight away.
+    """
+    async with scheduler.slot(url):
+        response = await _fetch_with_curl_cffi(session, url)
+
+    if response.status_code in SCRAPE_RATE_LIMIT_STATUSES:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        delay = min(
+            retry_after if retry_after is not None else SCRAPE_RATE_LIMIT_COOLDOWN,
+            SCRAPE_MAX_RETRY_AFTER,
+        )
+        scheduler.defer(url, delay)
+        raise RuntimeError(
+            f"HTTP {response.status_code} from {get_host(url)} (deferred {delay:.0f}s)"
         )
-        return None
+
+    response.raise_for_status()
+    logger.debug(
+        f"SCRAPE_FETCH: Successfully fetched {len(response.content)} bytes | URL: {url}"
+    )
+    return response.content
 
 
-async def _scrape_and_process_article_async(article_info):
+def _store_scrape_result(link, html_content, content, extraction_method):
+    """Caches the fetched HTML and extraction result for link (compressed on disk)."""
+    if isinstance(html_content, bytes):
+        html_content = html_content.decode("utf-8", errors="replace")
+    usable = content and len(content) >= 200
+    _scrape_cache.set(
+        link,
+        {
+            "html": html_content,
+            "content": content if usable else None,
+            "extraction_method": (
+                extraction_method if usable else "description_fallback"
+            ),
+        },
+    )
+
+
+async def _scrape_and_process_article_async(article_info, session, scheduler):
     """Scrapes a single article with comprehensive logging and fallback strategies."""
     article, index, total_articles = article_info
     link = article["link"]
@@ -542,45 +878,39 @@ async def _scrape_and_process_article_async(article_info):
     html_content = None
     extraction_method = "description_fallback"
 
+    cached = await asyncio.to_thread(_scrape_cache.get, link)
+    if cached is not None:
+        content = cached.get("content")
+        extraction_method = cached.get("extraction_method", extraction_method)
+        logger.info(
+            f"SCRAPE ({index:2d}/{total_articles}): ✓ Cache hit | Method: {extraction_method} | Length: {len(content) if content else 0} chars | Source: {source}"
+        )
+
     try:
-        # 1. Fetch HTML using curl_cffi
-        html_content = await asyncio.to_thread(_fetch_with_curl_cffi, link)
+        # 1. Fetch HTML using curl_cffi (skipped when the cache already has it)
+        if cached is None:
+            html_content = await _fetch_html_politely(session, link, scheduler)
 
         if html_content:
-            # 2. Try extracting content with Trafilatura
-            content = await asyncio.to_thread(
-                trafilatura.extract,
-                html_content,
-                include_comments=False,
-                include_tables=False,
-                no_fallback=True,
+            # 2. Extract with Trafilatura, falling back to BeautifulSoup, in a
+            # worker process so CPU-heavy parsing never blocks the event loop
+            content, extraction_method = await extract_article_text_async(
+                html_content, link
             )
-
-            # 3. Evaluate Trafilatura result
-            if content and len(content) >= 200:
-                extraction_method = "trafilatura"
+            if content:
                 logger.info(
-                    f"SCRAPE ({index:2d}/{total_articles}): ✓ Trafilatura success | Length: {len(content)} chars | Source: {source}"
+                    f"SCRAPE ({index:2d}/{total_articles}): ✓ {extraction_method} success | Length: {len(content)} chars | Source: {source}"
                 )
             else:
-                content_length = len(content) if content else 0
-                logger.debug(
-                    f"SCRAPE ({index:2d}/{total_articles}): Trafilatura failed/insufficient content (length: {content_length}) | Trying BeautifulSoup"
+                logger.warning(
+                    f"SCRAPE ({index:2d}/{total_articles}): Trafilatura and BeautifulSoup both failed | Source: {source}"
                 )
 
-                # 4. Try custom BeautifulSoup extraction
-                content = _extract_with_bs(html_content, link)
-                if content and len(content) >= 200:
-                    extraction_method = "beautifulsoup"
-                    logger.info(
-                        f"SCRAPE ({index:2d}/{total_articles}): ✓ BeautifulSoup success | Length: {len(content)} chars | Source: {source}"
-                    )
-                else:
-                    content_length = len(content) if content else 0
-                    logger.warning(
-                        f"SCRAPE ({index:2d}/{total_articles}): BeautifulSoup also failed (length: {content_length}) | Source: {source}"
-                    )
-        else:
+            # Compressing and writing the page is blocking disk work
+            await asyncio.to_thread(
+                _store_scrape_result, link, html_content, content, extraction_method
+            )
+        elif cached is None:
             logger.warning(
                 f"SCRAPE ({index:2d}/{total_articles}): Failed to fetch HTML content | Source: {source}"
             )
@@ -590,7 +920,7 @@ async def _scrape_and_process_article_async(article_info):
             f"SCRAPE ({index:2d}/{total_articles}): Unexpected error | Source: {source} | Error: {e}"
         )
 
-    # 5. Final fallback to description
+    # 3. Final fallback to description
     content_length = len(content) if content else 0
     if not content or content_length < 200:
         content = article["description"] or ""  # Ensure content is never None
@@ -645,8 +975,19 @@ async def scrape_article_content_async(articles: list[dict]) -> list[dict]:
         (article, i + 1, total_articles) for i, article in enumerate(articles)
     ]
 
-    tasks = [_scrape_and_process_article_async(pkg) for pkg in article_packages]
-    scraped_articles = await asyncio.gather(*tasks)
+    # Everything is started at once, but the scheduler limits how hard any
+    # single publisher gets hit so we don't trip their rate limits.
+    scheduler = HostScheduler(
+        max_concurrency=SCRAPE_MAX_CONCURRENCY,
+        max_per_host=SCRAPE_MAX_PER_HOST,
+        min_interval=SCRAPE_MIN_HOST_INTERVAL,
+    )
+    async with _create_scrape_session() as session:
+        tasks = [
+            _scrape_and_process_article_async(pkg, session, scheduler)
+            for pkg in article_packages
+        ]
+        scraped_articles = await asyncio.gather(*tasks)
 
     # Analyze results
     successful_scrapes = 0
@@ -690,8 +1031,15 @@ async def scrape_article_content_async(articles: list[dict]) -> list[dict]:
     return valid_articles
 
 
-def fetch_all_articles(days_ago: int = 7) -> list[dict]:
-    """Fetches articles from all configured sources and returns a combined list."""
+async def _timed(coro):
+    """Awaits coro and returns (result, elapsed_seconds)."""
+    start_time = time.time()
+    result = await coro
+    return result, time.time() - start_time
+
+
+async def fetch_all_articles(days_ago: int = 7) -> list[dict]:
+    """Fetches articles from all configured sources concurrently and returns a combined list."""
     start_time = time.time()
     logger.info(
         f"FETCH_ALL: Starting comprehensive article fetch | Days back: {days_ago}"
@@ -699,18 +1047,22 @@ def fetch_all_articles(days_ago: int = 7) -> list[dict]:
 
     all_fetched_articles: list[dict] = []
 
-    # Fetch from RSS feeds
-    rss_start_time = time.time()
-    for name, url in RSS_FEEDS.items():
-        articles = fetch_from_rss(name, url, days_ago)
+    # Fetch every RSS feed, NewsAPI and Hacker News at the same time; each request carries
+    # its own timeout, so the stage takes as long as the slowest source.
+    async with http_session(headers={"User-Agent": feedparser.USER_AGENT}) as session:
+        source_names = list(RSS_FEEDS.keys()) + ["NewsAPI", HN_SOURCE_NAME]
+        tasks = [
+            _timed(fetch_from_rss(session, name, url, days_ago))
+            for name, url in RSS_FEEDS.items()
+        ]
+        tasks.append(_timed(fetch_from_newsapi(session, NEWSAPI_KEY, days_ago)))
+        tasks.append(_timed(fetch_from_hackernews(session, days_ago)))
+        results = await asyncio.gather(*tasks)
+
+    source_times = {}
+    for name, (articles, elapsed) in zip(source_names, results):
         all_fetched_articles.extend(articles)
-    rss_elapsed = time.time() - rss_start_time
-
-    # Fetch from NewsAPI
-    newsapi_start_time = time.time()
-    newsapi_articles = fetch_from_newsapi(NEWSAPI_KEY, days_ago)
-    all_fetched_articles.extend(newsapi_articles)
-    newsapi_elapsed = time.time() - newsapi_start_time
+        source_times[name] = elapsed
 
     # Calculate source distribution
     source_counts = {}
@@ -719,13 +1071,16 @@ def fetch_all_articles(days_ago: int = 7) -> list[dict]:
         source_counts[source] = source_counts.get(source, 0) + 1
 
     total_elapsed = time.time() - start_time
+    slowest_source = max(source_times, key=source_times.get)
 
     logger.info("=" * 60)
     logger.info("FETCH_ALL: COMPREHENSIVE FETCH RESULTS")
     logger.info("=" * 60)
     logger.info(f"Total articles fetched: {len(all_fetched_articles)}")
-    logger.info(f"RSS feeds time: {rss_elapsed:.2f}s")
-    logger.info(f"NewsAPI time: {newsapi_elapsed:.2f}s")
+    logger.info(
+        f"Slowest source: {slowest_source} ({source_times[slowest_source]:.2f}s)"
+    )
+    logger.info(f"Sum of per-source times: {sum(source_times.values()):.2f}s")
     logger.info(f"Total fetch time: {total_elapsed:.2f}s")
     logger.info(f"Source distribution: {dict(source_counts)}")
     logger.info("=" * 60)
@@ -734,7 +1089,7 @@ def fetch_all_articles(days_ago: int = 7) -> list[dict]:
 
 
 def deduplicate_articles(articles: list[dict]) -> list[dict]:
-    """Removes duplicate articles based on their link field with logging."""
+    """Removes duplicate articles based on their link (or resolved redirect target) with logging."""
     start_time = time.time()
     logger.info(
         f"DEDUPLICATION: Starting deduplication | Input articles: {len(articles)}"
@@ -746,12 +1101,16 @@ def deduplicate_articles(articles: list[dict]) -> list[dict]:
 
     for article in articles:
         link = article.get("link")
+        resolved_link = article.get("resolved_link")
         title = article.get("title", "")[:50]
         source = article.get("source", "Unknown")
 
-        if link and link != "N/A" and link not in seen_links:
+        # Match on the redirect target as well, so a tracking/short link and
+        # the canonical URL count as the same article.
+        keys = {key for key in (link, resolved_link) if key and key != "N/A"}
+        if link and link != "N/A" and keys.isdisjoint(seen_links):
             unique_articles.append(article)
-            seen_links.add(link)
+            seen_links.update(keys)
             logger.debug(
                 f"DEDUPLICATION: Kept article | Source: {source} | Title: '{title}...'"
             )
@@ -769,30 +1128,47 @@ def deduplicate_articles(articles: list[dict]) -> list[dict]:
     return unique_articles
 
 
-def validate_articles(articles: list[dict]) -> list[dict]:
-    """Validates articles using the enhanced is_valid_article function."""
+async def validate_articles(articles: list[dict]) -> list[dict]:
+    """Validates articles concurrently using the enhanced is_valid_article function."""
     start_time = time.time()
     logger.info(
         f"VALIDATION: Starting article validation | Input articles: {len(articles)}"
     )
 
-    valid_articles = []
-    invalid_count = 0
+    scheduler = HostScheduler(
+        max_concurrency=URL_VALIDATION_MAX_CONCURRENCY,
+        max_per_host=URL_VALIDATION_MAX_PER_HOST,
+    )
+    async with http_session(headers={"User-Agent": feedparser.USER_AGENT}) as session:
+        results = await asyncio.gather(
+            *[is_valid_article(article, session, scheduler) for article in articles]
+        )
 
-    for article in articles:
-        if is_valid_article(article):
-            valid_articles.append(article)
-        else:
-            invalid_count += 1
+    valid_articles = [article for article, ok in zip(articles, results) if ok]
+    invalid_count = len(articles) - len(valid_articles)
+    redirected_count = sum(
+        1 for article in valid_articles if "resolved_link" in article
+    )
 
     elapsed_time = time.time() - start_time
     logger.info(
-        f"VALIDATION: Completed | Valid articles: {len(valid_articles)} | Invalid articles: {invalid_count} | Time: {elapsed_time:.2f}s"
+        f"VALIDATION: Completed | Valid articles: {len(valid_articles)} | Invalid articles: {invalid_count} | Redirected: {redirected_count} | Time: {elapsed_time:.2f}s"
     )
 
     return valid_articles
 
 
+def filter_well_formed_articles(articles: list[dict]) -> list[dict]:
+    """Drops articles that fail the cheap title/link checks."""
+    start_time = time.time()
+    well_formed = [article for article in articles if is_well_formed_article(article)]
+    elapsed_time = time.time() - start_time
+    logger.info(
+        f"FORMAT_CHECK: Completed | Well-formed articles: {len(well_formed)} | Rejected: {len(articles) - len(well_formed)} | Time: {elapsed_time:.2f}s"
+    )
+    return well_formed
+
+
 def check_article_processed(article_url: str) -> bool:
     """Check if an article has already been processed."""
     try:
@@ -888,10 +1264,73 @@ def filter_unprocessed_articles(
     return unprocessed_articles
 
 
+def build_filter_stages(
+    stage_names: list[str],
+    force_regenerate: bool = False,
+    previous_issue_articles: list[dict] | None = None,
+    archive: list[dict] | None = None,
+) -> list[FilterStage]:
+    """Builds the ordered pre-LLM filter stages from their names (see NEWS_FILTER_STAGES).
+
+    previous_issue_articles lets the near_duplicates stage flag candidates that
+    repeat a story from the last issue; archive is the published news the
+    prerank stage compares candidates against.
+    """
+    available = {
+        "format": FilterStage("format", "memory", filter_well_formed_articles),
+        "deduplicate": FilterStage("deduplicate", "memory", deduplicate_articles),
+        "processed": FilterStage(
+            "processed",
+            "db",
+            functools.partial(
+                filter_unprocessed_articles, force_regenerate=force_regenerate
+            ),
+        ),
+        "validate": FilterStage("validate", "network", validate_articles),
+        # Validation records redirect targets, so a second pass catches
+        # articles that only turn out to be duplicates after redirects
+        "deduplicate_redirects": FilterStage(
+            "deduplicate_redirects", "memory", deduplicate_articles
+        ),
+        # Collapses the same story reported by several outlets into one
+        # candidate so the LLM doesn't spend tokens on rewordings
+        "near_duplicates": FilterStage(
+            "near_duplicates",
+            "memory",
+            functools.partial(
+                cluster_near_duplicates,
+                previous_issue_articles=previous_issue_articles,
+            ),
+        ),
+        # Caps the LLM prompt at NEWS_PRERANK_TOP_K candidates using a local
+        # relevance score; keep it last so it ranks only real candidates
+        "prerank": FilterStage(
+            "prerank", "memory", functools.partial(prerank_articles, archive=archive)
+        ),
+    }
+
+    unknown = [name for name in stage_names if name not in available]
+    if unknown:
+        raise ValueError(
+            f"Unknown news filter stage(s): {unknown}. Available: {list(available)}"
+        )
+    return [available[name] for name in stage_names]
+
+
 async def get_top_articles(
-    days_ago: int = 7, top_n: int = 12, force_regenerate: bool = False
+    days_ago: int = 7,
+    top_n: int = 12,
+    force_regenerate: bool = False,
+    filter_stages: list[str] | None = None,
+    candidate_articles: list[dict] | None = None,
 ) -> list[dict]:
-    """Main function to fetch, filter, and scrape top articles with comprehensive logging."""
+    """Main function to fetch, filter, and scrape top articles with comprehensive logging.
+
+    filter_stages overrides the order of the pre-LLM filters (defaults to
+    NEWS_FILTER_STAGES). candidate_articles are already-validated articles
+    (e.g. from the app's article store) used instead of fetching; those that
+    carry scraped "content" are not scraped again.
+    """
     overall_start_time = time.time()
     logger.info("=" * 80)
     logger.info(f"NEWS_PIPELINE: STARTING COMPLETE NEWS PROCESSING PIPELINE")
@@ -900,11 +1339,23 @@ async def get_top_articles(
     )
     logger.info("=" * 80)
 
-    # Step 1: Fetch all articles
-    all_articles = await asyncio.to_thread(fetch_all_articles, days_ago)
+    # Step 1: Fetch all articles (unless stored candidates were provided)
+    stage_names = filter_stages or NEWS_FILTER_STAGES
+    if candidate_articles is not None:
+        all_articles = candidate_articles
+        stage_names = [name for name in stage_names if name != "validate"]
+        logger.info(
+            f"NEWS_PIPELINE: Using {len(all_articles)} stored candidates - skipping fetch and validation"
+        )
+    else:
+        all_articles = await fetch_all_articles(days_ago)
 
-    # Step 1b: Fetch previous newsletter articles to avoid duplicates
-    previous_news_articles = await asyncio.to_thread(fetch_recent_news_posts, top_n)
+    # Step 1b: Fetch previous newsletter articles to avoid duplicates. The
+    # pre-ranker's archive comes from the same request (newest posts first).
+    published_news_posts = await asyncio.to_thread(
+        fetch_recent_news_posts, max(top_n, NEWS_RANKER_ARCHIVE_SIZE)
+    )
+    previous_news_articles = published_news_posts[:top_n]
 
     previous_issue_count = len(previous_news_articles)
     previous_titles = [
@@ -921,16 +1372,16 @@ async def get_top_articles(
         [title for title in previous_titles if title],
     )
 
-    # Step 2: Validate articles (check URL accessibility and format)
-    validated_articles = await asyncio.to_thread(validate_articles, all_articles)
-
-    # Step 3: Deduplicate articles
-    deduplicated_articles = deduplicate_articles(validated_articles)
-
-    # Step 4: Filter out already processed articles (unless force_regenerate=True)
-    unprocessed_articles = await asyncio.to_thread(
-        filter_unprocessed_articles, deduplicated_articles, force_regenerate
+    # Steps 2-4: Run the pre-LLM filter stages. Cheap in-memory and DB-backed
+    # filters go first so network validation only runs on their survivors.
+    stages = build_filter_stages(
+        stage_names,
+        force_regenerate=force_regenerate,
+        previous_issue_articles=previous_news_articles,
+        archive=published_news_posts[:NEWS_RANKER_ARCHIVE_SIZE],
     )
+    unprocessed_articles, stage_reports = await run_filter_stages(all_articles, stages)
+    log_stage_savings(stage_reports)
 
     # Step 5: Filter top articles using LLM (only on unprocessed articles)
     top_articles = await filter_top_articles_llm(
@@ -938,9 +1389,21 @@ async def get_top_articles(
         previous_issue_articles=previous_news_articles,
         top_n=top_n,
     )
-
-    # Step 6: Scrape article content
-    scraped_content = await scrape_article_content_async(top_articles)
+    record_yield(all_articles, top_articles)
+
+    # Step 6: Scrape article content (stored candidates may already have it)
+    to_scrape = [article for article in top_articles if not article.get("content")]
+    scraped = await scrape_article_content_async(to_scrape) if to_scrape else []
+    scraped_by_link = {article["link"]: article for article in scraped}
+    scraped_content = [
+        article if article.get("content") else scraped_by_link[article["link"]]
+        for article in top_articles
+        if article.get("content") or article["link"] in scraped_by_link
+    ]
+    if len(to_scrape) < len(top_articles):
+        logger.info(
+            f"NEWS_PIPELINE: Reused stored content for {len(top_articles) - len(to_scrape)} articles"
+        )
 
     # Final summary
     overall_elapsed = time.time() - overall_start_time
@@ -949,9 +1412,8 @@ async def get_top_articles(
     logger.info("NEWS_PIPELINE: FINAL PIPELINE RESULTS")
     logger.info("=" * 80)
     logger.info(f"Initial articles fetched: {len(all_articles)}")
-    logger.info(f"After validation: {len(validated_articles)}")
-    logger.info(f"After deduplication: {len(deduplicated_articles)}")
-    logger.info(f"After processed filter: {len(unprocessed_articles)}")
+    for report in stage_reports:
+        logger.info(f"After {report['name']}: {report['output']}")
     logger.info(f"After LLM filtering: {len(top_articles)}")
     logger.info(f"Final scraped articles: {len(scraped_content)}")
     logger.info(f"Total pipeline time: {overall_elapsed:.2f}s")
@@ -962,13 +1424,14 @@ async def get_top_articles(
     )
 
     # Log efficiency gains
-    if not force_regenerate:
-        skipped_articles = len(deduplicated_articles) - len(unprocessed_articles)
-        if skipped_articles > 0:
-            logger.info(
-                f"Efficiency gain: Skipped {skipped_articles} already-processed articles before expensive operations"
-            )
-    else:
+    network_inputs = sum(r["input"] for r in stage_reports if r["cost"] == "network")
+    network_stages = sum(1 for r in stage_reports if r["cost"] == "network")
+    skipped_checks = len(all_articles) * network_stages - network_inputs
+    if skipped_checks > 0:
+        logger.info(
+            f"Efficiency gain: Skipped {skipped_checks} network checks by filtering before validation"
+        )
+    if force_regenerate:
         logger.info(
             "force_regenerate=True: Processed all articles regardless of previous processing"
         )
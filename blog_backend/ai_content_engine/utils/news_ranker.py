@@ -0,0 +1,242 @@
+"""Cheap local relevance scoring used to cap how many candidates reach the LLM curator.
+
+Scores combine curated keyword weights, per-source weights, how many outlets
+reported the story, and (optionally) TF-IDF similarity to the news we have
+already published. Every LLM curation run is also appended to a JSONL log so
+the ranker can be evaluated offline against past LLM selections (see
+evaluate_news_ranker).
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+from ai_content_engine.utils.disk_cache import CACHE_DIR
+from ai_content_engine.utils.near_duplicates import normalize_tokens
+
+logger = logging.getLogger(__name__)
+
+# Maximum candidates passed to the LLM curator (0 = no cap)
+NEWS_PRERANK_TOP_K = int(os.getenv("NEWS_PRERANK_TOP_K", "60"))
+# Published news posts used as the TF-IDF reference set (0 = keyword/source only)
+NEWS_RANKER_ARCHIVE_SIZE = int(os.getenv("NEWS_RANKER_ARCHIVE_SIZE", "100"))
+ARCHIVE_SIMILARITY_WEIGHT = 3.0
+ALTERNATE_SOURCE_WEIGHT = 0.5
+MAX_ALTERNATE_SOURCE_BONUS = 1.5
+
+CURATION_LOG_PATH = os.getenv(
+    "CURATION_LOG_PATH", os.path.join(CACHE_DIR, "curation_log.jsonl")
+)
+
+# Patterns mirror the include/exclude rules of news_filter_prompt
+KEYWORD_WEIGHTS = {
+    r"\b(launch(es|ed)?|releas(e|es|ed)|introduc(e|es|ed|ing)|unveil(s|ed)?|announc(e|es|ed))\b": 1.5,
+    r"\b(model|models|llm|agent|agents|reasoning|multimodal)\b": 1.0,
+    r"\b(open[- ]source|open[- ]weights?|benchmark|dataset|framework|api)\b": 1.0,
+    r"\b(research|paper|breakthrough|state[- ]of[- ]the[- ]art|sota)\b": 0.75,
+    r"\b(acquir(e|es|ed)|acquisition|partnership|raises|funding)\b": 0.75,
+    r"\b(gpt|chatgpt|gemini|claude|llama|mistral|qwen|deepseek|grok|sora|copilot)\b": 1.0,
+    r"\b(openai|anthropic|deepmind|google|meta|microsoft|nvidia|hugging ?face|xai|apple)\b": 0.5,
+    r"\b(opinion|editorial|column|podcast|webinar|interview|newsletter|recap|roundup)\b": -1.5,
+    r"\b(how to|tips|guide|best .* (tools|apps)|deal|deals|discount|sponsored)\b": -2.0,
+    r"\b(ethics|hype|bubble|could|might|should|future of)\b": -0.5,
+}  # fmt: skip
+_KEYWORD_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), weight)
+    for pattern, weight in KEYWORD_WEIGHTS.items()
+]
+
+# Primary sources get priority, as in the curation prompt
+SOURCE_WEIGHTS = {
+    "OpenAI": 2.0,
+    "DeepMind": 2.0,
+    "Anthropic": 2.0,
+    "Hugging Face": 1.0,
+    "Microsoft": 1.0,
+    "Ollama": 0.5,
+    "The Decoder": 0.5,
+    "Hacker News": 0.5,
+    "VentureBeat": 0.25,
+    "KnowTechie AI": 0.0,
+}
+AGGREGATED_SOURCE_WEIGHT = -0.5
+
+
+def keyword_score(article: dict) -> float:
+    text = f"{article.get('title', '')} {article.get('description', '')}"
+    return sum(weight for pattern, weight in _KEYWORD_PATTERNS if pattern.search(text))
+
+
+def source_score(article: dict) -> float:
+    source = article.get("source") or ""
+    if "via NewsAPI" in source:
+        return AGGREGATED_SOURCE_WEIGHT
+    return SOURCE_WEIGHTS.get(source, 0.0)
+
+
+def _document_text(item: dict) -> str:
+    ai_metadata = item.get("ai_metadata")
+    if not isinstance(ai_metadata, dict):
+        ai_metadata = {}
+    title = (
+        item.get("title")
+        or item.get("headline")
+        or ai_metadata.get("original_article_title")
+        or ""
+    )
+    return f"{title} {item.get('description') or item.get('summary') or ''}"
+
+
+class ArchiveSimilarity:
+    """
+    TF-IDF cosine similarity between a candidate and the centroid of the
+    published archive, i.e. "how much does this look like what we publish".
+
+    Args:
+        archive: Published news posts (or article dicts) to compare against
+    """
+
+    def __init__(self, archive: list[dict]):
+        documents = [
+            Counter(normalize_tokens(_document_text(item))) for item in archive
+        ]
+        documents = [doc for doc in documents if doc]
+        document_frequency = Counter()
+        for doc in documents:
+            document_frequency.update(doc.keys())
+        self._num_documents = len(documents)
+        self._idf = {
+            term: math.log((1 + self._num_documents) / (1 + df)) + 1
+            for term, df in document_frequency.items()
+        }
+
+        centroid = Counter()
+        for doc in documents:
+            for term, weight in self._vectorize(doc).items():
+                centroid[term] += weight / self._num_documents
+        self._centroid = centroid
+        self._centroid_norm = math.sqrt(sum(w * w for w in centroid.values()))
+
+    def _vectorize(self, term_counts: Counter) -> dict[str, float]:
+        # Terms never seen in the archive can't add to similarity, so skip them
+        vector = {
+            term: count * self._idf[term]
+            for term, count in term_counts.items()
+            if term in self._idf
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        return {term: w / norm for term, w in vector.items()} if norm else {}
+
+    def score(self, article: dict) -> float:
+        if not self._centroid_norm:
+            return 0.0
+        vector = self._vectorize(Counter(normalize_tokens(_document_text(article))))
+        dot = sum(w * self._centroid.get(term, 0.0) for term, w in vector.items())
+        return dot / self._centroid_norm
+
+
+def score_articles(
+    articles: list[dict], archive: list[dict] | None = None
+) -> list[float]:
+    """Relevance score for each article (higher is more likely to be selected)."""
+    similarity = ArchiveSimilarity(archive) if archive else None
+    scores = []
+    for article in articles:
+        score = keyword_score(article) + source_score(article)
+        score += min(
+            ALTERNATE_SOURCE_WEIGHT * len(article.get("alternate_sources") or []),
+            MAX_ALTERNATE_SOURCE_BONUS,
+        )
+        if similarity is not None:
+            score += ARCHIVE_SIMILARITY_WEIGHT * similarity.score(article)
+        scores.append(score)
+    return scores
+
+
+def prerank_articles(
+    articles: list[dict],
+    archive: list[dict] | None = None,
+    top_k: int = NEWS_PRERANK_TOP_K,
+) -> list[dict]:
+    """Keeps the top_k highest-scoring articles, in their original order."""
+    start_time = time.time()
+    if top_k <= 0 or len(articles) <= top_k:
+        logger.info(
+            f"NEWS_RANKER: {len(articles)} candidates within cap of {top_k or 'unlimited'} - skipping pre-ranking"
+        )
+        return articles
+
+    scores = score_articles(articles, archive)
+    ranked = sorted(range(len(articles)), key=lambda i: scores[i], reverse=True)
+    keep = sorted(ranked[:top_k])
+
+    elapsed_time = time.time() - start_time
+    logger.info(
+        f"NEWS_RANKER: Kept top {top_k} of {len(articles)} candidates | Archive docs: {len(archive or [])} | Score cutoff: {scores[ranked[top_k - 1]]:.2f} | Time: {elapsed_time:.2f}s"
+    )
+    for i in ranked[top_k:]:
+        logger.debug(
+            f"NEWS_RANKER: Dropped ({scores[i]:.2f}) {articles[i].get('source')} | {articles[i].get('title', '')[:80]}"
+        )
+    return [articles[i] for i in keep]
+
+
+def record_curation_run(
+    candidates: list[dict],
+    selected: list[dict],
+    top_n: int,
+    fallback: str | None = None,
+) -> None:
+    """Appends one LLM curation run (what it saw and what it picked) to CURATION_LOG_PATH.
+
+    fallback says why the selection is not entirely the LLM's (e.g. a failed
+    tournament chunk), None for a clean run.
+    """
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "top_n": top_n,
+        "fallback": fallback,
+        "candidates": [
+            {
+                "title": a.get("title"),
+                "description": a.get("description"),
+                "source": a.get("source"),
+                "link": a.get("link"),
+                "alternate_sources": a.get("alternate_sources"),
+            }
+            for a in candidates
+        ],
+        "selected": [a.get("link") for a in selected],
+    }
+    try:
+        os.makedirs(os.path.dirname(CURATION_LOG_PATH), exist_ok=True)
+        with open(CURATION_LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        logger.warning(f"NEWS_RANKER: Failed to record curation run | Error: {e}")
+
+
+def load_curation_runs(
+    path: str = CURATION_LOG_PATH, include_fallback: bool = False
+) -> list[dict]:
+    """Reads the curation runs recorded by record_curation_run, skipping corrupt lines.
+
+    Runs tagged as fallbacks are skipped unless include_fallback is set.
+    """
+    runs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                run = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("NEWS_RANKER: Skipping corrupt curation log line")
+                continue
+            if run.get("fallback") and not include_fallback:
+                continue
+            runs.append(run)
+    return runs
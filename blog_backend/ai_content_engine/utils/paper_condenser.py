@@ -0,0 +1,181 @@
+"""Map-reduce condensation of long papers before outline generation.
+
+Papers under PAPER_DIGEST_THRESHOLD_TOKENS go to the planner unchanged. Longer
+ones are split at their section headings into chunks of at most
+PAPER_CHUNK_TOKENS (more, when the paper is too long for that many digests of
+MIN_CHUNK_DIGEST_TOKENS), every chunk is condensed by the LLM in parallel with
+an equal share of the PAPER_DIGEST_TOKENS budget, and the planner gets the
+digests in paper order. A chunk whose request fails is kept as a truncated excerpt, so
+one failure doesn't lose a part of the paper.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+
+from google.genai import types
+
+from ai_content_engine.prompts import paper_section_digest_prompt
+from ai_content_engine.utils.content_condenser import CHARS_PER_TOKEN, count_tokens
+from ai_content_engine.utils.llm_client import generate_content_async
+
+logger = logging.getLogger(__name__)
+
+PAPER_DIGEST_THRESHOLD_TOKENS = int(os.getenv("PAPER_DIGEST_THRESHOLD_TOKENS", "30000"))
+PAPER_CHUNK_TOKENS = int(os.getenv("PAPER_CHUNK_TOKENS", "8000"))
+# Total size of the digest handed to the planner
+PAPER_DIGEST_TOKENS = int(os.getenv("PAPER_DIGEST_TOKENS", "16000"))
+PAPER_DIGEST_MODEL = os.getenv("PAPER_DIGEST_MODEL", "gemini-2.0-flash")
+# Each chunk's digest gets at least this many tokens; this caps the chunk count
+MIN_CHUNK_DIGEST_TOKENS = 512
+WORDS_PER_TOKEN = 0.75
+
+_NAMED_SECTIONS = (
+    "abstract|introduction|background|related work|preliminaries|method|methods|"
+    "methodology|approach|model|experiments|experimental setup|evaluation|results|"
+    "analysis|discussion|limitations|conclusion|conclusions|appendix|acknowledgements?"
+)
+# A heading is a short line that is either numbered ("3", "3.2", "A.1", "A.",
+# "IV.") followed by a capitalized title without full stops, or one of the
+# usual section names in any case. Appendix letters need a dot or a number
+# after them, so wrapped lines like "A Large Language Model Survey" don't count
+_HEADING_PATTERN = re.compile(
+    rf"^(?:(?:\d+(?:\.\d+)*\.?|[A-H](?:\.\d+)+\.?|[A-H]\.|[IVX]+\.?)\s+[A-Z][^\n.]{{1,70}}"
+    rf"|(?:\d+\.?\s+)?(?i:{_NAMED_SECTIONS}))\s*$",
+    re.MULTILINE,
+)
+
+
+def split_sections(text: str) -> list[tuple[str, str]]:
+    """Splits paper text at heading lines into (heading, body) pairs; the part before the first heading gets heading ""."""
+    sections = []
+    last_heading, last_end = "", 0
+    for match in _HEADING_PATTERN.finditer(text):
+        heading = match.group(0).strip()
+        sections.append((last_heading, text[last_end : match.start()].strip()))
+        last_heading, last_end = heading, match.end()
+    sections.append((last_heading, text[last_end:].strip()))
+    return [(heading, body) for heading, body in sections if heading or body]
+
+
+def _split_oversized(heading: str, body: str, max_tokens: int) -> list[str]:
+    """Breaks a section longer than max_tokens into paragraph-aligned pieces."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    paragraphs = [
+        paragraph[i : i + max_chars]
+        for paragraph in re.split(r"\n\s*\n", body)
+        # pdfminer sometimes loses paragraph breaks; cut such walls of text
+        for i in range(0, len(paragraph), max_chars)
+    ]
+    pieces, current, current_tokens = [], [], 0
+    for paragraph in paragraphs:
+        tokens = count_tokens(paragraph)
+        if current and current_tokens + tokens > max_tokens:
+            pieces.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(paragraph)
+        current_tokens += tokens
+    if current:
+        pieces.append("\n\n".join(current))
+    return [
+        f"{heading} (part {i + 1})\n{piece}" if heading else piece
+        for i, piece in enumerate(pieces)
+    ]
+
+
+def chunk_sections(
+    sections: list[tuple[str, str]], max_tokens: int = PAPER_CHUNK_TOKENS
+) -> list[str]:
+    """Packs consecutive sections into chunks of at most max_tokens, splitting only sections that don't fit alone."""
+    chunks, current, current_tokens = [], [], 0
+    for heading, body in sections:
+        section_text = f"{heading}\n{body}" if heading else body
+        tokens = count_tokens(section_text)
+        if tokens > max_tokens:
+            if current:
+                chunks.append("\n\n".join(current))
+                current, current_tokens = [], 0
+            chunks.extend(_split_oversized(heading, body, max_tokens))
+            continue
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(section_text)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+async def _condense_chunk(chunk: str, token_budget: int, label: str) -> str:
+    """LLM digest of one chunk; on failure, the start of the chunk itself."""
+    try:
+        response = await generate_content_async(
+            model=PAPER_DIGEST_MODEL,
+            contents=[chunk],
+            config=types.GenerateContentConfig(
+                system_instruction=paper_section_digest_prompt.format(
+                    word_budget=int(token_budget * WORDS_PER_TOKEN)
+                ),
+                max_output_tokens=token_budget,
+            ),
+        )
+        if response.text:
+            return response.text.strip()
+        logger.warning(f"PAPER_DIGEST: Empty digest for {label} - using excerpt")
+    except Exception as e:
+        logger.error(
+            f"PAPER_DIGEST: Failed to condense {label} - using excerpt | Error: {e}"
+        )
+    return chunk[: token_budget * CHARS_PER_TOKEN]
+
+
+async def condense_paper_async(text: str, original_tokens: int | None = None) -> str:
+    """Returns text unchanged if it is under the threshold, else a section-by-section digest.
+
+    original_tokens is the text's token count, if the caller already has it.
+    """
+    if original_tokens is None:
+        original_tokens = count_tokens(text)
+    if original_tokens <= PAPER_DIGEST_THRESHOLD_TOKENS:
+        logger.debug(
+            f"PAPER_DIGEST: {original_tokens} tokens is under the {PAPER_DIGEST_THRESHOLD_TOKENS} token threshold - passing through"
+        )
+        return text
+
+    start_time = time.time()
+    sections = split_sections(text)
+    # Every digest needs MIN_CHUNK_DIGEST_TOKENS and together they must fit in
+    # PAPER_DIGEST_TOKENS, so very long papers are cut into larger chunks
+    max_chunks = max(1, PAPER_DIGEST_TOKENS // MIN_CHUNK_DIGEST_TOKENS)
+    chunk_tokens = max(PAPER_CHUNK_TOKENS, -(-original_tokens // max_chunks))
+    chunks = chunk_sections(sections, chunk_tokens)
+    while len(chunks) > max_chunks:
+        chunk_tokens *= 2
+        chunks = chunk_sections(sections, chunk_tokens)
+    token_budget = PAPER_DIGEST_TOKENS // len(chunks)
+    logger.info(
+        f"PAPER_DIGEST: Condensing {original_tokens} tokens in {len(chunks)} chunks of up to {chunk_tokens} tokens | {token_budget} tokens per digest"
+    )
+
+    digests = await asyncio.gather(
+        *(
+            _condense_chunk(chunk, token_budget, f"chunk {i + 1}/{len(chunks)}")
+            for i, chunk in enumerate(chunks)
+        )
+    )
+    digest = "\n\n".join(digests)
+    logger.info(
+        f"PAPER_DIGEST: Condensed {original_tokens} to {count_tokens(digest)} tokens | Time: {time.time() - start_time:.2f}s"
+    )
+    return digest
+
+
+def condense_paper(text: str) -> str:
+    """Blocking wrapper around condense_paper_async, for the synchronous generator."""
+    original_tokens = count_tokens(text)
+    if original_tokens <= PAPER_DIGEST_THRESHOLD_TOKENS:
+        return text
+    return asyncio.run(condense_paper_async(text, original_tokens))
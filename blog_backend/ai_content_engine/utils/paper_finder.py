@@ -1,9 +1,9 @@
-import requests
 import datetime
 import json
 import time
 import os
 import logging
+from ai_content_engine.utils.providers import http_get
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,7 @@ def get_top_papers(days=7):
     papers = []
     while True:
         params = {"page": page, "ordering": "-published", "items_per_page": 500}
-        response = requests.get(papers_with_code_base, params=params)
+        response = http_get(papers_with_code_base, params=params)
         if response.status_code != 200:
             break
         papers_data = response.json()["results"]
@@ -37,7 +37,7 @@ def get_top_papers(days=7):
                         continue
                     time.sleep(0.1)
                     repos_url = f"{papers_with_code_base}{paper['id']}/repositories/"
-                    repos_response = requests.get(repos_url)
+                    repos_response = http_get(repos_url)
                     repos = repos_response.json()["results"]
                     stars = 0
                     for repo in repos:
@@ -1,4 +1,3 @@
-import requests
 import pathlib
 import re
 import xml.etree.ElementTree as ET
@@ -6,6 +5,7 @@ from datetime import datetime
 import os
 from pdfminer.high_level import extract_text
 import logging
+from ai_content_engine.utils.providers import http_get
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +19,7 @@ def get_arxiv_published_date(arxiv_id):
         str: The published date in ISO format
     """
     url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
-    response = requests.get(url)
+    response = http_get(url)
 
     if response.status_code != 200:
         raise Exception(f"Failed to retrieve data: HTTP {response.status_code}")
@@ -55,7 +55,7 @@ def download_arxiv_pdf(arxiv_url):
     PDF_DIR = os.path.join(PAPERS_DIR, "pdf")
     os.makedirs(PDF_DIR, exist_ok=True)
 
-    response = requests.get(arxiv_url)
+    response = http_get(arxiv_url)
     paper_id = extract_arxiv_id(arxiv_url)
     save_path = os.path.join(PDF_DIR, f"{paper_id}.pdf")
 
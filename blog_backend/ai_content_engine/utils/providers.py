@@ -0,0 +1,261 @@
+"""Chooses between the live services and their offline fakes (see fake_providers.py).
+
+FAKE_PROVIDERS lists the services to replace, comma separated: llm (Gemini),
+search (Tavily), storage (Supabase image storage), http (feeds, article
+pages, NewsAPI, Hacker News, arXiv, Papers with Code) or all. Requests to the
+blog's own API (localhost) always go out live, so a local server can take the
+generated posts. Unset, everything is live.
+
+The fakes still go through llm_client's rate limiter, cache and usage
+accounting, so LLM_RATE_LIMITS paces them like the live API.
+
+Fixtures: with RECORD_FIXTURES_DIR set, responses from the live HTTP, LLM
+and search services are saved there, one JSON file per request. Pointing
+FAKE_PROVIDER_FIXTURES at such a directory makes the fakes replay the
+recorded responses, falling back to generated ones for requests that were
+not recorded. Image generation calls (cache=False in llm_client) are not
+recorded.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+from urllib.parse import urlencode, urlparse
+
+import aiohttp
+import requests
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_KINDS = ("llm", "search", "storage", "http")
+
+
+def _parse_fake_providers(spec: str) -> frozenset[str]:
+    kinds = {kind.strip().lower() for kind in spec.split(",") if kind.strip()}
+    if "all" in kinds:
+        return frozenset(PROVIDER_KINDS)
+    unknown = kinds - set(PROVIDER_KINDS)
+    if unknown:
+        logger.warning(
+            f"FAKE_PROVIDER: Ignoring unknown FAKE_PROVIDERS entries {sorted(unknown)}"
+        )
+    return frozenset(kinds & set(PROVIDER_KINDS))
+
+
+FAKE_PROVIDERS = _parse_fake_providers(os.getenv("FAKE_PROVIDERS", ""))
+if FAKE_PROVIDERS:
+    logger.warning(f"FAKE_PROVIDER: Using offline fakes for {sorted(FAKE_PROVIDERS)}")
+
+RECORD_FIXTURES_DIR = os.getenv("RECORD_FIXTURES_DIR") or None
+FAKE_PROVIDER_FIXTURES = os.getenv("FAKE_PROVIDER_FIXTURES") or None
+
+_LOCAL_HOSTS = {"localhost", "127.0.0.1", "0.0.0.0", "::1"}
+# Describe the live transfer rather than the body we store
+_UNRECORDED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def use_fake(kind: str) -> bool:
+    """True if the service `kind` (one of PROVIDER_KINDS) is replaced by its fake."""
+    return kind in FAKE_PROVIDERS
+
+
+def _is_local(url: str) -> bool:
+    return urlparse(url).hostname in _LOCAL_HOSTS
+
+
+def url_with_params(url: str, params=None) -> str:
+    """The URL a request with query params goes to; fixtures are keyed on it."""
+    if not params:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+
+
+class FixtureStore:
+    """
+    Recorded responses, one JSON file per request under <root>/<kind>/.
+
+    Args:
+        root: Fixture directory
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+        self.replayed: dict[str, int] = {}
+
+    def _path(self, kind: str, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:40]
+        return os.path.join(self.root, kind, f"{digest}.json")
+
+    def get(self, kind: str, key: str) -> dict | None:
+        path = self._path(kind, key)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            fixture = json.load(f)
+        with self._lock:
+            self.replayed[kind] = self.replayed.get(kind, 0) + 1
+        return fixture["response"]
+
+    def put(self, kind: str, key: str, response: dict) -> None:
+        path = self._path(kind, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "response": response}, f)
+
+
+_recorder = FixtureStore(RECORD_FIXTURES_DIR) if RECORD_FIXTURES_DIR else None
+_replayer = FixtureStore(FAKE_PROVIDER_FIXTURES) if FAKE_PROVIDER_FIXTURES else None
+
+
+def recording_fixtures(kind: str) -> bool:
+    """True if responses from the live `kind` service are being recorded."""
+    return _recorder is not None and not use_fake(kind)
+
+
+def record_fixture(kind: str, key: str, response: dict) -> None:
+    """Saves a live response (no-op unless recording_fixtures(kind))."""
+    if not recording_fixtures(kind):
+        return
+    try:
+        _recorder.put(kind, key, response)
+    except OSError as e:
+        logger.warning(f"FAKE_PROVIDER: Could not record {kind} fixture | Error: {e}")
+
+
+def replay_fixture(kind: str, key: str) -> dict | None:
+    """The recorded response for a request, if FAKE_PROVIDER_FIXTURES has one."""
+    return _replayer.get(kind, key) if _replayer is not None else None
+
+
+def get_fixture_stats() -> dict[str, int]:
+    """Recorded responses replayed so far, per service."""
+    return dict(_replayer.replayed) if _replayer is not None else {}
+
+
+def record_http(method: str, url: str, status: int, headers, body: bytes) -> None:
+    if not recording_fixtures("http") or _is_local(url):
+        return
+    record_fixture(
+        "http",
+        f"{method} {url}",
+        {
+            "status": status,
+            "headers": {
+                k: v for k, v in headers.items() if k.lower() not in _UNRECORDED_HEADERS
+            },
+            "body_b64": base64.b64encode(body).decode("ascii"),
+        },
+    )
+
+
+class _RecordingRequest:
+    """Wraps an aiohttp request context, recording the response it yields."""
+
+    def __init__(self, method: str, url: str, request):
+        self._method = method
+        self._url = url
+        self._request = request
+
+    async def __aenter__(self):
+        response = await self._request.__aenter__()
+        # aiohttp keeps the body, so the caller can still read it
+        body = await response.read() if self._method == "GET" else b""
+        record_http(self._method, self._url, response.status, response.headers, body)
+        return response
+
+    async def __aexit__(self, *exc_info):
+        return await self._request.__aexit__(*exc_info)
+
+
+class _RecordingSession:
+    """Wraps an aiohttp.ClientSession, recording every GET and HEAD."""
+
+    def __init__(self, session: aiohttp.ClientSession):
+        self._session = session
+
+    def get(self, url, params=None, **kwargs):
+        return _RecordingRequest(
+            "GET",
+            url_with_params(str(url), params),
+            self._session.get(url, params=params, **kwargs),
+        )
+
+    def head(self, url, **kwargs):
+        return _RecordingRequest("HEAD", str(url), self._session.head(url, **kwargs))
+
+    async def close(self) -> None:
+        await self._session.close()
+
+    async def __aenter__(self):
+        await self._session.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return await self._session.__aexit__(*exc_info)
+
+
+class _RecordingScrapeSession:
+    """Wraps a curl_cffi AsyncSession, recording every GET."""
+
+    def __init__(self, session):
+        self._session = session
+
+    async def get(self, url, **kwargs):
+        response = await self._session.get(url, **kwargs)
+        record_http(
+            "GET", url, response.status_code, response.headers, response.content
+        )
+        return response
+
+    async def close(self) -> None:
+        await self._session.close()
+
+    async def __aenter__(self):
+        await self._session.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return await self._session.__aexit__(*exc_info)
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """requests.get, or its fake for non-local URLs when http is faked."""
+    if use_fake("http") and not _is_local(url):
+        from ai_content_engine.utils.fake_providers import fake_http_get
+
+        return fake_http_get(url, **kwargs)
+    response = requests.get(url, **kwargs)
+    record_http(
+        "GET",
+        url_with_params(url, kwargs.get("params")),
+        response.status_code,
+        response.headers,
+        response.content,
+    )
+    return response
+
+
+def http_session(**kwargs):
+    """A new aiohttp.ClientSession, or its fake when http is faked."""
+    if use_fake("http"):
+        from ai_content_engine.utils.fake_providers import FakeHTTPSession
+
+        return FakeHTTPSession(**kwargs)
+    session = aiohttp.ClientSession(**kwargs)
+    return _RecordingSession(session) if recording_fixtures("http") else session
+
+
+def scrape_session(**kwargs):
+    """A new curl_cffi AsyncSession for scraping pages, or its fake when http is faked."""
+    if use_fake("http"):
+        from ai_content_engine.utils.fake_providers import FakeScrapeSession
+
+        return FakeScrapeSession(**kwargs)
+    from curl_cffi.requests import AsyncSession
+
+    session = AsyncSession(**kwargs)
+    return _RecordingScrapeSession(session) if recording_fixtures("http") else session
@@ -0,0 +1,179 @@
+"""Per-model request and token budgets for LLM calls.
+
+Each model gets two token buckets: one for requests per minute and one for
+tokens per minute. A call is admitted as soon as both buckets can cover it,
+so a pipeline runs as fast as the quota actually allows instead of sleeping
+a fixed minute whenever it might be over. Token use is reserved from an
+estimate before the call and settled against the reported usage afterwards.
+
+Limits are opt-in: set LLM_RATE_LIMITS to your quota per model, e.g.
+"gemini-2.0-flash=2000:4000000,gemini-2.5-pro=150:2000000" (RPM:TPM,
+0 = unlimited), or to "free" for the free-tier quotas in FREE_TIER_LIMITS
+(entries after "free" override them). Models without limits are never
+delayed up front; a 429 from the API still pauses that model's calls, and
+callers that burst (image generation) fall back to their own pacing.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# (requests per minute, tokens per minute); the Gemini API free tier
+FREE_TIER_LIMITS = {
+    "gemini-2.0-flash": (15, 1_000_000),
+    "gemini-2.0-flash-lite": (30, 1_000_000),
+    "gemini-2.5-flash": (10, 250_000),
+    "gemini-2.5-pro": (5, 250_000),
+    "gemini-2.0-flash-preview-image-generation": (10, 200_000),
+}
+# Pause after a 429 that came without a retry delay, for models without an RPM limit
+RATE_LIMIT_BACKOFF_SECONDS = 10.0
+# Waits longer than this are logged at INFO, shorter ones at DEBUG
+RATE_LIMIT_LOG_WAIT_SECONDS = 1.0
+
+
+def _parse_limits(spec: str) -> dict[str, tuple[int, int]]:
+    limits = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        if item.strip().lower() == "free":
+            limits.update(FREE_TIER_LIMITS)
+            continue
+        try:
+            model, values = item.split("=", 1)
+            rpm, tpm = values.split(":", 1)
+            limits[model.strip()] = (int(rpm), int(tpm))
+        except ValueError:
+            logger.warning(
+                f"RATE_LIMIT: Ignoring malformed LLM_RATE_LIMITS entry '{item}'"
+            )
+    return limits
+
+
+class TokenBucket:
+    """
+    Bucket of `capacity` units refilled evenly over `period` seconds.
+
+    The level may go negative when a call turns out to cost more than was
+    reserved for it; later callers then wait for the debt to refill.
+
+    Args:
+        capacity: Units available per period
+        period: Seconds to refill from empty to full
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.level = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount units are available (0 if they are now)."""
+        self._refill(now)
+        # A single call larger than the bucket is admitted once it is full
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self.level -= amount
+
+
+class RateLimiter:
+    """
+    Admits LLM calls against per-model RPM and TPM budgets, from threads or coroutines.
+
+    Args:
+        limits: Model name -> (requests per minute, tokens per minute); 0 = unlimited
+    """
+
+    def __init__(self, limits: dict[str, tuple[int, int]]):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[TokenBucket | None, TokenBucket | None]] = {}
+        for model, (rpm, tpm) in limits.items():
+            self._buckets[model] = (
+                TokenBucket(rpm) if rpm > 0 else None,
+                TokenBucket(tpm) if tpm > 0 else None,
+            )
+        # Models the API reported as rate limited, and when they may be called again
+        self._paused_until: dict[str, float] = {}
+
+    def is_limited(self, model: str) -> bool:
+        """True if calls to model are paced by an RPM or TPM budget."""
+        return any(self._buckets.get(model, (None, None)))
+
+    def _try_acquire(self, model: str, tokens: int) -> float:
+        """Takes one request and `tokens` tokens if available, else returns the wait."""
+        requests, token_budget = self._buckets.get(model, (None, None))
+        now = time.monotonic()
+        with self._lock:
+            wait = max(
+                self._paused_until.get(model, 0.0) - now,
+                requests.wait_time(1, now) if requests else 0.0,
+                token_budget.wait_time(tokens, now) if token_budget else 0.0,
+            )
+            if wait <= 0:
+                if requests:
+                    requests.consume(1)
+                if token_budget:
+                    token_budget.consume(min(tokens, token_budget.capacity))
+        return wait
+
+    def _log_wait(self, model: str, waited: float) -> None:
+        if waited >= RATE_LIMIT_LOG_WAIT_SECONDS:
+            logger.info(f"RATE_LIMIT: Waited {waited:.1f}s for {model} budget")
+        elif waited > 0:
+            logger.debug(f"RATE_LIMIT: Waited {waited:.2f}s for {model} budget")
+
+    def acquire(self, model: str, tokens: int = 0) -> None:
+        """Blocks until a call to model using about `tokens` tokens may be made."""
+        start = time.monotonic()
+        while (wait := self._try_acquire(model, tokens)) > 0:
+            time.sleep(wait)
+        self._log_wait(model, time.monotonic() - start)
+
+    async def acquire_async(self, model: str, tokens: int = 0) -> None:
+        """Async version of acquire; waits without blocking the event loop."""
+        start = time.monotonic()
+        while (wait := self._try_acquire(model, tokens)) > 0:
+            await asyncio.sleep(wait)
+        self._log_wait(model, time.monotonic() - start)
+
+    def settle(self, model: str, reserved: int, actual: int) -> None:
+        """Corrects the token budget once the call's real usage is known."""
+        _, token_budget = self._buckets.get(model, (None, None))
+        if token_budget is None:
+            return
+        with self._lock:
+            token_budget.consume(actual - min(reserved, token_budget.capacity))
+
+    def backoff(self, model: str, seconds: float | None = None) -> None:
+        """Holds back further calls to model after the API reported it rate limited.
+
+        Without a retry delay from the API, the pause is one request's worth
+        of refill (or RATE_LIMIT_BACKOFF_SECONDS if the model has no RPM limit).
+        """
+        requests, _ = self._buckets.get(model, (None, None))
+        if seconds is None:
+            seconds = 1 / requests.rate if requests else RATE_LIMIT_BACKOFF_SECONDS
+        with self._lock:
+            self._paused_until[model] = max(
+                self._paused_until.get(model, 0.0), time.monotonic() + seconds
+            )
+        logger.warning(
+            f"RATE_LIMIT: {model} was rate limited - pausing its calls for {seconds:.0f}s"
+        )
+
+
+llm_rate_limiter = RateLimiter(_parse_limits(os.getenv("LLM_RATE_LIMITS", "")))
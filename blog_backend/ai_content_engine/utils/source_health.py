@@ -0,0 +1,245 @@
+"""Per-source fetch statistics kept across runs, used to schedule news sources.
+
+Every fetch records its latency and outcome, and whether the source had
+anything new. From that history the fetcher decides whether a source is
+worth requesting this run (dead sources back off exponentially, sources
+that rarely change are polled less often) and how long to wait for it.
+After curation, the number of each source's articles the LLM selected is
+recorded as its yield.
+"""
+
+import logging
+import os
+import statistics
+import threading
+import time
+from datetime import datetime, timezone
+
+from ai_content_engine.utils.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Number of recent fetches (latency/outcome) and content changes remembered
+SOURCE_HEALTH_WINDOW = 50
+SOURCE_CHANGE_WINDOW = 20
+# Consecutive failures before a source is skipped, and the backoff that follows
+SOURCE_FAILURES_BEFORE_BACKOFF = int(os.getenv("SOURCE_FAILURES_BEFORE_BACKOFF", "2"))
+SOURCE_BACKOFF_BASE_MINUTES = float(os.getenv("SOURCE_BACKOFF_BASE_MINUTES", "60"))
+SOURCE_BACKOFF_MAX_HOURS = float(os.getenv("SOURCE_BACKOFF_MAX_HOURS", "24"))
+# Sources that change rarely are re-polled after a quarter of their typical
+# gap between changes, capped at this many hours
+SOURCE_MAX_POLL_INTERVAL_HOURS = float(
+    os.getenv("SOURCE_MAX_POLL_INTERVAL_HOURS", "12")
+)
+# Adaptive timeout: a multiple of the p95 latency of the source's full
+# downloads (not 304s, which say nothing about body size), never below the floor
+SOURCE_TIMEOUT_P95_MULTIPLIER = 3.0
+SOURCE_MIN_TIMEOUT = 5.0
+
+_health_cache = DiskCache("source_health")
+# Records are read, changed and written back from the news poller thread as
+# well as from jobs; one update must not overwrite another
+_health_lock = threading.Lock()
+
+
+def health_key(article_source: str) -> str:
+    """Maps an article's "source" field to the source it was fetched from."""
+    return "NewsAPI" if article_source.endswith("via NewsAPI") else article_source
+
+
+def _load(source: str) -> dict:
+    return _health_cache.get(source) or {
+        "latencies": [],
+        "outcomes": [],
+        "body_latencies": [],
+        "change_times": [],
+        "consecutive_failures": 0,
+        "last_error": None,
+        "last_fetch_at": None,
+        "next_fetch_at": None,
+        "fetched_total": 0,
+        "selected_total": 0,
+    }
+
+
+def _percentile(values: list[float], percent: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return round(ordered[index], 3)
+
+
+def _median_change_interval(change_times: list[float]) -> float | None:
+    """Typical seconds between content changes (needs at least three changes)."""
+    if len(change_times) < 3:
+        return None
+    gaps = [b - a for a, b in zip(change_times, change_times[1:])]
+    return statistics.median(gaps)
+
+
+def record_fetch(
+    source: str,
+    elapsed: float,
+    ok: bool,
+    changed: bool | None = None,
+    error: str | None = None,
+    not_modified: bool = False,
+) -> None:
+    """Records one fetch and schedules the source's next fetch.
+
+    changed is True when the source returned new content, False when it was
+    unchanged (e.g. a 304) and None when unknown. not_modified marks a 304,
+    whose latency is left out of the adaptive timeout.
+    """
+    with _health_lock:
+        _record_fetch(source, elapsed, ok, changed, error, not_modified)
+
+
+def _record_fetch(
+    source: str,
+    elapsed: float,
+    ok: bool,
+    changed: bool | None,
+    error: str | None,
+    not_modified: bool,
+) -> None:
+    now = time.time()
+    health = _load(source)
+    health["latencies"] = (health["latencies"] + [elapsed])[-SOURCE_HEALTH_WINDOW:]
+    health["outcomes"] = (health["outcomes"] + [ok])[-SOURCE_HEALTH_WINDOW:]
+    health["last_fetch_at"] = now
+    health["next_fetch_at"] = None
+
+    if ok:
+        health["consecutive_failures"] = 0
+        if not not_modified:
+            # Records from before body latencies were kept start empty
+            health["body_latencies"] = (health.get("body_latencies", []) + [elapsed])[
+                -SOURCE_HEALTH_WINDOW:
+            ]
+        if changed:
+            health["change_times"] = (health["change_times"] + [now])[
+                -SOURCE_CHANGE_WINDOW:
+            ]
+        interval = _median_change_interval(health["change_times"])
+        if interval is not None:
+            poll_after = min(interval / 4, SOURCE_MAX_POLL_INTERVAL_HOURS * 3600)
+            health["next_fetch_at"] = now + poll_after
+    else:
+        health["consecutive_failures"] += 1
+        health["last_error"] = error
+        excess = health["consecutive_failures"] - SOURCE_FAILURES_BEFORE_BACKOFF
+        if excess >= 0:
+            backoff = min(
+                SOURCE_BACKOFF_BASE_MINUTES * 60 * 2**excess,
+                SOURCE_BACKOFF_MAX_HOURS * 3600,
+            )
+            health["next_fetch_at"] = now + backoff
+            logger.warning(
+                f"SOURCE_HEALTH: {source} failed {health['consecutive_failures']} times in a row - backing off for {backoff / 60:.0f} min"
+            )
+
+    _health_cache.set(source, health)
+
+
+def should_fetch(source: str) -> tuple[bool, str]:
+    """Whether source is due for a fetch, with the reason when it isn't."""
+    health = _health_cache.get(source)
+    if not health or not health.get("next_fetch_at"):
+        return True, ""
+
+    wait = health["next_fetch_at"] - time.time()
+    if wait <= 0:
+        return True, ""
+    if health["consecutive_failures"]:
+        return False, (
+            f"backing off after {health['consecutive_failures']} failures "
+            f"({wait / 60:.0f} min left)"
+        )
+    return False, f"rarely changes, next poll in {wait / 60:.0f} min"
+
+
+def fetch_timeout(source: str, default: float) -> float:
+    """Timeout for the next fetch: default, tightened once enough full downloads are timed."""
+    health = _health_cache.get(source)
+    if not health:
+        return default
+    body_latencies = health.get("body_latencies", [])
+    if len(body_latencies) < 5:
+        return default
+    p95 = _percentile(body_latencies, 95)
+    return min(default, max(SOURCE_MIN_TIMEOUT, SOURCE_TIMEOUT_P95_MULTIPLIER * p95))
+
+
+def record_yield(candidates: list[dict], selected: list[dict]) -> None:
+    """Adds how many of each source's candidates the curator selected this run."""
+    fetched_counts: dict[str, int] = {}
+    selected_counts: dict[str, int] = {}
+    for article in candidates:
+        key = health_key(article.get("source") or "Unknown")
+        fetched_counts[key] = fetched_counts.get(key, 0) + 1
+    for article in selected:
+        key = health_key(article.get("source") or "Unknown")
+        selected_counts[key] = selected_counts.get(key, 0) + 1
+
+    with _health_lock:
+        for source, fetched in fetched_counts.items():
+            health = _load(source)
+            health["fetched_total"] += fetched
+            health["selected_total"] += selected_counts.get(source, 0)
+            _health_cache.set(source, health)
+
+
+def reset_source(source: str) -> None:
+    """Forgets a source's history, so it is fetched on the next run."""
+    with _health_lock:
+        _health_cache.delete(source)
+
+
+def _iso(timestamp: float | None) -> str | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def get_source_stats(sources: list[str] | None = None) -> dict[str, dict]:
+    """Summarized health of each known source (or of the given ones)."""
+    if sources is None:
+        sources = _health_cache.keys()
+
+    stats = {}
+    for source in sources:
+        health = _health_cache.get(source)
+        if not health:
+            continue
+        outcomes = health["outcomes"]
+        fetch_ok, reason = should_fetch(source)
+        interval = _median_change_interval(health["change_times"])
+        stats[source] = {
+            "fetches": len(outcomes),
+            "error_rate": (
+                round(outcomes.count(False) / len(outcomes), 3) if outcomes else None
+            ),
+            "latency_p50": _percentile(health["latencies"], 50),
+            "latency_p95": _percentile(health["latencies"], 95),
+            "consecutive_failures": health["consecutive_failures"],
+            "last_error": health["last_error"],
+            "fetched_total": health["fetched_total"],
+            "selected_total": health["selected_total"],
+            "yield": (
+                round(health["selected_total"] / health["fetched_total"], 3)
+                if health["fetched_total"]
+                else None
+            ),
+            "median_change_interval_hours": (
+                round(interval / 3600, 1) if interval is not None else None
+            ),
+            "last_change_at": _iso(
+                health["change_times"][-1] if health["change_times"] else None
+            ),
+            "last_fetch_at": _iso(health["last_fetch_at"]),
+            "next_fetch_at": _iso(health["next_fetch_at"]),
+            "status": "ok" if fetch_ok else reason,
+        }
+    return stats
@@ -29,11 +29,17 @@ from ai_content_engine.agents.image_gen_agent import (
     generate_image_from_prompt,
 )
 from .utils.image_uploader import upload_images_batch, upload_base64_image
+from .utils.news_ingestion import get_stored_news_candidates
 from ai_content_engine.agents.ai101_agent import (
     select_ai101_term,
     generate_ai101_explainer,
 )
 from ai_content_engine.models import ProcessedArticle
+from ai_content_engine.utils.llm_usage import track_llm_usage
+from .repositories.llm_usage_repository import save_usage_run
+from contextlib import contextmanager
+import contextvars
+import functools
 
 load_dotenv()
 
@@ -48,6 +54,54 @@ def find_latest_top_papers() -> Optional[Dict[str, Any]]:
     return get_latest_papers_from_db()
 
 
+# Posts submitted by the generation job running in the current context
+_current_job: contextvars.ContextVar[Optional[Dict[str, int]]] = contextvars.ContextVar(
+    "current_job", default=None
+)
+
+
+@contextmanager
+def _track_job(job_type: str):
+    """Records the LLM usage and number of posts of a generation job once it finishes."""
+    started_at = datetime.utcnow()
+    job = {"posts_created": 0}
+    token = _current_job.set(job)
+    try:
+        with track_llm_usage(label=f"{job_type} job") as usage:
+            yield
+    finally:
+        _current_job.reset(token)
+        summary = usage.summary()
+        if summary["calls"]:
+            try:
+                save_usage_run(job_type, started_at, summary, job["posts_created"])
+            except Exception as e:
+                logger.error(f"Failed to save LLM usage for {job_type} job: {e}")
+
+
+def _tracked_job(job_type: str):
+    """Decorator that runs a (sync or async) generation job under _track_job."""
+
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with _track_job(job_type):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _track_job(job_type):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 def generate_slug(title: str) -> str:
     """Generate a URL slug from the title."""
     # Convert to lowercase and replace spaces with hyphens
@@ -77,6 +131,9 @@ def _submit_post(post_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         )
         response.raise_for_status()
         logger.info(f"Successfully submitted post: {title}")
+        job = _current_job.get()
+        if job is not None:
+            job["posts_created"] += 1
         return response.json()
     except requests.exceptions.RequestException as e:
         logger.error(f"API error while submitting post '{title}': {e}")
@@ -110,6 +167,8 @@ def create_news_post(
     }
     if rex_take:
         ai_metadata["rex_take"] = rex_take
+    if headline_article.llm_usage:
+        ai_metadata["llm_usage"] = headline_article.llm_usage
 
     post_data = {
         "title": blog_title,
@@ -152,6 +211,7 @@ def _fetch_existing_ai101_terms(max_posts: int = 1000) -> set[str]:
         return set()
 
 
+@_tracked_job("ai101")
 def create_ai101_post(term: str | None = None) -> Optional[Dict[str, Any]]:
     """Create a short AI 101 explainer post. Follows news_agent output shape.
 
@@ -159,6 +219,11 @@ def create_ai101_post(term: str | None = None) -> Optional[Dict[str, Any]]:
     - Uses ArticleSummaryResponse format for generation (headline, subheading, content).
     - Saves as Post with ai_metadata: { post_type: "ai101", term, aliases }.
     """
+    with track_llm_usage() as usage:
+        return _create_ai101_post(term, usage)
+
+
+def _create_ai101_post(term: Optional[str], usage) -> Optional[Dict[str, Any]]:
     try:
         used_terms = _fetch_existing_ai101_terms()
         selected_aliases: list[str] = []
@@ -211,6 +276,7 @@ def create_ai101_post(term: str | None = None) -> Optional[Dict[str, Any]]:
         }
         if result.rex_take:
             ai_metadata["rex_take"] = result.rex_take
+        ai_metadata["llm_usage"] = usage.summary()
 
         post_data = {
             "title": blog_title,
@@ -236,7 +302,8 @@ def create_blog_post(
     """Create a blog post from an arXiv paper."""
     # Step 1: Generate content
     try:
-        blog_post, blog_title, blog_summary = generate_blog_post_content(paper_id)
+        with track_llm_usage() as usage:
+            blog_post, blog_title, blog_summary = generate_blog_post_content(paper_id)
     except Exception as e:
         logger.error(
             f"Error generating blog content for {paper_id}: {e}", exc_info=True
@@ -254,7 +321,11 @@ def create_blog_post(
         "codeSnippets": [],  # Placeholder for future code snippets
     }
 
-    ai_metadata = {"paper_id": paper_id, "post_type": "regular"}
+    ai_metadata = {
+        "paper_id": paper_id,
+        "post_type": "regular",
+        "llm_usage": usage.summary(),
+    }
 
     if published_date:
         try:
@@ -335,6 +406,7 @@ def find_papers_background(days=7, num_papers=10) -> None:
     find_top_papers_and_save(days=days, num_papers=num_papers)
 
 
+@_tracked_job("regular")
 def process_papers_to_posts(force_regenerate: bool = False) -> bool:
     """Process papers from database and create posts."""
     try:
@@ -471,9 +543,10 @@ def create_curated_blog_post(
     Similar to create_blog_post but marks the post as curated and published."""
     # Step 1: Generate content
     try:
-        blog_post, blog_title, blog_summary = generate_blog_post_content(
-            paper_id, curated=True
-        )
+        with track_llm_usage() as usage:
+            blog_post, blog_title, blog_summary = generate_blog_post_content(
+                paper_id, curated=True
+            )
     except Exception as e:
         logger.error(
             f"Error generating curated blog content for {paper_id}: {e}", exc_info=True
@@ -490,7 +563,11 @@ def create_curated_blog_post(
         "codeSnippets": [],
     }
 
-    ai_metadata = {"paper_id": paper_id, "post_type": "curated"}
+    ai_metadata = {
+        "paper_id": paper_id,
+        "post_type": "curated",
+        "llm_usage": usage.summary(),
+    }
 
     published_date = get_arxiv_published_date(paper_id)
     ai_metadata["published_date"] = published_date
@@ -510,6 +587,7 @@ def create_curated_blog_post(
     return _submit_post(post_data)
 
 
+@_tracked_job("curated")
 def process_curated_papers(
     paper_ids: list[str], notes: Dict[str, str] = None, force_regenerate: bool = False
 ) -> Dict[str, Any]:
@@ -558,6 +636,7 @@ def process_curated_papers_background(
     )
 
 
+@_tracked_job("weekly_summary")
 def create_weekly_summary_post() -> Optional[Dict[str, Any]]:
     """Create a weekly summary blog post from recent posts."""
     try:
@@ -569,7 +648,8 @@ def create_weekly_summary_post() -> Optional[Dict[str, Any]]:
             return None
 
         # Generate the summary content using your existing function
-        weekly_content = generate_weekly_summary(recent_summaries)
+        with track_llm_usage() as usage:
+            weekly_content = generate_weekly_summary(recent_summaries)
     except Exception as e:
         logger.error(f"Error generating weekly summary content: {e}", exc_info=True)
         return None
@@ -589,6 +669,7 @@ def create_weekly_summary_post() -> Optional[Dict[str, Any]]:
         "summary_period": period,
         "included_posts": [s["id"] for s in recent_summaries],
         "post_count": len(recent_summaries),
+        "llm_usage": usage.summary(),
     }
 
     post_data = {
@@ -640,6 +721,7 @@ def process_papers_and_create_posts(
     return result or posts_created
 
 
+@_tracked_job("news")
 async def process_news_headlines_to_posts(
     force_regenerate: bool = False, days_ago: int = 7, top_n: int = 12
 ) -> bool:
@@ -647,8 +729,15 @@ async def process_news_headlines_to_posts(
     try:
         # Note: force_regenerate is now handled in the news_finder pipeline
         # This eliminates duplicate checks and improves efficiency
+        # Use the article store kept fresh by the ingestion poller, if enabled
+        candidate_articles = await asyncio.to_thread(
+            get_stored_news_candidates, days_ago
+        )
         headlines = await generate_news_headlines(
-            days_ago=days_ago, top_n=top_n, force_regenerate=force_regenerate
+            days_ago=days_ago,
+            top_n=top_n,
+            force_regenerate=force_regenerate,
+            candidate_articles=candidate_articles,
         )  # This calls generate_news_headlines from generator.py
         if not headlines:
             logger.info("No news headlines generated.")
@@ -0,0 +1,55 @@
+"""Admin-only operational endpoints."""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from ..auth import verify_admin
+from ..repositories.llm_usage_repository import get_usage_summary
+from ai_content_engine.utils.llm_cache import clear_llm_cache, get_llm_cache_stats
+from ai_content_engine.utils.source_health import get_source_stats, reset_source
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/source_health", response_model=Dict[str, Dict[str, Any]])
+def get_news_source_health(
+    admin: bool = Depends(verify_admin),
+) -> Dict[str, Dict[str, Any]]:
+    """Per-source latency, error rate, yield and change cadence of the news sources."""
+    return get_source_stats()
+
+
+@router.delete("/source_health/{source}", response_model=Dict[str, str])
+def reset_news_source_health(
+    source: str, admin: bool = Depends(verify_admin)
+) -> Dict[str, str]:
+    """Clears a source's history so it is fetched again on the next run."""
+    if source not in get_source_stats([source]):
+        raise HTTPException(404, f"No health data for source '{source}'")
+    reset_source(source)
+    return {"detail": f"Health data for '{source}' cleared"}
+
+
+@router.get("/llm_cache", response_model=Dict[str, Any])
+def get_llm_response_cache_stats(
+    admin: bool = Depends(verify_admin),
+) -> Dict[str, Any]:
+    """Hit rate and size of the LLM response cache."""
+    return get_llm_cache_stats()
+
+
+@router.delete("/llm_cache", response_model=Dict[str, str])
+def clear_llm_response_cache(admin: bool = Depends(verify_admin)) -> Dict[str, str]:
+    """Drops all cached LLM responses."""
+    removed = clear_llm_cache()
+    return {"detail": f"Cleared {removed} cached LLM responses"}
+
+
+@router.get("/llm_usage", response_model=Dict[str, Any])
+def get_llm_usage(
+    days: int = Query(default=30, ge=1, le=365),
+    admin: bool = Depends(verify_admin),
+) -> Dict[str, Any]:
+    """LLM tokens, cost and latency of generation jobs, by post type and by day."""
+    return get_usage_summary(days)
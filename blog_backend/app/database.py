@@ -9,10 +9,11 @@ dotenv.load_dotenv()
 # Use environment variable or default to SQLite for development
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./blog.db")
 
-# PostgreSQL requires these settings
+# PostgreSQL requires these settings; DATABASE_SSLMODE=disable for a local server
+DATABASE_SSLMODE = os.getenv("DATABASE_SSLMODE", "require")
 connect_args = {}
 if DATABASE_URL.startswith("postgresql"):
-    connect_args = {"sslmode": "require"}
+    connect_args = {"sslmode": DATABASE_SSLMODE}
 
 engine = create_engine(DATABASE_URL, connect_args=connect_args, pool_pre_ping=True)
 
@@ -4,7 +4,13 @@ from contextlib import asynccontextmanager
 from .database import create_db_and_tables
 from .api.posts_api import router as posts_router
 from .api.newsletter_api import router as newsletter_router
+from .api.admin_api import router as admin_router
 from .auth import verify_admin
+from .utils.news_ingestion import (
+    NEWS_INGEST_INTERVAL_MINUTES,
+    run_news_ingestion_loop,
+)
+import asyncio
 import logging
 import os
 from fastapi.openapi.docs import get_swagger_ui_html
@@ -20,7 +26,14 @@ logging.basicConfig(
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     create_db_and_tables()
+    ingestion_task = None
+    if NEWS_INGEST_INTERVAL_MINUTES > 0:
+        ingestion_task = asyncio.create_task(
+            run_news_ingestion_loop(NEWS_INGEST_INTERVAL_MINUTES)
+        )
     yield
+    if ingestion_task:
+        ingestion_task.cancel()
 
 
 app = FastAPI(
@@ -33,6 +46,7 @@ app = FastAPI(
 
 app.include_router(posts_router)
 app.include_router(newsletter_router)
+app.include_router(admin_router)
 
 
 @app.get("/admin/docs", response_class=HTMLResponse)
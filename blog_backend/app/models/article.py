@@ -0,0 +1,38 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Text
+from datetime import datetime
+
+
+class Article(SQLModel, table=True):
+    """A news article seen by the background ingestion poller."""
+
+    id: int | None = Field(default=None, primary_key=True)
+    url_hash: str = Field(index=True, unique=True)  # sha256 of link
+    link: str
+    resolved_link: str | None = Field(default=None)
+    title: str
+    description: str | None = Field(default=None, sa_column=Column(Text))
+    source: str = Field(index=True)
+    published_at: datetime | None = Field(default=None, index=True)  # naive UTC
+    first_seen_at: datetime = Field(default_factory=datetime.utcnow)
+    last_seen_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    # pending / valid / invalid
+    validation_status: str = Field(default="pending", index=True)
+    validated_at: datetime | None = Field(default=None)
+    # pending / scraped / fallback (only the description was available)
+    scrape_status: str = Field(default="pending", index=True)
+    scraped_at: datetime | None = Field(default=None)
+    extraction_method: str | None = Field(default=None)
+    content: str | None = Field(default=None, sa_column=Column(Text))
+
+
+class IngestionPoll(SQLModel, table=True):
+    """One completed poll of the background ingestion poller."""
+
+    id: int | None = Field(default=None, primary_key=True)
+    finished_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    fetched: int = Field(default=0)
+    new: int = Field(default=0)
+    validated: int = Field(default=0)
+    scraped: int = Field(default=0)
+    elapsed_seconds: float = Field(default=0.0)
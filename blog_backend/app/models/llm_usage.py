@@ -0,0 +1,22 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, JSON
+from datetime import datetime
+
+
+class LLMUsageRun(SQLModel, table=True):
+    """LLM tokens, cost and latency of one generation job (see ai_content_engine/utils/llm_usage.py)."""
+
+    id: int | None = Field(default=None, primary_key=True)
+    # Post type the job generates: regular / curated / news / weekly_summary / ai101
+    job_type: str = Field(index=True)
+    started_at: datetime = Field(index=True)  # naive UTC
+    finished_at: datetime
+    posts_created: int = Field(default=0)
+    calls: int = Field(default=0)
+    cached_calls: int = Field(default=0)
+    input_tokens: int = Field(default=0)
+    output_tokens: int = Field(default=0)
+    cost_usd: float = Field(default=0.0)
+    latency_seconds: float = Field(default=0.0)
+    retries: int = Field(default=0)
+    by_model: dict | None = Field(default=None, sa_column=Column(JSON))
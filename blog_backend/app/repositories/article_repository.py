@@ -0,0 +1,210 @@
+"""Repository for the news article store filled by the ingestion poller."""
+
+from sqlmodel import Session, select, delete, func
+from ..database import engine
+from ..models.article import Article, IngestionPoll
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def hash_url(link: str) -> str:
+    return hashlib.sha256(link.encode("utf-8")).hexdigest()
+
+
+def _parse_published_date(value: Optional[str]) -> Optional[datetime]:
+    """Converts the pipeline's ISO date string (or "N/A") to naive UTC."""
+    if not value or value == "N/A":
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _to_article_dict(article: Article) -> Dict[str, Any]:
+    """Converts a stored row to the dict shape used by the news pipeline."""
+    published_date = (
+        article.published_at.replace(tzinfo=timezone.utc).isoformat()
+        if article.published_at
+        else "N/A"
+    )
+    result = {
+        "title": article.title,
+        "link": article.link,
+        "description": article.description or "N/A",
+        "published_date": published_date,
+        "source": article.source,
+    }
+    if article.resolved_link:
+        result["resolved_link"] = article.resolved_link
+    if article.scrape_status == "scraped" and article.content:
+        result["content"] = article.content
+        result["extraction_method"] = article.extraction_method
+    return result
+
+
+def upsert_articles(articles: List[Dict[str, Any]]) -> int:
+    """Adds unseen articles and refreshes last_seen_at on known ones. Returns the new count."""
+    by_hash = {hash_url(a["link"]): a for a in articles if a.get("link")}
+    if not by_hash:
+        return 0
+
+    now = datetime.utcnow()
+    with Session(engine) as session:
+        existing = session.exec(
+            select(Article).where(Article.url_hash.in_(list(by_hash)))
+        ).all()
+        for row in existing:
+            row.last_seen_at = now
+            session.add(row)
+
+        known = {row.url_hash for row in existing}
+        for url_hash, article in by_hash.items():
+            if url_hash in known:
+                continue
+            session.add(
+                Article(
+                    url_hash=url_hash,
+                    link=article["link"],
+                    title=article.get("title") or "N/A",
+                    description=article.get("description"),
+                    source=article.get("source") or "Unknown",
+                    published_at=_parse_published_date(article.get("published_date")),
+                    first_seen_at=now,
+                    last_seen_at=now,
+                )
+            )
+        session.commit()
+
+    new_count = len(by_hash) - len(known)
+    logger.info(f"Article store: {new_count} new, {len(known)} already known articles")
+    return new_count
+
+
+def get_articles_pending_validation(
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Articles that haven't been checked for accessibility yet, newest first."""
+    with Session(engine) as session:
+        statement = (
+            select(Article)
+            .where(Article.validation_status == "pending")
+            .order_by(Article.published_at.desc())
+        )
+        if limit:
+            statement = statement.limit(limit)
+        return [_to_article_dict(row) for row in session.exec(statement).all()]
+
+
+def save_validation_results(
+    checked: List[Dict[str, Any]], valid: List[Dict[str, Any]]
+) -> None:
+    """Marks checked articles valid (recording redirect targets) or invalid."""
+    valid_by_hash = {hash_url(a["link"]): a for a in valid}
+    now = datetime.utcnow()
+    with Session(engine) as session:
+        rows = session.exec(
+            select(Article).where(
+                Article.url_hash.in_([hash_url(a["link"]) for a in checked])
+            )
+        ).all()
+        for row in rows:
+            article = valid_by_hash.get(row.url_hash)
+            row.validation_status = "valid" if article else "invalid"
+            row.resolved_link = article.get("resolved_link") if article else None
+            row.validated_at = now
+            session.add(row)
+        session.commit()
+
+
+def get_articles_pending_scrape(limit: int) -> List[Dict[str, Any]]:
+    """Valid articles whose content hasn't been scraped yet, newest first."""
+    with Session(engine) as session:
+        statement = (
+            select(Article)
+            .where(Article.validation_status == "valid")
+            .where(Article.scrape_status == "pending")
+            .order_by(Article.published_at.desc())
+            .limit(limit)
+        )
+        return [_to_article_dict(row) for row in session.exec(statement).all()]
+
+
+def save_scrape_results(scraped: List[Dict[str, Any]]) -> None:
+    """Stores extracted content; description fallbacks are marked so they aren't reused."""
+    scraped_by_hash = {hash_url(a["link"]): a for a in scraped}
+    now = datetime.utcnow()
+    with Session(engine) as session:
+        rows = session.exec(
+            select(Article).where(Article.url_hash.in_(list(scraped_by_hash)))
+        ).all()
+        for row in rows:
+            article = scraped_by_hash[row.url_hash]
+            method = article.get("extraction_method")
+            if method == "description_fallback":
+                row.scrape_status = "fallback"
+            else:
+                row.scrape_status = "scraped"
+                row.content = article.get("content")
+            row.extraction_method = method
+            row.scraped_at = now
+            session.add(row)
+        session.commit()
+
+
+def get_candidate_articles(days_ago: int) -> List[Dict[str, Any]]:
+    """Validated articles published within the last days_ago days, newest first."""
+    since = datetime.utcnow() - timedelta(days=days_ago)
+    with Session(engine) as session:
+        statement = (
+            select(Article)
+            .where(Article.validation_status == "valid")
+            .where(Article.published_at >= since)
+            .order_by(Article.published_at.desc())
+        )
+        return [_to_article_dict(row) for row in session.exec(statement).all()]
+
+
+def record_ingest_poll(stats: Dict[str, Any]) -> None:
+    """Records a completed poll (stats as returned by ingest_news_once)."""
+    with Session(engine) as session:
+        session.add(
+            IngestionPoll(
+                fetched=stats["fetched"],
+                new=stats["new"],
+                validated=stats["validated"],
+                scraped=stats["scraped"],
+                elapsed_seconds=stats["elapsed"],
+            )
+        )
+        session.commit()
+
+
+def get_last_ingest_time() -> Optional[datetime]:
+    """When the poller last completed a poll (naive UTC), or None if it never has.
+
+    A poll that found nothing new still counts, so quiet sources don't make
+    the store look stale.
+    """
+    with Session(engine) as session:
+        return session.exec(select(func.max(IngestionPoll.finished_at))).one()
+
+
+def purge_old_articles(retention_days: int) -> int:
+    """Deletes articles last seen (and polls finished) more than retention_days ago.
+
+    Returns the number of articles removed.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    with Session(engine) as session:
+        result = session.execute(delete(Article).where(Article.last_seen_at < cutoff))
+        session.execute(delete(IngestionPoll).where(IngestionPoll.finished_at < cutoff))
+        session.commit()
+        return result.rowcount
@@ -0,0 +1,91 @@
+"""Repository for per-job LLM usage records."""
+
+from sqlmodel import Session, select
+from ..database import engine
+from ..models.llm_usage import LLMUsageRun
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+_TOTAL_FIELDS = (
+    "calls",
+    "cached_calls",
+    "input_tokens",
+    "output_tokens",
+    "cost_usd",
+    "latency_seconds",
+    "retries",
+    "posts_created",
+)
+
+
+def save_usage_run(
+    job_type: str,
+    started_at: datetime,
+    summary: Dict[str, Any],
+    posts_created: int = 0,
+) -> None:
+    """Stores one job's usage summary (as returned by UsageLedger.summary())."""
+    with Session(engine) as session:
+        session.add(
+            LLMUsageRun(
+                job_type=job_type,
+                started_at=started_at,
+                finished_at=datetime.utcnow(),
+                posts_created=posts_created,
+                calls=summary["calls"],
+                cached_calls=summary["cached_calls"],
+                input_tokens=summary["input_tokens"],
+                output_tokens=summary["output_tokens"],
+                cost_usd=summary["cost_usd"],
+                latency_seconds=summary["latency_seconds"],
+                retries=summary["retries"],
+                by_model=summary.get("by_model"),
+            )
+        )
+        session.commit()
+
+
+def _aggregate(runs: List[LLMUsageRun]) -> Dict[str, Any]:
+    totals = {name: sum(getattr(run, name) for run in runs) for name in _TOTAL_FIELDS}
+    totals["runs"] = len(runs)
+    totals["cost_usd"] = round(totals["cost_usd"], 6)
+    totals["latency_seconds"] = round(totals["latency_seconds"], 3)
+    totals["cost_per_post_usd"] = (
+        round(totals["cost_usd"] / totals["posts_created"], 6)
+        if totals["posts_created"]
+        else None
+    )
+    return totals
+
+
+def get_usage_summary(days: int = 30) -> Dict[str, Any]:
+    """Usage over the last `days` days, totalled per post type and per day and post type."""
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    with Session(engine) as session:
+        runs = session.exec(
+            select(LLMUsageRun)
+            .where(LLMUsageRun.started_at >= cutoff)
+            .order_by(LLMUsageRun.started_at)
+        ).all()
+
+    by_type: Dict[str, List[LLMUsageRun]] = {}
+    by_day: Dict[tuple, List[LLMUsageRun]] = {}
+    for run in runs:
+        by_type.setdefault(run.job_type, []).append(run)
+        day = run.started_at.date().isoformat()
+        by_day.setdefault((day, run.job_type), []).append(run)
+
+    return {
+        "days": days,
+        "total": _aggregate(runs),
+        "by_post_type": {
+            job_type: _aggregate(type_runs) for job_type, type_runs in by_type.items()
+        },
+        "by_day": [
+            {"date": day, "post_type": job_type, **_aggregate(day_runs)}
+            for (day, job_type), day_runs in by_day.items()
+        ],
+    }
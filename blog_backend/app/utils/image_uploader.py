@@ -4,22 +4,39 @@ import logging
 from supabase import create_client, Client
 from dotenv import load_dotenv
 import uuid
+import threading
 from ai_content_engine.utils.retry_decorator import exponential_backoff_retry
+from ai_content_engine.utils.providers import use_fake
 
 # Load environment variables from .env file
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-# Supabase client initialization
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_KEY")
+BUCKET_NAME = "images"
 
-if not supabase_url or not supabase_key:
-    raise RuntimeError("SUPABASE_URL and SUPABASE_KEY must be set in the environment.")
+_supabase: Client | None = None
+_supabase_lock = threading.Lock()
 
-supabase: Client = create_client(supabase_url, supabase_key)
-BUCKET_NAME = "images"
+
+def get_supabase() -> Client:
+    """Returns the Supabase client, creating it on first upload so the app imports without credentials."""
+    global _supabase
+    if _supabase is None:
+        with _supabase_lock:
+            if _supabase is None and use_fake("storage"):
+                from ai_content_engine.utils.fake_providers import FakeStorageClient
+
+                _supabase = FakeStorageClient()
+            if _supabase is None:
+                supabase_url = os.getenv("SUPABASE_URL")
+                supabase_key = os.getenv("SUPABASE_KEY")
+                if not supabase_url or not supabase_key:
+                    raise RuntimeError(
+                        "SUPABASE_URL and SUPABASE_KEY must be set in the environment."
+                    )
+                _supabase = create_client(supabase_url, supabase_key)
+    return _supabase
 
 
 @exponential_backoff_retry()
@@ -53,6 +70,7 @@ def upload_base64_image(base64_string: str, file_name: str = None) -> str:
         f"Uploading image to Supabase bucket '{BUCKET_NAME}' with path: {file_name}"
     )
 
+    supabase = get_supabase()
     supabase.storage.from_(BUCKET_NAME).upload(
         path=file_name,
         file=image_data,
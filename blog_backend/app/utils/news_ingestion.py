@@ -0,0 +1,121 @@
+"""Background news ingestion: keeps the article store fresh between news runs.
+
+Each poll fetches a short window from all sources (unchanged feeds answer 304),
+stores unseen articles, validates the pending ones and scrapes a batch of the
+newest validated ones. The daily news run can then read ready candidates from
+the store instead of fetching, validating and scraping a full window itself.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from ai_content_engine.utils.news_finder import (
+    deduplicate_articles,
+    fetch_all_articles,
+    filter_well_formed_articles,
+    scrape_article_content_async,
+    validate_articles,
+)
+from ..repositories.article_repository import (
+    get_articles_pending_scrape,
+    get_articles_pending_validation,
+    get_candidate_articles,
+    get_last_ingest_time,
+    purge_old_articles,
+    record_ingest_poll,
+    save_scrape_results,
+    save_validation_results,
+    upsert_articles,
+)
+
+logger = logging.getLogger(__name__)
+
+# Minutes between polls (0 disables the poller and the store is not used)
+NEWS_INGEST_INTERVAL_MINUTES = float(os.getenv("NEWS_INGEST_INTERVAL_MINUTES", "0"))
+# How far back each poll fetches; only needs to cover the gap between polls
+NEWS_INGEST_DAYS = int(os.getenv("NEWS_INGEST_DAYS", "2"))
+NEWS_INGEST_SCRAPE_BATCH = int(os.getenv("NEWS_INGEST_SCRAPE_BATCH", "20"))
+NEWS_STORE_RETENTION_DAYS = int(os.getenv("NEWS_STORE_RETENTION_DAYS", "30"))
+
+
+async def ingest_news_once() -> Dict[str, Any]:
+    """Runs one poll: fetch, store, validate pending, scrape a batch. Returns counts."""
+    start_time = time.time()
+
+    articles = await fetch_all_articles(NEWS_INGEST_DAYS)
+    articles = deduplicate_articles(filter_well_formed_articles(articles))
+    new_count = await asyncio.to_thread(upsert_articles, articles)
+
+    pending = await asyncio.to_thread(get_articles_pending_validation)
+    valid = await validate_articles(pending) if pending else []
+    if pending:
+        await asyncio.to_thread(save_validation_results, pending, valid)
+
+    to_scrape = await asyncio.to_thread(
+        get_articles_pending_scrape, NEWS_INGEST_SCRAPE_BATCH
+    )
+    scraped = await scrape_article_content_async(to_scrape) if to_scrape else []
+    if scraped:
+        await asyncio.to_thread(save_scrape_results, scraped)
+
+    purged = await asyncio.to_thread(purge_old_articles, NEWS_STORE_RETENTION_DAYS)
+
+    stats = {
+        "fetched": len(articles),
+        "new": new_count,
+        "validated": len(pending),
+        "valid": len(valid),
+        "scraped": len(scraped),
+        "purged": purged,
+        "elapsed": round(time.time() - start_time, 2),
+    }
+    await asyncio.to_thread(record_ingest_poll, stats)
+    logger.info(f"News ingestion poll finished: {stats}")
+    return stats
+
+
+async def run_news_ingestion_loop(interval_minutes: float) -> None:
+    """Polls forever every interval_minutes; a failed poll is logged and retried next time."""
+    logger.info(f"Starting news ingestion poller (every {interval_minutes:g} min)")
+    while True:
+        try:
+            await ingest_news_once()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"News ingestion poll failed: {str(e)}", exc_info=True)
+        await asyncio.sleep(interval_minutes * 60)
+
+
+def get_stored_news_candidates(days_ago: int) -> Optional[list[dict]]:
+    """Returns stored candidates for the news run, or None if the store can't be trusted.
+
+    The store is only used while the poller is enabled and has completed a
+    poll within the last two intervals; otherwise the news run falls back to a full fetch.
+    """
+    if NEWS_INGEST_INTERVAL_MINUTES <= 0:
+        return None
+
+    last_ingest = get_last_ingest_time()
+    max_age = timedelta(minutes=2 * NEWS_INGEST_INTERVAL_MINUTES)
+    if last_ingest is None or datetime.utcnow() - last_ingest > max_age:
+        logger.warning(
+            f"Article store is stale (last poll: {last_ingest}) - falling back to a full news fetch"
+        )
+        return None
+
+    candidates = get_candidate_articles(days_ago)
+    if not candidates:
+        logger.warning(
+            "Article store has no candidates - falling back to a full news fetch"
+        )
+        return None
+
+    logger.info(
+        f"Using {len(candidates)} stored news candidates from the article store"
+    )
+    return candidates
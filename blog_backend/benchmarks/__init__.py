@@ -0,0 +1 @@
+"""Benchmarks: the content pipelines offline (run.py) and the posts API under load (load_test.py)."""
@@ -0,0 +1,385 @@
+"""Load tests the read endpoints of the posts API and reports latency percentiles.
+
+Scenarios (run one after another, so their latencies don't mix):
+    posts   GET /posts: listing pages, mostly the first few, sometimes sorted
+            by published_date, filtered by status or by other post_types
+    slug    GET /posts/by-slug/{slug}: mostly recent posts, plus a few
+            unknown slugs (404s are expected for those)
+    news    GET /posts/news: news listing pages
+
+Each scenario sends --warmup unmeasured requests and then --requests
+measured ones from --concurrency concurrent clients. The requests are drawn
+from --seed, so two runs against the same dataset (see seed_posts.py) send
+exactly the same requests; compare them with --compare.
+
+Without --base-url, the API is started from this tree with uvicorn against
+--database-url and stopped afterwards. Slugs are read from --database-url in
+either case.
+
+Usage (from blog_backend/):
+    python -m benchmarks.seed_posts --posts 100000 --reset
+    python -m benchmarks.load_test --json before.json
+    python -m benchmarks.load_test --compare before.json
+    python -m benchmarks.load_test slug news --concurrency 32 --requests 5000
+    python -m benchmarks.load_test --base-url http://127.0.0.1:8000 --database-url postgresql://...
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiohttp
+
+from benchmarks.seed_posts import LOADTEST_DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+SCENARIOS = ("posts", "slug", "news")
+SERVER_STARTUP_TIMEOUT = 60
+REQUEST_TIMEOUT = 30
+PAGE_SIZE = 10
+# Pages are read like a blog is: mostly the first few, rarely deep
+MEAN_PAGE = 2.0
+RECENT_SLUGS = 1000
+RECENT_SLUG_SHARE = 0.7
+UNKNOWN_SLUG_SHARE = 0.02
+
+
+@dataclass
+class Request:
+    path: str
+    params: list[tuple[str, str]] = field(default_factory=list)
+    expected_status: int = 200
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Measurements of one scenario.
+
+    Args:
+        latencies: Seconds per measured request
+        errors: Requests that failed or got an unexpected status
+        response_bytes: Total size of the measured responses
+        elapsed: Wall time of the measured requests
+    """
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    response_bytes: int = 0
+    elapsed: float = 0.0
+
+    def report(self) -> dict:
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        quantiles = (
+            statistics.quantiles(latencies, n=100, method="inclusive")
+            if count > 1
+            else latencies * 99
+        )
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "throughput_rps": round(count / self.elapsed, 1) if self.elapsed else 0.0,
+            "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if count else 0.0,
+            "p50_ms": round(quantiles[49] * 1000, 2) if count else 0.0,
+            "p90_ms": round(quantiles[89] * 1000, 2) if count else 0.0,
+            "p95_ms": round(quantiles[94] * 1000, 2) if count else 0.0,
+            "p99_ms": round(quantiles[98] * 1000, 2) if count else 0.0,
+            "max_ms": round(latencies[-1] * 1000, 2) if count else 0.0,
+            "mean_kb": round(self.response_bytes / count / 1024, 1) if count else 0.0,
+        }
+
+
+def _page_offset(rng: random.Random, max_page: int) -> str:
+    page = min(int(rng.expovariate(1 / MEAN_PAGE)), max_page)
+    return str(page * PAGE_SIZE)
+
+
+def plan_requests(
+    scenario: str, count: int, rng: random.Random, dataset: dict
+) -> list[Request]:
+    """The requests a scenario sends, drawn from rng."""
+    plan = []
+    for _ in range(count):
+        if scenario == "posts":
+            max_page = dataset["listed_posts"] // PAGE_SIZE
+            params = [
+                ("offset", _page_offset(rng, max_page)),
+                ("limit", str(PAGE_SIZE)),
+            ]
+            if rng.random() < 0.2:
+                params.append(("sort_by", "published_date"))
+            if rng.random() < 0.3:
+                params.append(("status", "published"))
+            if rng.random() < 0.2:
+                params += [("post_types", "regular"), ("post_types", "curated")]
+            plan.append(Request("/posts", params))
+        elif scenario == "news":
+            max_page = dataset["counts"].get("news", 0) // PAGE_SIZE
+            params = [
+                ("offset", _page_offset(rng, max_page)),
+                ("limit", str(PAGE_SIZE)),
+            ]
+            plan.append(Request("/posts/news", params))
+        else:
+            slugs = dataset["slugs"]
+            roll = rng.random()
+            if roll < UNKNOWN_SLUG_SHARE or not slugs:
+                plan.append(
+                    Request(
+                        f"/posts/by-slug/missing-{rng.getrandbits(32):08x}", [], 404
+                    )
+                )
+            elif roll < UNKNOWN_SLUG_SHARE + RECENT_SLUG_SHARE:
+                plan.append(
+                    Request(f"/posts/by-slug/{rng.choice(slugs[-RECENT_SLUGS:])}")
+                )
+            else:
+                plan.append(Request(f"/posts/by-slug/{rng.choice(slugs)}"))
+    return plan
+
+
+def load_dataset(database_url: str) -> dict:
+    """Post counts per post_type and all slugs, oldest first."""
+    # app.database reads DATABASE_URL on import
+    os.environ["DATABASE_URL"] = database_url
+    from sqlmodel import Session, func, select
+
+    from app.database import engine
+    from app.models.post import Post
+
+    post_type = Post.ai_metadata["post_type"].as_string()
+    with Session(engine) as session:
+        counts = dict(
+            session.exec(select(post_type, func.count()).group_by(post_type)).all()
+        )
+        slugs = list(session.exec(select(Post.slug).order_by(Post.id)).all())
+    return {
+        "counts": counts,
+        "listed_posts": counts.get("regular", 0) + counts.get("weekly_summary", 0),
+        "slugs": slugs,
+    }
+
+
+async def _run_requests(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    plan: list[Request],
+    concurrency: int,
+    result: ScenarioResult | None,
+) -> None:
+    """Sends plan from concurrency clients; measures into result unless it's None."""
+    next_index = 0
+
+    async def client():
+        nonlocal next_index
+        while next_index < len(plan):
+            request = plan[next_index]
+            next_index += 1
+            start = time.perf_counter()
+            try:
+                async with session.get(
+                    base_url + request.path, params=request.params
+                ) as response:
+                    body = await response.read()
+                    ok = response.status == request.expected_status
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"LOAD_TEST: {request.path} failed | Error: {e}")
+                body, ok = b"", False
+            if result is None:
+                continue
+            result.latencies.append(time.perf_counter() - start)
+            result.response_bytes += len(body)
+            if not ok:
+                result.errors += 1
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+
+
+async def run_scenario(
+    base_url: str, plan: list[Request], warmup: int, concurrency: int
+) -> ScenarioResult:
+    result = ScenarioResult()
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        await _run_requests(session, base_url, plan[:warmup], concurrency, None)
+        start = time.perf_counter()
+        await _run_requests(session, base_url, plan[warmup:], concurrency, result)
+        result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _absolute_sqlite_url(database_url: str) -> str:
+    """The server runs in BACKEND_DIR, so a relative SQLite path must not move with it."""
+    prefix = "sqlite:///"
+    path = database_url[len(prefix) :]
+    if not database_url.startswith(prefix) or os.path.isabs(path) or path == ":memory:":
+        return database_url
+    return prefix + os.path.abspath(path)
+
+
+def start_server(database_url: str, workers: int) -> tuple[subprocess.Popen, str]:
+    """Starts the API from this tree on a free port and waits until it answers."""
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": _absolute_sqlite_url(database_url),
+        "NEWS_INGEST_INTERVAL_MINUTES": "0",
+    }
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "app.main:app",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+        "--no-access-log",
+    ]
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env)
+    base_url = f"http://127.0.0.1:{port}"
+
+    async def wait_until_up():
+        deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT
+        async with aiohttp.ClientSession() as session:
+            while time.monotonic() < deadline and process.poll() is None:
+                try:
+                    async with session.get(f"{base_url}/posts/healthcheck") as response:
+                        if response.status == 200:
+                            return True
+                except aiohttp.ClientError:
+                    pass
+                await asyncio.sleep(0.2)
+        return False
+
+    if not asyncio.run(wait_until_up()):
+        process.terminate()
+        raise RuntimeError("API server did not start")
+    return process, base_url
+
+
+def _print_comparison(name: str, report: dict, previous: dict | None) -> None:
+    print(f"\n{name}")
+    for metric in ("throughput_rps", "p50_ms", "p90_ms", "p95_ms", "p99_ms", "max_ms"):
+        value = report[metric]
+        line = f"  {metric:<16}{value:>12.2f}"
+        if previous and previous.get(metric):
+            change = (value - previous[metric]) / previous[metric]
+            line += f"{previous[metric]:>12.2f}{change:>+9.1%}"
+        print(line)
+    print(
+        f"  {report['requests']} requests, {report['errors']} errors, {report['mean_kb']} KB per response"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=f"Any of {', '.join(SCENARIOS)}")
+    parser.add_argument(
+        "--database-url",
+        default=LOADTEST_DATABASE_URL,
+        help=f"Database the API serves (default {LOADTEST_DATABASE_URL})",
+    )
+    parser.add_argument("--base-url", help="Test this running API instead")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--requests", type=int, default=2000, help="Per scenario")
+    parser.add_argument("--warmup", type=int, default=100, help="Per scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--compare", help="Results JSON of an earlier run")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    )
+    scenarios = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenarios {unknown}; choose from {SCENARIOS}")
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)["scenarios"]
+
+    dataset = load_dataset(args.database_url)
+    logger.info(
+        f"LOAD_TEST: {len(dataset['slugs'])} posts | by post_type: {dataset['counts']}"
+    )
+
+    process = None
+    base_url = args.base_url
+    if not base_url:
+        process, base_url = start_server(args.database_url, args.workers)
+    try:
+        reports = {}
+        for name in scenarios:
+            # Own generator per scenario, so running a subset plans the same requests
+            rng = random.Random(f"{args.seed}:{name}")
+            plan = plan_requests(name, args.warmup + args.requests, rng, dataset)
+            logger.info(f"LOAD_TEST: Running {name} ({args.requests} requests)")
+            result = asyncio.run(
+                run_scenario(base_url, plan, args.warmup, args.concurrency)
+            )
+            reports[name] = result.report()
+    finally:
+        if process:
+            process.terminate()
+            process.wait(timeout=30)
+
+    if previous:
+        print(f"\n  {'':<16}{'current':>12}{'previous':>12}{'change':>9}")
+    for name, report in reports.items():
+        _print_comparison(name, report, previous.get(name))
+
+    if args.json:
+        results = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "database": args.database_url.split(":", 1)[0],
+            "posts": len(dataset["slugs"]),
+            "post_types": dataset["counts"],
+            "config": {
+                "seed": args.seed,
+                "requests": args.requests,
+                "warmup": args.warmup,
+                "concurrency": args.concurrency,
+                "workers": None if args.base_url else args.workers,
+            },
+            "scenarios": reports,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        logger.info(f"LOAD_TEST: Wrote results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""The benchmarked pipelines, and the stages timed inside each.
+
+A stage is a module attribute (a pipeline step such as fetch_all_articles)
+that is wrapped with a timer for the run. Wrap the name where the pipeline
+looks it up: generator imports generate_outline, so the stage is
+ai_content_engine.generator.generate_outline. Stages may nest, and a stage
+called several times (or concurrently) reports the time summed over calls.
+"""
+
+import asyncio
+import functools
+import importlib
+import inspect
+import threading
+import time
+from dataclasses import dataclass, field
+
+# The paper used by the paper benchmarks (InstructGPT); any arXiv id works
+BENCHMARK_PAPER_ID = "2203.02155"
+
+NEWS_FINDER_STAGES = [
+    ("ai_content_engine.utils.news_finder", "fetch_all_articles", "fetch"),
+    ("ai_content_engine.utils.news_finder", "run_filter_stages", "filter"),
+    ("ai_content_engine.utils.news_finder", "filter_top_articles_llm", "curate"),
+    ("ai_content_engine.utils.news_finder", "scrape_article_content_async", "scrape"),
+]
+
+NEWS_POST_STAGES = [
+    ("ai_content_engine.generator", "get_top_articles", "top_articles"),
+    *NEWS_FINDER_STAGES,
+    ("ai_content_engine.generator", "process_articles_for_news", "summarize"),
+    ("app.ai_integration", "generate_featured_images_with_rate_limiting", "images"),
+    ("app.ai_integration", "upload_images_batch", "upload"),
+    ("app.ai_integration", "_submit_post", "submit"),
+]
+
+PAPER_STAGES = [
+    ("ai_content_engine.utils.process_paper", "download_arxiv_pdf", "download"),
+    ("ai_content_engine.utils.process_paper", "extract_text_from_pdf", "extract"),
+    ("ai_content_engine.generator", "condense_paper", "condense"),
+    ("ai_content_engine.generator", "generate_outline", "outline"),
+    ("ai_content_engine.generator", "generate_blog_post_from_outline", "write"),
+]
+
+
+@dataclass
+class Benchmark:
+    """
+    One benchmarked pipeline call.
+
+    Args:
+        name: Name used on the command line and in the baseline
+        target: "module:function" to call; coroutines are run with asyncio.run
+        stages: (module, attribute, stage name) of the steps to time
+        args: Positional arguments for target
+        kwargs: Keyword arguments for target
+        env: Extra environment for the run, e.g. fake content sizes
+        description: One line for --list
+    """
+
+    name: str
+    target: str
+    stages: list[tuple[str, str, str]]
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    env: dict[str, str] = field(default_factory=dict)
+    description: str = ""
+
+
+BENCHMARKS = {
+    benchmark.name: benchmark
+    for benchmark in [
+        Benchmark(
+            name="top_articles",
+            target="ai_content_engine.utils.news_finder:get_top_articles",
+            stages=NEWS_FINDER_STAGES,
+            kwargs={"days_ago": 7, "top_n": 12},
+            description="news_finder.get_top_articles: fetch, filter, curate, scrape",
+        ),
+        Benchmark(
+            name="news_posts",
+            target="app.ai_integration:process_news_headlines_to_posts",
+            stages=NEWS_POST_STAGES,
+            kwargs={"days_ago": 7, "top_n": 12},
+            description="process_news_headlines_to_posts: articles to published posts with images",
+        ),
+        Benchmark(
+            name="paper_post",
+            target="ai_content_engine.generator:generate_blog_post_content",
+            stages=PAPER_STAGES,
+            args=(BENCHMARK_PAPER_ID,),
+            description="generate_blog_post_content on a typical paper (~6k words)",
+        ),
+        Benchmark(
+            name="long_paper_post",
+            target="ai_content_engine.generator:generate_blog_post_content",
+            stages=PAPER_STAGES,
+            args=(BENCHMARK_PAPER_ID,),
+            # Well over PAPER_DIGEST_THRESHOLD_TOKENS, so the paper is condensed
+            env={"FAKE_PAPER_WORDS": "40000"},
+            description="generate_blog_post_content on a long paper (~40k words, condensed first)",
+        ),
+    ]
+}
+
+
+def resolve(target: str):
+    module_name, attribute = target.split(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class StageTimer:
+    """Wraps pipeline steps in place and sums the time spent in each."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict] = {}
+
+    def _add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            totals = self._stages.setdefault(stage, {"seconds": 0.0, "calls": 0})
+            totals["seconds"] += seconds
+            totals["calls"] += 1
+
+    def wrap(self, stage: str, func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def timed_async(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self._add(stage, time.perf_counter() - start)
+
+            return timed_async
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._add(stage, time.perf_counter() - start)
+
+        return timed
+
+    def install(self, stages: list[tuple[str, str, str]]) -> None:
+        for module_name, attribute, stage in stages:
+            module = importlib.import_module(module_name)
+            setattr(module, attribute, self.wrap(stage, getattr(module, attribute)))
+            # Stages that never ran still show up, with zero calls
+            self._stages.setdefault(stage, {"seconds": 0.0, "calls": 0})
+
+    def report(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                stage: {
+                    "seconds": round(totals["seconds"], 3),
+                    "calls": totals["calls"],
+                }
+                for stage, totals in self._stages.items()
+            }
+
+
+def run_target(benchmark: Benchmark):
+    result = resolve(benchmark.target)(*benchmark.args, **benchmark.kwargs)
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    return result
@@ -0,0 +1,389 @@
+"""Benchmarks the content pipelines offline and compares them with a baseline.
+
+Each run happens in a fresh subprocess with empty caches, a temporary SQLite
+database behind a local copy of the blog API, and every external service
+replaced by the fakes in ai_content_engine/utils/fake_providers.py.
+Responses recorded in the fixtures directory (RSS XML, article pages, PDFs,
+LLM and search responses) are replayed; anything not recorded is generated.
+Neither the fixtures nor the baseline are checked in, since both depend on
+the live services and the machine: record the fixtures once with --record,
+then save a baseline with --save-baseline. A comparison run refuses to start
+without them (--generated benchmarks against generated responses only).
+Every service answers after its simulated latency (FAKE_PROVIDER_LATENCY_MS,
+FAKE_PROVIDER_ERROR_RATE etc. pass through from the environment), and LLM
+calls are paced by BENCHMARK_RATE_LIMITS (a paid-tier deployment) unless
+LLM_RATE_LIMITS is set.
+
+A run reports wall time, time per stage (see pipelines.py), peak RSS and call
+counts per service; repeated runs are reduced to their medians. With a
+baseline, the run fails (exit status 1) when the total or a stage is slower
+than the baseline by more than --threshold, or peak RSS grew by more than
+that.
+
+Usage (from blog_backend/):
+    python -m benchmarks.run --list
+    python -m benchmarks.run                        # all benchmarks vs benchmarks/baseline.json
+    python -m benchmarks.run paper_post --repeat 5
+    python -m benchmarks.run --save-baseline        # make this run the new baseline
+    python -m benchmarks.run --record               # record fixtures from the live services (API keys needed)
+    python -m benchmarks.run --generated --save-baseline  # no fixtures: generated responses only
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.pipelines import BENCHMARKS, StageTimer, run_target
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+DEFAULT_FIXTURES = BENCHMARKS_DIR / "fixtures"
+RESULT_PREFIX = "BENCHMARK_RESULT "
+
+# Paid-tier quotas; without a budget for the image model, image batches
+# would fall back to pausing a minute between batches
+BENCHMARK_RATE_LIMITS = (
+    "gemini-2.0-flash=2000:4000000,gemini-2.0-flash-lite=4000:4000000,"
+    "gemini-2.5-flash=1000:1000000,gemini-2.5-pro=150:2000000,"
+    "gemini-2.0-flash-preview-image-generation=1000:1000000"
+)
+# Differences below these are noise, whatever the percentage
+MIN_REGRESSION_SECONDS = 0.05
+MIN_REGRESSION_MB = 5.0
+API_STARTUP_TIMEOUT = 30
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _configure_environment(
+    benchmark, workdir: str, fixtures: str, record: bool, port: int
+):
+    """Points every store at workdir and every service at its fake; must run before the pipelines are imported."""
+    os.environ.update(
+        {
+            "PAPERS_DIR": os.path.join(workdir, "papers"),
+            "CACHE_DIR": os.path.join(workdir, "cache"),
+            "FAKE_STORAGE_DIR": os.path.join(workdir, "storage"),
+            "DATABASE_URL": f"sqlite:///{os.path.join(workdir, 'blog.db')}",
+            "API_KEY": "benchmark",
+            "BLOG_API_BASE_URL": f"http://127.0.0.1:{port}",
+            "NEWS_INGEST_INTERVAL_MINUTES": "0",
+            # Recording needs the live services; images still go to fake storage
+            "FAKE_PROVIDERS": "storage" if record else "all",
+        }
+    )
+    if record:
+        os.environ["RECORD_FIXTURES_DIR"] = fixtures
+    else:
+        os.environ.pop("RECORD_FIXTURES_DIR", None)
+        os.environ["FAKE_PROVIDER_FIXTURES"] = fixtures
+        os.environ.setdefault("NEWSAPI_KEY", "benchmark")
+    os.environ.setdefault("LLM_RATE_LIMITS", BENCHMARK_RATE_LIMITS)
+    os.environ.update(benchmark.env)
+
+
+def _start_api_server(port: int):
+    import uvicorn
+
+    from app.main import app
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + API_STARTUP_TIMEOUT
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError("Local blog API did not start")
+        time.sleep(0.05)
+    return server, thread
+
+
+def _count_posts(port: int) -> int:
+    import requests
+
+    response = requests.get(f"http://127.0.0.1:{port}/posts?limit=1000", timeout=10)
+    response.raise_for_status()
+    return len(response.json())
+
+
+def _describe_output(result) -> str:
+    if isinstance(result, tuple) and result and isinstance(result[0], str):
+        return f"{len(result[0])} chars"
+    if isinstance(result, list):
+        return f"{len(result)} items"
+    return repr(result)
+
+
+def run_worker(name: str, workdir: str, fixtures: str, record: bool) -> dict:
+    """One measured run of a benchmark, in this (fresh) process."""
+    benchmark = BENCHMARKS[name]
+    port = _free_port()
+    _configure_environment(benchmark, workdir, fixtures, record, port)
+
+    server, thread = _start_api_server(port)
+    from ai_content_engine.utils.fake_providers import (
+        get_call_counts,
+        reset_fake_providers,
+    )
+    from ai_content_engine.utils.llm_usage import track_llm_usage
+    from ai_content_engine.utils.providers import get_fixture_stats
+
+    timer = StageTimer()
+    timer.install(benchmark.stages)
+    reset_fake_providers()
+    startup_rss = _peak_rss_mb()
+
+    start = time.perf_counter()
+    with track_llm_usage() as usage:
+        result = run_target(benchmark)
+    wall_seconds = time.perf_counter() - start
+
+    posts = _count_posts(port)
+    server.should_exit = True
+    thread.join(timeout=10)
+
+    llm = usage.summary()
+    return {
+        "wall_seconds": round(wall_seconds, 3),
+        "stages": timer.report(),
+        "peak_rss_mb": _peak_rss_mb(),
+        "startup_rss_mb": startup_rss,
+        "calls": {
+            **get_call_counts(),
+            "llm_requests": llm["calls"],
+            "llm_retries": llm["retries"],
+            "llm_errors": llm["failed_calls"],
+        },
+        "llm_tokens": {"input": llm["input_tokens"], "output": llm["output_tokens"]},
+        "fixtures_replayed": get_fixture_stats(),
+        "posts_created": posts,
+        "output": _describe_output(result),
+    }
+
+
+def _run_once(name: str, fixtures: str, record: bool, verbose: bool) -> dict:
+    with tempfile.TemporaryDirectory(prefix=f"benchmark_{name}_") as workdir:
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks.run",
+            "--worker",
+            name,
+            "--workdir",
+            workdir,
+            "--fixtures",
+            fixtures,
+        ]
+        if record:
+            command.append("--record")
+        if verbose:
+            command.append("--verbose")
+        process = subprocess.run(
+            command,
+            cwd=BACKEND_DIR,
+            stdout=subprocess.PIPE,
+            stderr=None if verbose else subprocess.PIPE,
+            text=True,
+        )
+    for line in process.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX) :])
+    tail = "\n".join((process.stderr or "").splitlines()[-20:])
+    raise RuntimeError(f"Benchmark {name} failed (exit {process.returncode})\n{tail}")
+
+
+def _median(values: list):
+    """Median of the runs' values, recursing into dicts; non-numbers come from the first run."""
+    first = values[0]
+    if isinstance(first, dict):
+        keys = dict.fromkeys(key for value in values for key in value)
+        return {
+            key: _median([value[key] for value in values if key in value])
+            for key in keys
+        }
+    if isinstance(first, bool) or not isinstance(first, (int, float)):
+        return first
+    if isinstance(first, int):
+        # Counts stay whole numbers
+        return statistics.median_low(values)
+    return round(statistics.median(values), 3)
+
+
+def _metrics(result: dict) -> list[tuple[str, float, str]]:
+    """(label, value, unit) of every metric compared against the baseline."""
+    metrics = [("total", result["wall_seconds"], "s")]
+    metrics += [
+        (f"stage {stage}", totals["seconds"], "s")
+        for stage, totals in result["stages"].items()
+    ]
+    metrics.append(("peak RSS", result["peak_rss_mb"], "MB"))
+    return metrics
+
+
+def compare(
+    name: str, current: dict, baseline: dict | None, threshold: float
+) -> list[str]:
+    """Prints current against baseline and returns the regressions."""
+    regressions = []
+    print(f"\n{name} ({current['runs']} runs) | output: {current['output']}")
+    print(f"  {'':<24}{'baseline':>12}{'current':>12}{'change':>10}")
+    baseline_metrics = (
+        {label: value for label, value, _ in _metrics(baseline)} if baseline else {}
+    )
+    for label, value, unit in _metrics(current):
+        base = baseline_metrics.get(label)
+        if base is None:
+            print(f"  {label:<24}{'-':>12}{value:>11.3f}{unit}{'':>10}")
+            continue
+        change = (value - base) / base if base else 0.0
+        min_delta = MIN_REGRESSION_MB if unit == "MB" else MIN_REGRESSION_SECONDS
+        regressed = change > threshold and value - base > min_delta
+        flag = "  REGRESSED" if regressed else ""
+        print(
+            f"  {label:<24}{base:>11.3f}{unit}{value:>11.3f}{unit}{change:>+9.1%}{flag}"
+        )
+        if regressed:
+            regressions.append(f"{name}: {label} {base:.3f}{unit} -> {value:.3f}{unit}")
+
+    base_calls = baseline.get("calls", {}) if baseline else {}
+    calls = ", ".join(
+        f"{kind} {count}"
+        + (f" ({count - base_calls[kind]:+d})" if kind in base_calls else "")
+        for kind, count in sorted(current["calls"].items())
+    )
+    print(f"  calls: {calls}")
+    if current.get("fixtures_replayed"):
+        print(f"  fixtures replayed: {current['fixtures_replayed']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("benchmarks", nargs="*", help="Benchmarks to run (default all)")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark")
+    parser.add_argument(
+        "--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Write the results as the baseline"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed slowdown (0.2 = 20%%)"
+    )
+    parser.add_argument(
+        "--fixtures", default=str(DEFAULT_FIXTURES), help="Fixtures dir"
+    )
+    parser.add_argument(
+        "--record", action="store_true", help="Record fixtures from the live services"
+    )
+    parser.add_argument(
+        "--generated",
+        action="store_true",
+        help="Run without recorded fixtures, on generated responses only",
+    )
+    parser.add_argument("--json", help="Also write the results to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline logs")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        logging.basicConfig(
+            level=logging.INFO if args.verbose else logging.ERROR,
+            format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+        )
+        result = run_worker(args.worker, args.workdir, args.fixtures, args.record)
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+        return
+
+    if args.list:
+        for benchmark in BENCHMARKS.values():
+            print(f"{benchmark.name:<18}{benchmark.description}")
+        return
+
+    names = args.benchmarks or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmarks {unknown}; see --list")
+
+    if args.record:
+        for name in names:
+            print(f"Recording fixtures for {name} into {args.fixtures}...")
+            _run_once(name, args.fixtures, record=True, verbose=args.verbose)
+        return
+
+    fixtures = Path(args.fixtures)
+    has_fixtures = fixtures.is_dir() and any(fixtures.iterdir())
+    if not has_fixtures and not args.generated:
+        parser.error(
+            f"No fixtures in {fixtures}; record them with --record (API keys "
+            "needed) or pass --generated to use generated responses only"
+        )
+
+    baseline = {}
+    if not args.save_baseline:
+        if not os.path.exists(args.baseline):
+            parser.error(
+                f"No baseline at {args.baseline}; save one with --save-baseline"
+            )
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["benchmarks"]
+
+    results, regressions = {}, []
+    for name in names:
+        runs = [
+            _run_once(name, args.fixtures, record=False, verbose=args.verbose)
+            for _ in range(args.repeat)
+        ]
+        results[name] = {**_median(runs), "runs": len(runs)}
+        regressions += compare(name, results[name], baseline.get(name), args.threshold)
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": results,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved baseline to {args.baseline}")
+
+    if regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()